@@ -12,6 +12,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from app.config import settings
 from app.dependencies.db import Base
 from app.models import db_user
+from app.models import db_refresh_token
 
 # Alembic Config
 config = context.config
@@ -0,0 +1,34 @@
+"""add users.updated_at
+
+Revision ID: 5c1e7d9a4b20
+Revises: 230b491bf966
+Create Date: 2026-10-18 11:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7d9a4b20'
+down_revision: Union[str, Sequence[str], None] = '230b491bf966'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Batch mode: SQLite cannot ADD COLUMN with a non-constant default, so the table is rebuilt there.
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False)
+        )
+    op.execute('UPDATE users SET updated_at = created_at')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('updated_at')
@@ -0,0 +1,78 @@
+"""
+Admin routes (v1).
+
+Endpoints restricted to administrators (`ADMIN_EMAILS`).
+"""
+
+from __future__ import annotations
+
+import tempfile
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.dependencies.auth import get_admin_user
+from app.dependencies.db import get_db
+from app.service.bulk_import_service import BulkImportService, get_import_hasher
+from app.shemas.user_shema import UserImportReport
+
+router = APIRouter(tags=["Admin"], dependencies=[Depends(get_admin_user)])
+
+#: Request bodies up to this size are buffered in memory, larger ones on disk.
+_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+
+@router.post(
+    "/admin/users/import",
+    response_model=UserImportReport,
+    summary="Importación masiva de usuarios",
+    description=(
+        "Importa usuarios desde un cuerpo NDJSON (un objeto por línea) o CSV (con encabezado). "
+        "Cada fila incluye `email`, `password` o `hashed_password` (bcrypt) y opcionalmente "
+        "`full_name`. Los emails repetidos o ya registrados se omiten; la respuesta incluye "
+        "el detalle de errores por línea."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_users(
+    request: Request,
+    input_format: Literal["ndjson", "csv"] | None = Query(
+        default=None,
+        alias="format",
+        description="Formato del cuerpo; por defecto se deduce del Content-Type.",
+    ),
+    db: Session = Depends(get_db),
+) -> UserImportReport:
+    """
+    Import users from the request body.
+
+    The body is spooled (memory, then disk) while it streams in, and the
+    import itself runs in the threadpool.
+
+    Args:
+        request: Incoming request (body read as a stream).
+        input_format: "ndjson" or "csv" (defaults from Content-Type).
+        db: Request-scoped SQLAlchemy session.
+
+    Returns:
+        UserImportReport: Import counters and per-row errors.
+    """
+    fmt = input_format or ("csv" if "csv" in request.headers.get("content-type", "") else "ndjson")
+
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY) as body:
+        async for chunk in request.stream():
+            body.write(chunk)
+        body.seek(0)
+
+        service = BulkImportService(db, get_import_hasher())
+        return await run_in_threadpool(service.import_file, body, fmt)
@@ -1,20 +1,25 @@
 """
 Authentication routes (v1).
 
-This module provides authentication endpoints. Currently, `/login` is a demo
-endpoint that issues a JWT token without validating credentials.
+This module provides authentication endpoints: `/login` validates credentials
+and issues a JWT access token plus a rotating refresh token, `/token/refresh`
+renews access without the password, and `/logout` revokes a refresh token.
 """
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 
-from app.dependencies.db import get_db
+from app.config import settings
+from app.dependencies.services import get_refresh_token_service, user_service_for
+from app.exceptions import NotFoundException
+from app.rate_limit import client_ip, get_login_rate_limiter
+from app.service.async_user_service import AsyncUserService
 from app.service.auth_service import AuthService
+from app.service.refresh_token_service import RefreshTokenService
 from app.service.user_service import UserService
-from app.shemas.user_shema import TokenResponse, UserCreate, UserResponse
+from app.shemas.user_shema import RefreshTokenRequest, TokenResponse, UserCreate, UserResponse
 
 router = APIRouter(tags=["Auth"])
 auth_service = AuthService()
@@ -26,12 +31,16 @@ auth_service = AuthService()
     summary="Iniciar sesión",
     description=(
         "Valida credenciales contra la base de datos usando bcrypt y retorna un JWT. "
-        "Compatible con Swagger OAuth2 Password flow (Authorize)."
+        "Compatible con Swagger OAuth2 Password flow (Authorize). "
+        "Limitado por IP y por cuenta: al exceder el límite responde 429 con `Retry-After`. "
+        "Incluye un `refresh_token` para renovar el acceso sin reenviar la contraseña."
     ),
 )
-def login(
+async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    service: UserService | AsyncUserService = Depends(user_service_for("login")),
+    refresh_service: RefreshTokenService = Depends(get_refresh_token_service),
 ) -> TokenResponse:
     """
     Authenticate user credentials and return a JWT token.
@@ -39,14 +48,30 @@ def login(
     Notes:
         - Swagger UI uses OAuth2 Password flow: sends `username` and `password`.
         - We interpret `username` as the user's email.
+        - bcrypt runs on the dedicated hashing pool; a saturated pool yields 503.
+        - Attempts are rate limited per client IP and per account before any
+          bcrypt work (429 + `Retry-After`); a successful login clears the
+          account counter.
+        - With `REFRESH_TOKENS_ENABLED`, the response also carries a refresh
+          token that starts a new token family.
     """
-    user = UserService(db).authenticate_user(
+    limiter = get_login_rate_limiter()
+    if limiter is not None:
+        await limiter.check(client_ip(request), form_data.username)
+
+    user = await service.authenticate_user_async(
         email=form_data.username,
         password=form_data.password,
     )
 
+    if limiter is not None:
+        await limiter.reset_account(form_data.username)
+
     token = auth_service.create_access_token({"sub": str(user.id)})
-    return TokenResponse(access_token=token, token_type="bearer")
+    refresh_token = None
+    if settings.REFRESH_TOKENS_ENABLED:
+        refresh_token = await refresh_service.issue_async(user.id)
+    return TokenResponse(access_token=token, token_type="bearer", refresh_token=refresh_token)
 
 
 @router.post(
@@ -55,19 +80,83 @@ def login(
     summary="Registrar usuario",
     description="Crea un usuario en base de datos, hasheando la contraseña con bcrypt.",
 )
-def register(payload: UserCreate, db: Session = Depends(get_db)) -> UserResponse:
+async def register(
+    payload: UserCreate,
+    service: UserService | AsyncUserService = Depends(user_service_for("register")),
+) -> UserResponse:
     """
     Register a new user in the database.
 
     Args:
         payload: User registration payload.
-        db: Request-scoped SQLAlchemy session.
+        service: Request-scoped user service.
 
     Returns:
         UserResponse: Created user (public fields only).
     """
-    return UserService(db).register_user(
+    return await service.register_user_async(
         email=payload.email,
         password=payload.password,
         full_name=payload.full_name,
     )
+
+
+def _require_refresh_tokens() -> None:
+    if not settings.REFRESH_TOKENS_ENABLED:
+        raise NotFoundException("Refresh tokens deshabilitados")
+
+
+@router.post(
+    "/token/refresh",
+    response_model=TokenResponse,
+    summary="Renovar token de acceso",
+    description=(
+        "Intercambia un refresh token por un nuevo JWT de acceso y un nuevo refresh token "
+        "(el anterior queda invalidado). No usa bcrypt: verifica una firma HMAC y actualiza "
+        "una fila por clave primaria. Reutilizar un refresh token ya rotado revoca la sesión."
+    ),
+    dependencies=[Depends(_require_refresh_tokens)],
+)
+async def refresh_token(
+    payload: RefreshTokenRequest,
+    refresh_service: RefreshTokenService = Depends(get_refresh_token_service),
+) -> TokenResponse:
+    """
+    Rotate a refresh token and issue a new access token.
+
+    Args:
+        payload: Refresh token issued by `/login` or a previous refresh.
+        refresh_service: Request-scoped refresh-token service.
+
+    Raises:
+        UnauthorizedException: If the refresh token is invalid, expired,
+            revoked or already used.
+
+    Returns:
+        TokenResponse: New access token and the next refresh token.
+    """
+    user_id, next_refresh_token = await refresh_service.rotate_async(payload.refresh_token)
+    token = auth_service.create_access_token({"sub": str(user_id)})
+    return TokenResponse(access_token=token, token_type="bearer", refresh_token=next_refresh_token)
+
+
+@router.post(
+    "/logout",
+    status_code=204,
+    summary="Cerrar sesión",
+    description="Revoca el refresh token y todos los rotados desde el mismo login.",
+    dependencies=[Depends(_require_refresh_tokens)],
+)
+async def logout(
+    payload: RefreshTokenRequest,
+    refresh_service: RefreshTokenService = Depends(get_refresh_token_service),
+) -> Response:
+    """
+    Revoke a refresh-token family (idempotent).
+
+    Notes:
+        - Access tokens already issued stay valid until they expire
+          (`JWT_EXPIRE_MINUTES`).
+    """
+    await refresh_service.revoke_async(payload.refresh_token)
+    return Response(status_code=204)
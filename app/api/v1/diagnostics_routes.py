@@ -0,0 +1,37 @@
+"""
+Diagnostics routes (v1).
+
+Operational introspection endpoints (connection pool state). Like the debug
+routes, they are not included in production environments.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.db_pool import engines, pool_metrics, pool_status
+
+router = APIRouter(tags=["Diagnostics"])
+
+
+@router.get(
+    "/diagnostics/db-pool",
+    summary="Estado del pool de conexiones",
+    description=(
+        "Retorna, por engine (sync/async), la clase de pool, su ocupación actual "
+        "y las métricas de checkout (latencia promedio y timeouts)."
+    ),
+)
+def db_pool_diagnostics() -> dict[str, Any]:
+    """
+    Report pool occupancy and checkout metrics for every registered engine.
+
+    Returns:
+        dict[str, Any]: `{label: {"pool_class": ..., "size": ..., "checkouts": ...}}`.
+    """
+    return {
+        label: {**pool_status(engine), **pool_metrics(label)}
+        for label, engine in engines().items()
+    }
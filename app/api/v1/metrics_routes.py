@@ -0,0 +1,34 @@
+"""
+Metrics routes.
+
+Exposes the in-process metrics registry in the Prometheus text format.
+Mounted at the application root (`GET /metrics`), as scrapers expect.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+
+router = APIRouter(tags=["Diagnostics"])
+
+
+@router.get(
+    "/metrics",
+    summary="Métricas Prometheus",
+    description=(
+        "Retorna las métricas del proceso (latencia por ruta, consultas a la base de datos, "
+        "pool de conexiones, hashing, caché) en formato de texto Prometheus."
+    ),
+    response_class=Response,
+)
+def metrics() -> Response:
+    """
+    Render all registered metrics.
+
+    Returns:
+        Response: Prometheus text exposition (version 0.0.4).
+    """
+    return Response(content=render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,41 @@
+"""
+Readiness routes (v1).
+
+`/readyz` reports whether the service can take traffic (database, hashing pool,
+shared cache). Checks run on a background task (see `app.readiness`); the
+endpoint only returns the cached result, so frequent probes never reach the
+database.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.readiness import get_readiness_probe
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get(
+    "/readyz",
+    summary="Readiness check",
+    description=(
+        "Retorna el último resultado de las verificaciones de dependencias (base de datos, "
+        "pool de hashing, caché), calculado en segundo plano cada `READINESS_INTERVAL_SECONDS`. "
+        "Responde 503 si una dependencia crítica falla o si aún no hay resultado."
+    ),
+)
+async def readiness_check() -> JSONResponse:
+    """
+    Return the cached readiness snapshot.
+
+    Returns:
+        JSONResponse: 200 when ready ("ok" or "degraded"), 503 otherwise.
+
+    Notes:
+        - Declared `async` so probes are answered on the event loop without
+          taking a threadpool slot.
+    """
+    status_code, body = get_readiness_probe().snapshot()
+    return JSONResponse(body, status_code=status_code, headers={"Cache-Control": "no-store"})
@@ -2,35 +2,144 @@
 Users API routes (v1).
 
 Defines user-related endpoints and delegates business logic to the Service layer.
-Uses dependency injection to obtain a request-scoped SQLAlchemy session.
+Uses dependency injection to obtain a request-scoped user service (sync or async
+database stack, see `DB_ASYNC_ROUTES`).
 """
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from typing import Literal
+from urllib.parse import urlencode
 
-from app.dependencies.db import get_db
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from app.cache.shared import get_cache
+from app.cache.users import users_list_generation
+from app.config import settings
+from app.dependencies.services import user_service_for
+from app.http_cache import cache_headers, conditional_response, weak_etag
+from app.pagination import decode_cursor, encode_cursor
+from app.serialization import rows_to_json, rows_to_ndjson, rows_to_ndjson_async
+from app.service.async_user_service import AsyncUserService
 from app.service.user_service import UserService
 from app.shemas.user_shema import UserResponse
 
 router = APIRouter(tags=["Users"])
 
 
+def _pack_page(next_id: int | None, body: bytes) -> bytes:
+    # Cached page format: "<next id or empty>\n<JSON body>".
+    return f"{'' if next_id is None else next_id}\n".encode("ascii") + body
+
+
+def _unpack_page(packed: bytes) -> tuple[int | None, bytes]:
+    header, _, body = packed.partition(b"\n")
+    return (int(header) if header else None), body
+
+
+def _pagination_headers(request: Request, next_id: int | None, page_size: int) -> dict[str, str]:
+    if next_id is None:
+        return {}
+    next_cursor = encode_cursor(next_id)
+    query = urlencode({**request.query_params, "after": next_cursor, "limit": page_size})
+    return {
+        "X-Next-Cursor": next_cursor,
+        "Link": f'<{request.url.path}?{query}>; rel="next"',
+    }
+
+
 @router.get(
     "/users",
     response_model=list[UserResponse],
     summary="Listar usuarios",
-    description="Retorna una lista de usuarios desde la base de datos.",
+    description=(
+        "Retorna una página de usuarios ordenada por ID (paginación por cursor). "
+        "Si hay más resultados, el cursor de la siguiente página se envía en el header "
+        "`X-Next-Cursor` (y en `Link: rel=\"next\"`). Con `format=ndjson` se transmiten "
+        "todos los usuarios restantes como NDJSON con memoria constante. "
+        "Las páginas incluyen `ETag`: con `If-None-Match` vigente responde 304 sin cuerpo."
+    ),
 )
-def get_users(db: Session = Depends(get_db)) -> list[UserResponse]:
+async def get_users(
+    request: Request,
+    limit: int | None = Query(
+        default=None,
+        ge=1,
+        le=settings.USERS_PAGE_MAX_LIMIT,
+        description="Tamaño de página (por defecto USERS_PAGE_DEFAULT_LIMIT; sin límite en NDJSON).",
+    ),
+    after: str | None = Query(default=None, description="Cursor opaco de la página anterior."),
+    output: Literal["json", "ndjson"] = Query(default="json", alias="format"),
+    service: UserService | AsyncUserService = Depends(user_service_for("users")),
+):
     """
-    List users from the database.
+    List users from the database using keyset pagination.
 
     Args:
-        db: Request-scoped SQLAlchemy session.
+        request: Incoming request (used to build the `Link` header).
+        limit: Page size.
+        after: Opaque cursor returned by the previous page.
+        output: "json" (paged list) or "ndjson" (streamed).
+        service: Request-scoped user service.
 
     Returns:
-        list[UserResponse]: Users serialized using the response schema.
+        Response: One page of users (JSON array), or an NDJSON stream.
+
+    Notes:
+        - Only public columns are selected and rows are serialized straight to
+          JSON bytes, skipping ORM entity construction and per-item Pydantic
+          validation. `response_model` still documents the contract in OpenAPI.
+        - JSON pages are cached in the shared cache for
+          `CACHE_USERS_LIST_TTL_SECONDS` (single-flight on misses).
+        - Pages carry a weak ETag derived from their `(id, updated_at)` pairs;
+          a matching `If-None-Match` gets 304 before the page is loaded or
+          serialized (`HTTP_CACHE_ENABLED`, `HTTP_CACHE_USERS_CONTROL`).
     """
-    return UserService(db).list_users()
+    after_id = decode_cursor(after)
+
+    if output == "ndjson" and limit is None:
+        rows = service.iter_user_rows(after_id)
+        body = rows_to_ndjson_async(rows) if hasattr(rows, "__aiter__") else rows_to_ndjson(rows)
+        return StreamingResponse(body, media_type="application/x-ndjson")
+
+    page_size = limit or settings.USERS_PAGE_DEFAULT_LIMIT
+
+    http_cache_headers: dict[str, str] = {}
+    etag = ""
+    if settings.HTTP_CACHE_ENABLED:
+        versions = await service.list_user_versions_page_async(page_size, after_id)
+        etag = weak_etag("users", output, after_id or 0, page_size, rows=versions)
+        not_modified = conditional_response(request, "users", etag, settings.HTTP_CACHE_USERS_CONTROL)
+        if not_modified is not None:
+            return not_modified
+        http_cache_headers = cache_headers(etag, settings.HTTP_CACHE_USERS_CONTROL)
+
+    if output == "ndjson":
+        rows = await service.list_user_rows_page_async(page_size, after_id)
+        next_id = rows[-1].id if len(rows) == page_size else None
+        return StreamingResponse(
+            rows_to_ndjson(rows),
+            media_type="application/x-ndjson",
+            headers={**_pagination_headers(request, next_id, page_size), **http_cache_headers},
+        )
+
+    async def load_page() -> bytes:
+        rows = await service.list_user_rows_page_async(page_size, after_id)
+        next_id = rows[-1].id if len(rows) == page_size else None
+        return _pack_page(next_id, rows_to_json(rows))
+
+    ttl = settings.CACHE_USERS_LIST_TTL_SECONDS
+    if ttl > 0:
+        # With ETags on, the ETag is part of the key: a cached body always matches its ETag.
+        key = f"users:list:{await users_list_generation()}:{after_id or 0}:{page_size}:{etag}"
+        packed = await get_cache().get_or_set(key, load_page, ttl=ttl)
+    else:
+        packed = await load_page()
+
+    next_id, body = _unpack_page(packed)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={**_pagination_headers(request, next_id, page_size), **http_cache_headers},
+    )
@@ -6,9 +6,11 @@ Endpoints under this router require a valid JWT token.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
-from app.dependencies.auth import get_current_user
+from app.config import settings
+from app.dependencies.auth import get_authenticated_user
+from app.http_cache import cache_headers, conditional_response, weak_etag
 from app.models.db_user import DBUser
 from app.shemas.user_shema import UserResponse
 
@@ -19,16 +21,37 @@ router = APIRouter(tags=["Secure"])
     "/secure",
     response_model=UserResponse,
     summary="Recurso protegido",
-    description="Retorna el usuario autenticado validando el JWT contra la base de datos.",
+    description=(
+        "Retorna el usuario autenticado validando el JWT contra la base de datos. "
+        "Incluye `ETag`: con `If-None-Match` vigente responde 304 sin cuerpo."
+    ),
 )
-def protected_route(user: DBUser = Depends(get_current_user)) -> UserResponse:
+def protected_route(
+    request: Request,
+    response: Response,
+    user: DBUser = Depends(get_authenticated_user),
+) -> UserResponse:
     """
     Return the authenticated user.
 
     Args:
+        request: Incoming request (for `If-None-Match`).
+        response: Response whose caching headers are set.
         user: Authenticated user loaded from the database.
 
     Returns:
-        UserResponse: Public user data.
+        UserResponse: Public user data (or a 304 when the client's copy is current).
+
+    Notes:
+        - The ETag is derived from the user's ID and `updated_at`, so it
+          changes only when the public profile does.
     """
+    if settings.HTTP_CACHE_ENABLED:
+        etag = weak_etag("user", user.id, user.updated_at)
+        control = settings.HTTP_CACHE_SECURE_CONTROL
+        not_modified = conditional_response(request, "secure", etag, control, vary="Authorization")
+        if not_modified is not None:
+            return not_modified
+        response.headers.update(cache_headers(etag, control))
+        response.headers["Vary"] = "Authorization"
     return user
@@ -0,0 +1,396 @@
+"""
+Shared cache backends.
+
+All backends implement the same async byte-oriented API (`get`, `mget`, `set`,
+`delete`, `ping`, `close`) with per-key TTLs, plus an atomic `incr` for
+counters (read back by `get` as decimal bytes):
+
+- `MemoryCacheBackend`: process-local (bounded LRU), no setup required.
+- `SQLiteCacheBackend`: a SQLite file shared by every worker process on the
+  same host (WAL mode, operations run in a worker thread).
+- `RedisCacheBackend`: shared across hosts. Speaks the Redis protocol (RESP)
+  directly over asyncio streams, so no client library is required.
+
+Notes:
+    - Backend failures raise `CacheError`; callers (see `app.cache.shared`)
+      treat them as cache misses so a cache outage never fails a request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Sequence
+from urllib.parse import unquote, urlparse
+
+from app.cache.lru import MISSING, TTLCache
+
+
+class CacheError(Exception):
+    """Raised when a cache backend operation fails."""
+
+
+class CacheBackend(ABC):
+    """Async key/value cache with per-key TTL (seconds)."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the value for `key`, or None if missing/expired."""
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Return values for `keys` (None for missing entries)."""
+        return [await self.get(key) for key in keys]
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store `value` under `key`, expiring after `ttl` seconds (None = no expiry)."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove `key`, if present."""
+
+    async def incr(self, key: str, ttl: float | None = None) -> int:
+        """
+        Increment the counter under `key` and return its new value.
+
+        A new counter starts at 1 and expires after `ttl` seconds; an existing
+        one keeps its expiry. This default is not atomic; backends override it.
+        """
+        value = int(await self.get(key) or 0) + 1
+        await self.set(key, str(value).encode(), ttl)
+        return value
+
+    async def ping(self) -> bool:
+        """Return True if the backend is reachable."""
+        return True
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Process-local backend built on `TTLCache`.
+
+    Args:
+        maxsize: Max number of entries kept (LRU eviction).
+    """
+
+    def __init__(self, maxsize: int = 10_000, name: str = "shared-memory") -> None:
+        self._cache = TTLCache(name, maxsize=maxsize, ttl=float("inf"))
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._cache.get(key)
+        if value is MISSING:
+            return None
+        return str(value).encode() if isinstance(value, int) else value
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        self._cache.set(key, value, ttl=float("inf") if ttl is None else ttl)
+
+    async def delete(self, key: str) -> None:
+        self._cache.invalidate(key)
+
+    async def incr(self, key: str, ttl: float | None = None) -> int:
+        return self._cache.incr(key, ttl=float("inf") if ttl is None else ttl)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Host-wide backend stored in a SQLite file.
+
+    Args:
+        path: Database file path (shared by all worker processes).
+        purge_every: Purge expired rows once every N writes.
+    """
+
+    def __init__(self, path: str = "./cache.db", purge_every: int = 1000) -> None:
+        self.path = path
+        self.purge_every = purge_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _run(self, sql: str, params: Sequence[Any] = ()) -> list[tuple]:
+        try:
+            with self._lock:
+                return self._connection().execute(sql, params).fetchall()
+        except sqlite3.Error as exc:
+            raise CacheError(str(exc)) from exc
+
+    def _mget_sync(self, keys: Sequence[str]) -> list[bytes | None]:
+        placeholders = ",".join("?" * len(keys))
+        rows = self._run(
+            f"SELECT key, value FROM cache WHERE key IN ({placeholders}) "
+            "AND (expires_at IS NULL OR expires_at > ?)",
+            (*keys, time.time()),
+        )
+        found = dict(rows)
+        # Counters written by `incr` are stored as INTEGER.
+        return [
+            str(value).encode() if isinstance(value, int) else value
+            for value in (found.get(key) for key in keys)
+        ]
+
+    def _set_sync(self, key: str, value: bytes, ttl: float | None) -> None:
+        expires_at = None if ttl is None else time.time() + ttl
+        self._run(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, expires_at),
+        )
+        self._count_write()
+
+    def _count_write(self) -> None:
+        self._writes += 1
+        if self._writes % self.purge_every == 0:
+            self._run("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+    def _incr_sync(self, key: str, ttl: float | None) -> int:
+        now = time.time()
+        rows = self._run(
+            "INSERT INTO cache (key, value, expires_at) VALUES (?, 1, ?) "
+            "ON CONFLICT(key) DO UPDATE SET "
+            "value = CASE WHEN expires_at <= ? THEN 1 ELSE CAST(value AS INTEGER) + 1 END, "
+            "expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at ELSE expires_at END "
+            "RETURNING value",
+            (key, None if ttl is None else now + ttl, now, now),
+        )
+        self._count_write()
+        return int(rows[0][0])
+
+    async def get(self, key: str) -> bytes | None:
+        return (await asyncio.to_thread(self._mget_sync, [key]))[0]
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await asyncio.to_thread(self._mget_sync, list(keys))
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        await asyncio.to_thread(self._set_sync, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._run, "DELETE FROM cache WHERE key = ?", (key,))
+
+    async def incr(self, key: str, ttl: float | None = None) -> int:
+        return await asyncio.to_thread(self._incr_sync, key, ttl)
+
+    async def ping(self) -> bool:
+        await asyncio.to_thread(self._run, "SELECT 1")
+        return True
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class _RespConnection:
+    """Single Redis protocol (RESP2) connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @staticmethod
+    def _encode(args: Sequence[Any]) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    async def _read_reply(self) -> Any:
+        line = await self.reader.readline()
+        if not line:
+            raise CacheError("Connection closed by server")
+
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            raise CacheError(payload.decode("utf-8"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise CacheError(f"Unexpected reply: {line!r}")
+
+    async def command(self, *args: Any) -> Any:
+        self.writer.write(self._encode(args))
+        await self.writer.drain()
+        return await self._read_reply()
+
+    def close(self) -> None:
+        self.writer.close()
+
+    async def aclose(self) -> None:
+        """Close and wait until the transport is released."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (OSError, asyncio.CancelledError):
+            pass
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis backend using a minimal built-in RESP client.
+
+    Args:
+        url: `redis://[:password@]host[:port][/db]`.
+        max_idle: Max idle connections kept for reuse.
+        timeout: Connect/command timeout in seconds.
+
+    Notes:
+        Connections belong to the event loop that opened them. Idle ones are
+        kept only for the backend's home loop (the first loop to use it, or
+        the next one once it is closed); a command run on any other loop
+        (e.g. `asyncio.run` in a CLI) uses a one-off connection that is
+        closed afterwards, so it never disturbs the pool.
+    """
+
+    def __init__(self, url: str, max_idle: int = 10, timeout: float = 1.0) -> None:
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"Unsupported cache URL: {url}")
+
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._idle: list[_RespConnection] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Guards `_idle` / `_loop`: commands may run on loops in other threads.
+        self._lock = threading.Lock()
+
+    async def _acquire(self) -> _RespConnection:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                # The old loop's transports died with it; nothing to close.
+                self._idle = []
+                self._loop = loop
+            if loop is self._loop and self._idle:
+                return self._idle.pop()
+
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        conn = _RespConnection(reader, writer)
+        if self.password:
+            await conn.command("AUTH", self.password)
+        if self.db:
+            await conn.command("SELECT", self.db)
+        return conn
+
+    async def _command(self, *args: Any) -> Any:
+        try:
+            conn = await asyncio.wait_for(self._acquire(), self.timeout)
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise CacheError(f"Redis unavailable: {exc}") from exc
+
+        try:
+            reply = await asyncio.wait_for(conn.command(*args), self.timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, CacheError) as exc:
+            conn.close()
+            if isinstance(exc, CacheError):
+                raise
+            raise CacheError(f"Redis command failed: {exc}") from exc
+
+        await self._release(conn)
+        return reply
+
+    async def _release(self, conn: _RespConnection) -> None:
+        with self._lock:
+            if asyncio.get_running_loop() is self._loop and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        await conn.aclose()
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._command("GET", key)
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await self._command("MGET", *keys)
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        if ttl is None:
+            await self._command("SET", key, value)
+        else:
+            await self._command("SET", key, value, "PX", max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str) -> None:
+        await self._command("DEL", key)
+
+    async def incr(self, key: str, ttl: float | None = None) -> int:
+        value = int(await self._command("INCR", key))
+        if value == 1 and ttl is not None:
+            await self._command("PEXPIRE", key, max(int(ttl * 1000), 1))
+        return value
+
+    async def ping(self) -> bool:
+        return await self._command("PING") == "PONG"
+
+    async def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+            home, self._loop = self._loop, None
+        if home is asyncio.get_running_loop():
+            for conn in idle:
+                await conn.aclose()
+        elif home is not None and not home.is_closed():
+            for conn in idle:
+                home.call_soon_threadsafe(conn.close)
+
+
+def create_backend(kind: str, url: str = "", memory_maxsize: int = 10_000) -> CacheBackend:
+    """
+    Build a cache backend.
+
+    Args:
+        kind: "memory", "sqlite" or "redis".
+        url: SQLite file path or Redis URL (ignored for memory).
+        memory_maxsize: Max entries for the memory backend.
+
+    Raises:
+        ValueError: If `kind` is unknown.
+
+    Returns:
+        CacheBackend: Configured backend.
+    """
+    if kind == "memory":
+        return MemoryCacheBackend(maxsize=memory_maxsize)
+    if kind == "sqlite":
+        return SQLiteCacheBackend(url or "./cache.db")
+    if kind == "redis":
+        return RedisCacheBackend(url or "redis://127.0.0.1:6379/0")
+    raise ValueError(f"Unsupported cache backend: {kind}")
@@ -0,0 +1,70 @@
+"""
+Bloom filter (probabilistic set membership).
+
+A Bloom filter answers "definitely not present" or "probably present" using
+a fixed bit array: `size` bits and `hashes` bit positions per item, derived
+from one blake2b digest by double hashing. It never gives false negatives;
+false positives happen at a rate that depends on how full the array is.
+
+Sizing (for `capacity` items and a target false-positive rate `p`):
+
+    size   = -capacity * ln(p) / ln(2)^2
+    hashes = size / capacity * ln(2)
+
+e.g. one million items at 1% take ~1.2 MB with 7 hashes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter of strings.
+
+    Args:
+        capacity: Expected number of items.
+        fp_rate: Target false-positive rate once `capacity` items are added.
+
+    Notes:
+        - Not thread-safe for concurrent `add` calls (bit updates are
+          read-modify-write); lookups may run concurrently with an `add`.
+    """
+
+    __slots__ = ("capacity", "size", "hashes", "count", "_bits")
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01) -> None:
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1")
+        self.capacity = max(capacity, 1)
+        self.size = max(64, math.ceil(-self.capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        """Add `item` to the set."""
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def fill_ratio(self) -> float:
+        """Fraction of bits set."""
+        return int.from_bytes(self._bits, "little").bit_count() / self.size
+
+    def estimated_fp_rate(self) -> float:
+        """Current false-positive probability, estimated from the fill ratio."""
+        return self.fill_ratio() ** self.hashes
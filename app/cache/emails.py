@@ -0,0 +1,320 @@
+"""
+Registered-email filter.
+
+Login attempts for emails that were never registered are answered without
+touching the database: a Bloom filter of `users.email` says "definitely not
+registered" for them, so credential-stuffing floods of unknown emails cost no
+queries. (The caller still runs a dummy password verify, so responses take
+the same time whether or not the email exists.)
+
+Lifecycle:
+    - Built from the `users.email` index in the background at startup and
+      rebuilt every `AUTH_EMAIL_FILTER_REBUILD_SECONDS` (which also resizes it
+      as the table grows and drops deleted emails).
+    - Between rebuilds, every `AUTH_EMAIL_FILTER_SYNC_SECONDS` a sync adds the
+      users whose id is above the filter's high-water mark (one primary-key
+      range query, normally empty). This catches up with inserts made by
+      other processes: `python -m app.cli.import_users`, migrations, SQL.
+    - This process's own repositories call `remember_emails()` after every
+      insert, so users registered through it can log in immediately. Inserts
+      that happen while a rebuild is scanning the table are replayed into the
+      new filter.
+    - Until the first build finishes every email is reported as "maybe
+      registered" (the database decides).
+
+Notes:
+    - "Absent" is only as fresh as the last build or sync: a user inserted by
+      another process is refused ("Credenciales inválidas") for up to
+      `AUTH_EMAIL_FILTER_SYNC_SECONDS` (until the next rebuild when syncing is
+      off). Rows written with an explicit id below the high-water mark and
+      emails changed by UPDATE are only picked up by the next rebuild.
+    - The filter is per process. With several workers, a user registered on
+      one worker would be refused by the others until their next sync, so
+      it is only for single-process deployments: `python -m app.server`
+      disables it (with an error log) when it starts more than one worker.
+      Do not enable it under other multi-process runners (`uvicorn --workers`).
+
+Metrics:
+    - `email_filter_checks_total{result}`: "absent" answers skip the DB.
+    - `email_filter_false_positives_total`: "maybe" answers the DB refuted
+      (observed FP rate = false positives / checks of unknown emails).
+    - `email_filter_synced_total`: emails added by syncs (inserts made
+      outside this process).
+    - `email_filter_estimated_fp_rate`, `email_filter_items`,
+      `email_filter_rebuilds_total{result}`, `email_filter_rebuild_seconds`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Callable, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.cache.bloom import BloomFilter
+from app.config import settings
+from app.dependencies.db import SessionLocal
+from app.metrics import registry
+from app.models.db_user import DBUser
+
+log = logging.getLogger(__name__)
+
+#: Smallest filter built, so a new deployment has room to grow before the next rebuild.
+_MIN_CAPACITY = 1024
+
+_checks = registry.counter(
+    "email_filter_checks_total", "Registered-email filter lookups.", labelnames=("result",)
+)
+_false_positives = registry.counter(
+    "email_filter_false_positives_total", "Filter hits for emails that are not registered."
+)
+_rebuilds = registry.counter(
+    "email_filter_rebuilds_total", "Registered-email filter rebuilds.", labelnames=("result",)
+)
+_rebuild_seconds = registry.histogram(
+    "email_filter_rebuild_seconds", "Time to rebuild the registered-email filter."
+)
+_synced = registry.counter(
+    "email_filter_synced_total", "Emails added to the filter by incremental syncs."
+)
+_items = registry.gauge("email_filter_items", "Emails added to the registered-email filter.")
+_estimated_fp_rate = registry.gauge(
+    "email_filter_estimated_fp_rate", "Estimated false-positive rate of the registered-email filter."
+)
+
+
+class EmailFilter:
+    """
+    Bloom filter of registered emails, rebuilt periodically from the database.
+
+    Args:
+        fp_rate: Target false-positive rate.
+        interval: Seconds between background rebuilds (<= 0 = build once).
+        session_factory: Creates the session used by background rebuilds.
+        sync_interval: Seconds between background syncs of new rows
+            (<= 0 = only rebuilds).
+    """
+
+    def __init__(
+        self,
+        fp_rate: float,
+        interval: float,
+        session_factory: Callable[[], Session] = SessionLocal,
+        sync_interval: float = 0.0,
+    ) -> None:
+        self.fp_rate = fp_rate
+        self.interval = interval
+        self.sync_interval = sync_interval
+        self._session_factory = session_factory
+        self._bloom: BloomFilter | None = None
+        # Highest users.id known to be in the filter (rows above it are synced).
+        self._high_water = 0
+        self._pending: list[str] | None = None
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def ready(self) -> bool:
+        """True once the first build has finished."""
+        return self._bloom is not None
+
+    def might_exist(self, email: str) -> bool:
+        """
+        Return False only if `email` was not registered as of the last build or sync.
+
+        Returns:
+            bool: True when the email may be registered (or the filter is not built yet).
+        """
+        bloom = self._bloom
+        if bloom is None:
+            return True
+        present = email in bloom
+        _checks.inc(result="present" if present else "absent")
+        return present
+
+    def record_miss(self) -> None:
+        """Record that an email the filter let through is not registered."""
+        if self.ready:
+            _false_positives.inc()
+
+    def add(self, email: str) -> None:
+        """Add a newly registered email."""
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(email)
+            if self._pending is not None:
+                self._pending.append(email)
+
+    def _snapshot(self, db: Session) -> tuple[BloomFilter, int]:
+        # High-water mark first: rows inserted during the scan are above it
+        # and get (re)added by the next sync.
+        high_water = db.scalar(select(func.max(DBUser.id))) or 0
+        return self._build(db), high_water
+
+    def _build(self, db: Session) -> BloomFilter:
+        total = db.scalar(select(func.count()).select_from(DBUser)) or 0
+        bloom = BloomFilter(max(total * 2, _MIN_CAPACITY), self.fp_rate)
+        stmt = select(DBUser.email).execution_options(yield_per=settings.USERS_STREAM_BATCH_SIZE)
+        for email in db.scalars(stmt):
+            bloom.add(email)
+        return bloom
+
+    def rebuild(self, db: Session | None = None) -> None:
+        """
+        Rebuild the filter from the `users` table (blocking; run it off the event loop).
+
+        Args:
+            db: Session to read from (default: a new session from `session_factory`).
+        """
+        started = time.perf_counter()
+        with self._lock:
+            self._pending = []
+        try:
+            if db is None:
+                with self._session_factory() as session:
+                    bloom, high_water = self._snapshot(session)
+            else:
+                bloom, high_water = self._snapshot(db)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            _rebuilds.inc(result="error")
+            raise
+
+        with self._lock:
+            for email in self._pending or ():
+                bloom.add(email)
+            self._bloom, self._pending = bloom, None
+            self._high_water = high_water
+
+        elapsed = time.perf_counter() - started
+        _rebuilds.inc(result="ok")
+        _rebuild_seconds.observe(elapsed)
+        _collect_filter_gauges()
+        log.info(
+            "Email filter rebuilt: items=%s bits=%s hashes=%s in %.0f ms",
+            bloom.count,
+            bloom.size,
+            bloom.hashes,
+            elapsed * 1000,
+        )
+
+    def sync(self, db: Session | None = None) -> int:
+        """
+        Add the users inserted above the high-water mark (blocking; run it off the event loop).
+
+        Catches up with inserts made by other processes; a no-op until the
+        first build.
+
+        Args:
+            db: Session to read from (default: a new session from `session_factory`).
+
+        Returns:
+            int: Emails added.
+        """
+        if self._bloom is None:
+            return 0
+        stmt = select(DBUser.id, DBUser.email).where(DBUser.id > self._high_water)
+        if db is None:
+            with self._session_factory() as session:
+                rows = session.execute(stmt).all()
+        else:
+            rows = db.execute(stmt).all()
+        if not rows:
+            return 0
+
+        with self._lock:
+            # A rebuild may have swapped the filter meanwhile: re-adding emails is harmless.
+            for _, email in rows:
+                self._bloom.add(email)
+            self._high_water = max(self._high_water, max(user_id for user_id, _ in rows))
+        _synced.inc(len(rows))
+        return len(rows)
+
+    async def _loop(self) -> None:
+        next_rebuild = time.monotonic()
+        while True:
+            if time.monotonic() >= next_rebuild:
+                try:
+                    await asyncio.to_thread(self.rebuild)
+                except Exception:  # noqa: BLE001 - keep serving with the previous filter
+                    log.exception("Email filter rebuild failed")
+                next_rebuild = time.monotonic() + self.interval if self.interval > 0 else math.inf
+            else:
+                try:
+                    await asyncio.to_thread(self.sync)
+                except Exception:  # noqa: BLE001 - retried on the next tick
+                    log.exception("Email filter sync failed")
+
+            if self.sync_interval > 0:
+                delay = min(self.sync_interval, next_rebuild - time.monotonic())
+            elif self.interval > 0:
+                delay = next_rebuild - time.monotonic()
+            else:
+                return
+            await asyncio.sleep(max(delay, 0.0))
+
+    def start(self) -> None:
+        """Start the background rebuild task (first build happens immediately)."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._loop(), name="email-filter")
+
+    async def stop(self) -> None:
+        """Cancel the background rebuild task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+_email_filter: EmailFilter | None = None
+
+
+def get_email_filter() -> EmailFilter | None:
+    """
+    Return the process-wide email filter configured from settings.
+
+    Returns:
+        EmailFilter | None: Filter, or None when `AUTH_EMAIL_FILTER_ENABLED` is off.
+    """
+    global _email_filter
+    if not settings.AUTH_EMAIL_FILTER_ENABLED:
+        return None
+    if _email_filter is None:
+        _email_filter = EmailFilter(
+            fp_rate=settings.AUTH_EMAIL_FILTER_FP_RATE,
+            interval=settings.AUTH_EMAIL_FILTER_REBUILD_SECONDS,
+            sync_interval=settings.AUTH_EMAIL_FILTER_SYNC_SECONDS,
+        )
+    return _email_filter
+
+
+def set_email_filter(email_filter: EmailFilter | None) -> None:
+    """Replace the process-wide email filter (tests)."""
+    global _email_filter
+    _email_filter = email_filter
+
+
+def remember_emails(emails: Iterable[str]) -> None:
+    """Add newly registered emails to the filter (no-op when disabled)."""
+    email_filter = get_email_filter()
+    if email_filter is not None:
+        for email in emails:
+            email_filter.add(email)
+
+
+def _collect_filter_gauges() -> None:
+    bloom = _email_filter._bloom if _email_filter is not None else None
+    _items.set(bloom.count if bloom is not None else 0)
+    _estimated_fp_rate.set(bloom.estimated_fp_rate() if bloom is not None else 0.0)
+
+
+registry.register_collector(_collect_filter_gauges)
@@ -0,0 +1,155 @@
+"""
+Bounded in-process LRU cache with per-entry TTL.
+
+Used for hot, rarely-changing lookups (e.g. the authenticated user loaded on
+every protected request). Entries are evicted least-recently-used once
+`maxsize` is reached and treated as missing once their TTL has elapsed.
+
+Hit/miss/eviction/expiration counters are published to `app.metrics` with a
+`cache` label, and are also available via `stats()`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from app.metrics import registry
+
+_hits = registry.counter("cache_hits_total", "In-process cache hits.", labelnames=("cache",))
+_misses = registry.counter("cache_misses_total", "In-process cache misses.", labelnames=("cache",))
+_evictions = registry.counter(
+    "cache_evictions_total", "Entries evicted to respect maxsize.", labelnames=("cache",)
+)
+_expirations = registry.counter(
+    "cache_expirations_total", "Entries dropped because their TTL elapsed.", labelnames=("cache",)
+)
+_invalidations = registry.counter(
+    "cache_invalidations_total", "Entries removed explicitly.", labelnames=("cache",)
+)
+
+#: Sentinel returned by `get()` on a miss (cached values may legitimately be None).
+MISSING: Any = object()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with TTL.
+
+    Args:
+        name: Cache name used as the metrics label.
+        maxsize: Max number of entries kept.
+        ttl: Default time-to-live in seconds.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Return the cached value for `key`, or `MISSING`.
+
+        A hit marks the entry as most recently used.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                _misses.inc(cache=self.name)
+                return MISSING
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                _expirations.inc(cache=self.name)
+                _misses.inc(cache=self.name)
+                return MISSING
+
+            self._data.move_to_end(key)
+            _hits.inc(cache=self.name)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store `value` under `key`.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Entry TTL in seconds (defaults to the cache TTL).
+        """
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._store(key, expires_at, value)
+
+    def incr(self, key: Hashable, amount: int = 1, ttl: float | None = None) -> int:
+        """
+        Atomically add `amount` to the counter under `key` and return the new value.
+
+        A missing or expired counter starts from zero and expires after `ttl`
+        (defaults to the cache TTL); an existing counter keeps its expiry.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                expires_at, value = now + (self.ttl if ttl is None else ttl), 0
+            else:
+                expires_at, value = entry
+            value += amount
+            self._store(key, expires_at, value)
+        return value
+
+    def _store(self, key: Hashable, expires_at: float, value: Any) -> None:
+        # Caller holds the lock.
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            _evictions.inc(cache=self.name)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove `key` from the cache, if present."""
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                _invalidations.inc(cache=self.name)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, float]:
+        """
+        Return counters and current size for monitoring.
+
+        Returns:
+            dict[str, float]: hits, misses, evictions, expirations, invalidations, size.
+        """
+        return {
+            "hits": _hits.value(cache=self.name),
+            "misses": _misses.value(cache=self.name),
+            "evictions": _evictions.value(cache=self.name),
+            "expirations": _expirations.value(cache=self.name),
+            "invalidations": _invalidations.value(cache=self.name),
+            "size": len(self._data),
+        }
@@ -0,0 +1,201 @@
+"""
+Revoked refresh-token families (in-process index) and periodic compaction.
+
+Refreshing a token checks this index first: a revoked family is rejected
+with a set lookup, without touching the database. The database stays the
+source of truth (rotation is a compare-and-swap that also checks
+`revoked_at`); since revocation is permanent, the index can only be behind,
+never wrong, so it is safe per process.
+
+Compaction (every `REFRESH_TOKEN_COMPACTION_SECONDS`):
+    - deletes expired families from the database (their tokens are dead
+      anyway), keeping the table proportional to live sessions;
+    - reloads the revoked, unexpired families, which also picks up
+      revocations made by other workers;
+    - drops expired entries from the index, so it never grows past the
+      number of revoked live families.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.dependencies.db import SessionLocal
+from app.metrics import registry
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+log = logging.getLogger(__name__)
+
+_index_size = registry.gauge(
+    "refresh_revocation_index_entries", "Revoked refresh-token families held in memory."
+)
+_compactions = registry.counter(
+    "refresh_token_compactions_total", "Refresh-token compaction runs.", labelnames=("result",)
+)
+_compacted_rows = registry.counter(
+    "refresh_token_compacted_rows_total", "Expired refresh-token families deleted."
+)
+
+
+class RevocationIndex:
+    """
+    Set of revoked family IDs, each kept until its tokens expire.
+
+    Thread-safe: written from request threads and the compaction thread.
+    """
+
+    def __init__(self) -> None:
+        self._expires: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, family_id: str) -> bool:
+        return family_id in self._expires
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def add(self, family_id: str, expires_at: datetime) -> None:
+        """Mark a family as revoked until `expires_at`."""
+        with self._lock:
+            self._expires[family_id] = _epoch(expires_at)
+
+    def update(self, entries: Iterable[tuple[str, datetime]]) -> None:
+        """Add many `(family_id, expires_at)` pairs."""
+        with self._lock:
+            for family_id, expires_at in entries:
+                self._expires[family_id] = _epoch(expires_at)
+
+    def compact(self, now: float | None = None) -> int:
+        """
+        Drop entries whose tokens have expired.
+
+        Returns:
+            int: Entries removed.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [family_id for family_id, expires in self._expires.items() if expires <= now]
+            for family_id in expired:
+                del self._expires[family_id]
+        return len(expired)
+
+
+def _epoch(value: datetime) -> float:
+    # SQLite returns naive datetimes; every stored value is UTC.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+#: Process-wide index of revoked families.
+revoked_families = RevocationIndex()
+
+
+class RevocationCompactor:
+    """
+    Periodic compaction of the refresh-token store.
+
+    Args:
+        interval: Seconds between runs (<= 0 = no background runs).
+        session_factory: Creates the session used by background runs.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self.interval = interval
+        self._session_factory = session_factory
+        self._task: asyncio.Task | None = None
+
+    def run_once(self, db: Session | None = None) -> int:
+        """
+        Compact the database table and the in-memory index (blocking).
+
+        Args:
+            db: Session to use (default: a new session from `session_factory`).
+
+        Returns:
+            int: Expired families deleted from the database.
+        """
+        if db is None:
+            with self._session_factory() as session:
+                return self.run_once(session)
+
+        now = datetime.now(timezone.utc)
+        repo = RefreshTokenRepository(db)
+        try:
+            deleted = repo.delete_expired(now)
+            revoked_families.update(repo.list_revoked(now))
+        except Exception:
+            _compactions.inc(result="error")
+            raise
+        removed = revoked_families.compact(now.timestamp())
+
+        _compactions.inc(result="ok")
+        _compacted_rows.inc(deleted)
+        _collect_index_size()
+        log.debug(
+            "Refresh tokens compacted: deleted=%s index=%s index_removed=%s",
+            deleted,
+            len(revoked_families),
+            removed,
+        )
+        return deleted
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception:  # noqa: BLE001 - retried on the next run
+                log.exception("Refresh token compaction failed")
+
+    def start(self) -> None:
+        """Start the background compaction task (first run after one interval)."""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.get_running_loop().create_task(self._loop(), name="refresh-compaction")
+
+    async def stop(self) -> None:
+        """Cancel the background compaction task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+_compactor: RevocationCompactor | None = None
+
+
+def get_revocation_compactor() -> RevocationCompactor | None:
+    """
+    Return the process-wide compactor configured from settings.
+
+    Returns:
+        RevocationCompactor | None: Compactor, or None when refresh tokens are disabled.
+    """
+    global _compactor
+    if not settings.REFRESH_TOKENS_ENABLED:
+        return None
+    if _compactor is None:
+        _compactor = RevocationCompactor(interval=settings.REFRESH_TOKEN_COMPACTION_SECONDS)
+    return _compactor
+
+
+def _collect_index_size() -> None:
+    _index_size.set(len(revoked_families))
+
+
+registry.register_collector(_collect_index_size)
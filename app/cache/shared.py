@@ -0,0 +1,252 @@
+"""
+Shared cache facade.
+
+Wraps the configured `CacheBackend` (see `settings.CACHE_BACKEND`) with:
+- a key prefix, so several apps can share one Redis/SQLite cache
+- single-flight `get_or_set`: concurrent misses for the same key in this
+  process wait for one loader call instead of stampeding the database
+- fail-open error handling: backend errors are logged and treated as misses
+- `schedule()`, to fire cache writes/invalidations from sync code paths
+  (e.g. repository methods running in the threadpool, or background threads
+  such as the last-login flusher, which hand the work to the app loop bound
+  by `bind_loop()` at startup)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+from typing import Awaitable, Callable, Coroutine, Sequence
+
+import anyio.from_thread
+
+from app.cache.backends import CacheBackend, CacheError, create_backend
+from app.config import settings
+from app.metrics import registry
+
+log = logging.getLogger(__name__)
+
+_errors = registry.counter(
+    "shared_cache_errors_total", "Shared cache backend errors (treated as misses).", labelnames=("op",)
+)
+_loads = registry.counter(
+    "shared_cache_loads_total", "Loader calls made by get_or_set after a miss."
+)
+_coalesced = registry.counter(
+    "shared_cache_coalesced_total", "get_or_set callers that waited on an in-flight load."
+)
+
+
+class SharedCache:
+    """
+    Prefixing, fail-open cache facade with single-flight loading.
+
+    Args:
+        backend: Storage backend.
+        prefix: Prefix prepended to every key.
+        default_ttl: TTL (seconds) used when none is given.
+    """
+
+    def __init__(self, backend: CacheBackend, prefix: str = "", default_ttl: float = 60.0) -> None:
+        self.backend = backend
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value, or None on a miss or backend error."""
+        try:
+            return await self.backend.get(self._key(key))
+        except CacheError as exc:
+            _errors.inc(op="get")
+            log.warning("Cache get failed for %s: %s", key, exc)
+            return None
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Return cached values for `keys` (None for misses or on backend error)."""
+        try:
+            return await self.backend.mget([self._key(key) for key in keys])
+        except CacheError as exc:
+            _errors.inc(op="mget")
+            log.warning("Cache mget failed: %s", exc)
+            return [None] * len(keys)
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value; errors are logged and ignored."""
+        try:
+            await self.backend.set(self._key(key), value, self.default_ttl if ttl is None else ttl)
+        except CacheError as exc:
+            _errors.inc(op="set")
+            log.warning("Cache set failed for %s: %s", key, exc)
+
+    async def delete(self, key: str) -> None:
+        """Remove a value; errors are logged and ignored."""
+        try:
+            await self.backend.delete(self._key(key))
+        except CacheError as exc:
+            _errors.inc(op="delete")
+            log.warning("Cache delete failed for %s: %s", key, exc)
+
+    async def incr(self, key: str, ttl: float | None = None) -> int | None:
+        """
+        Increment a counter (created with `ttl`) and return its new value.
+
+        Returns:
+            int | None: New value, or None on backend error.
+        """
+        try:
+            return await self.backend.incr(self._key(key), ttl)
+        except CacheError as exc:
+            _errors.inc(op="incr")
+            log.warning("Cache incr failed for %s: %s", key, exc)
+            return None
+
+    async def ping(self) -> bool:
+        """Return True if the backend is reachable."""
+        try:
+            return await self.backend.ping()
+        except CacheError:
+            return False
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[bytes]],
+        ttl: float | None = None,
+    ) -> bytes:
+        """
+        Return the cached value for `key`, loading and storing it on a miss.
+
+        Concurrent callers missing the same key share a single `loader()` call.
+
+        Args:
+            key: Cache key (without prefix).
+            loader: Coroutine function producing the value on a miss.
+            ttl: Entry TTL in seconds.
+
+        Returns:
+            bytes: Cached or freshly loaded value.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            _coalesced.inc()
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            _loads.inc()
+            value = await loader()
+            await self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unobserved failure doesn't log a warning.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def close(self) -> None:
+        """Close the backend."""
+        await self.backend.close()
+
+
+#: Seconds a background thread waits for work handed to the app loop.
+_HANDOFF_TIMEOUT_SECONDS = 5.0
+
+_cache: SharedCache | None = None
+_background: set[asyncio.Task] = set()
+_app_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_cache() -> SharedCache:
+    """
+    Return the process-wide shared cache configured from settings.
+
+    Returns:
+        SharedCache: Shared cache facade.
+    """
+    global _cache
+    if _cache is None:
+        _cache = SharedCache(
+            create_backend(
+                settings.CACHE_BACKEND,
+                settings.CACHE_URL,
+                memory_maxsize=settings.CACHE_MEMORY_MAXSIZE,
+            ),
+            prefix=settings.CACHE_KEY_PREFIX,
+            default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS,
+        )
+    return _cache
+
+
+def set_cache(cache: SharedCache | None) -> None:
+    """Replace the process-wide shared cache (tests, app startup)."""
+    global _cache
+    _cache = cache
+
+
+def bind_loop(loop: asyncio.AbstractEventLoop | None) -> None:
+    """
+    Set the app event loop that `schedule()` uses from plain threads.
+
+    Called by the lifespan at startup (and with None at shutdown), so
+    background threads reuse the app loop and its backend connections
+    instead of spinning up a temporary loop per call.
+    """
+    global _app_loop
+    _app_loop = loop
+
+
+def schedule(factory: Callable[[], Coroutine]) -> None:
+    """
+    Run a cache coroutine from any context.
+
+    - Inside the event loop: scheduled as a background task.
+    - Inside an AnyIO worker thread (Starlette threadpool): run on the loop and
+      waited for, so the effect is visible before the request continues.
+    - In any other thread while the app loop (`bind_loop`) runs: handed to
+      that loop and waited for (up to `_HANDOFF_TIMEOUT_SECONDS`).
+    - Anywhere else (CLI, scripts): run to completion in a temporary loop.
+
+    Args:
+        factory: Zero-arg callable returning the coroutine to run.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is not None:
+        task = loop.create_task(factory())
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+        return
+
+    try:
+        anyio.from_thread.run(factory)
+        return
+    except RuntimeError:
+        pass
+
+    app_loop = _app_loop
+    if app_loop is not None and app_loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(factory(), app_loop)
+        try:
+            future.result(_HANDOFF_TIMEOUT_SECONDS)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            log.warning("Cache operation handed to the app loop timed out")
+        return
+
+    asyncio.run(factory())
@@ -0,0 +1,158 @@
+"""
+Authenticated-user cache.
+
+`get_current_user` runs on every protected request but only needs a user's
+row to check `is_active` and build the response. This module caches a plain
+snapshot of the row per user ID (never the ORM instance itself, which is bound
+to a request session) and rebuilds a detached `DBUser` from it on hits. The
+password hash is not part of the snapshot, so it never reaches a cache tier.
+
+Layers:
+    - L1: in-process LRU+TTL cache (`user_cache`).
+    - L2: the shared cache (`app.cache.shared`), used when the backend is
+      shared between workers (sqlite/redis), so a user loaded by one worker is
+      a hit for the others.
+
+Invalidation:
+    `UserRepository` calls `invalidate_user()` after every write to a user
+    (e.g. deactivation, last-login updates), which clears both layers. The
+    TTL bounds staleness for changes made outside the repository.
+
+The users list (`GET /users`) is also cached in the shared cache. Writes that
+change listed fields call `invalidate_users_list()`, which bumps a generation
+key that is part of every page key.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.cache.lru import MISSING, TTLCache
+from app.cache.shared import get_cache, schedule
+from app.config import settings
+from app.models.db_user import DBUser
+
+#: Process-wide cache: user ID -> column snapshot.
+user_cache = TTLCache(
+    "users",
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+#: Columns never copied into a cache (the shared tier may be readable by
+#: anything with access to the SQLite file or Redis). Authentication reads
+#: them from the database (`get_by_email`), never from a cached user.
+_SECRET_COLUMNS: frozenset[str] = frozenset({"hashed_password"})
+
+_COLUMNS: tuple[str, ...] = tuple(
+    column.key for column in DBUser.__table__.columns if column.key not in _SECRET_COLUMNS
+)
+_DATETIME_COLUMNS: frozenset[str] = frozenset(
+    column.key for column in DBUser.__table__.columns if isinstance(column.type, DateTime)
+)
+
+_USERS_LIST_GENERATION_KEY = "users:list:generation"
+
+
+def _shared_enabled() -> bool:
+    # The memory backend is process-local, so it would only duplicate L1.
+    return settings.USER_CACHE_ENABLED and settings.CACHE_BACKEND != "memory"
+
+
+def _user_key(user_id: int) -> str:
+    return f"users:{user_id}"
+
+
+def _to_json(snapshot: dict) -> bytes:
+    return json.dumps(
+        {k: v.isoformat() if isinstance(v, datetime) else v for k, v in snapshot.items()}
+    ).encode("utf-8")
+
+
+def _from_json(raw: bytes) -> dict:
+    data = json.loads(raw)
+    for key in _DATETIME_COLUMNS:
+        if data.get(key) is not None:
+            data[key] = datetime.fromisoformat(data[key])
+    return data
+
+
+def _to_user(snapshot: dict) -> DBUser:
+    user = DBUser(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+async def get_cached_user(user_id: int) -> DBUser | None:
+    """
+    Return a detached `DBUser` rebuilt from the cache, or None on a miss.
+
+    The instance is detached (not bound to any session) and has no
+    `hashed_password` loaded; use `Session.merge()` before modifying and
+    persisting it.
+    """
+    if not settings.USER_CACHE_ENABLED:
+        return None
+
+    snapshot = user_cache.get(user_id)
+    if snapshot is not MISSING:
+        return _to_user(snapshot)
+
+    if not _shared_enabled():
+        return None
+
+    raw = await get_cache().get(_user_key(user_id))
+    if raw is None:
+        return None
+
+    snapshot = _from_json(raw)
+    user_cache.set(user_id, snapshot)
+    return _to_user(snapshot)
+
+
+async def cache_user(user: DBUser) -> None:
+    """Store a snapshot of an active user's columns in every cache layer."""
+    if not settings.USER_CACHE_ENABLED or not user.is_active:
+        return
+
+    snapshot = {key: getattr(user, key) for key in _COLUMNS}
+    user_cache.set(user.id, snapshot)
+    if _shared_enabled():
+        await get_cache().set(
+            _user_key(user.id), _to_json(snapshot), ttl=settings.USER_CACHE_TTL_SECONDS
+        )
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Drop the cached snapshot for `user_id` from every cache layer.
+
+    Safe to call from sync code (repositories); shared-cache deletes are
+    scheduled via `schedule()`.
+    """
+    user_cache.invalidate(user_id)
+    if _shared_enabled():
+        schedule(lambda: get_cache().delete(_user_key(user_id)))
+
+
+async def users_list_generation() -> str:
+    """Return the current users-list generation (part of list cache keys)."""
+    raw = await get_cache().get(_USERS_LIST_GENERATION_KEY)
+    return raw.decode("ascii") if raw else "0"
+
+
+def invalidate_users_list() -> None:
+    """
+    Invalidate every cached users-list page by bumping the generation key.
+
+    Safe to call from sync code (repositories).
+    """
+    if settings.CACHE_USERS_LIST_TTL_SECONDS <= 0:
+        return
+
+    # Atomic in every backend: concurrent writers (other workers) never lose a bump.
+    schedule(lambda: get_cache().incr(_USERS_LIST_GENERATION_KEY))
@@ -0,0 +1,60 @@
+"""
+Command-line bcrypt cost calibration.
+
+Measures bcrypt verifies on the current machine and prints the highest cost
+(`AUTH_BCRYPT_ROUNDS`) whose verify fits in the target time. Run it on the
+production hardware: each cost step doubles the CPU spent per login.
+
+Usage:
+    python -m app.cli.calibrate_bcrypt
+    python -m app.cli.calibrate_bcrypt --target-ms 100 --min-rounds 10
+
+The result is printed as JSON; `--env` prints an `AUTH_BCRYPT_ROUNDS=<n>`
+line instead, ready to append to `.env`. Changing the setting only affects
+new hashes; existing ones are migrated on login (`AUTH_REHASH_ON_LOGIN`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from app.config import settings
+from app.service.auth_service import calibrate_bcrypt_rounds
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Pick the bcrypt cost for a target verify time.")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Verify time budget per login")
+    parser.add_argument("--min-rounds", type=int, default=10, help="Lowest acceptable cost")
+    parser.add_argument("--max-rounds", type=int, default=16, help="Highest cost considered")
+    parser.add_argument("--samples", type=int, default=3, help="Verifies timed per cost")
+    parser.add_argument("--env", action="store_true", help="Print an .env line instead of JSON")
+    args = parser.parse_args(argv)
+
+    if not 4 <= args.min_rounds <= args.max_rounds <= 31:
+        parser.error("expected 4 <= --min-rounds <= --max-rounds <= 31")
+
+    rounds, elapsed = calibrate_bcrypt_rounds(
+        args.target_ms / 1000,
+        min_rounds=args.min_rounds,
+        max_rounds=args.max_rounds,
+        samples=args.samples,
+    )
+
+    if args.env:
+        print(f"AUTH_BCRYPT_ROUNDS={rounds}")
+    else:
+        report = {
+            "rounds": rounds,
+            "verify_ms": round(elapsed * 1000, 1),
+            "target_ms": args.target_ms,
+            "current_rounds": settings.AUTH_BCRYPT_ROUNDS,
+        }
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
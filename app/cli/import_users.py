@@ -0,0 +1,66 @@
+"""
+Command-line bulk user import.
+
+Runs `BulkImportService` outside the API server, hashing plaintext passwords
+on a process pool (one worker per core by default).
+
+Usage:
+    python -m app.cli.import_users users.ndjson
+    python -m app.cli.import_users users.csv --batch-size 5000 --workers 8
+    cat users.ndjson | python -m app.cli.import_users - --format ndjson
+
+The import report is printed as JSON; the exit status is 1 if any row was
+rejected as invalid.
+
+With `AUTH_EMAIL_FILTER_ENABLED`, running API servers only learn about the
+imported users on their filter's next sync (`AUTH_EMAIL_FILTER_SYNC_SECONDS`)
+and refuse their logins until then; a warning is printed to stderr.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from app.config import settings
+from app.dependencies.db import SessionLocal
+from app.service.bulk_import_service import BulkImportService
+from app.service.hashing import HashingExecutor
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk import users from NDJSON or CSV.")
+    parser.add_argument("path", help="Input file, or '-' for stdin")
+    parser.add_argument("--format", choices=("ndjson", "csv"), help="Defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows per transaction")
+    parser.add_argument("--workers", type=int, default=0, help="Hashing processes (0 = CPU count)")
+    args = parser.parse_args(argv)
+
+    if settings.AUTH_EMAIL_FILTER_ENABLED:
+        print(
+            "warning: AUTH_EMAIL_FILTER_ENABLED is on; running servers refuse logins of imported "
+            f"users until their email filter syncs (AUTH_EMAIL_FILTER_SYNC_SECONDS="
+            f"{settings.AUTH_EMAIL_FILTER_SYNC_SECONDS:g}; <= 0 = until the next rebuild)",
+            file=sys.stderr,
+        )
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    hasher = HashingExecutor(kind="process", max_workers=args.workers)
+
+    try:
+        with SessionLocal() as db:
+            service = BulkImportService(db, hasher, batch_size=args.batch_size)
+            if args.path == "-":
+                report = service.import_file(sys.stdin.buffer, fmt)
+            else:
+                with open(args.path, "rb") as file:
+                    report = service.import_file(file, fmt)
+    finally:
+        hasher.shutdown()
+
+    print(report.model_dump_json(indent=2))
+    return 1 if report.invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+"""
+Response compression (ASGI middleware).
+
+Compresses responses negotiated through `Accept-Encoding`:
+
+- Encodings: gzip (stdlib), and brotli (`br`) / zstd when the optional
+  `brotli` / `zstandard` packages are installed. The server's preference
+  order is `COMPRESSION_ENCODINGS`; the client's q-values decide among them.
+- Only compressible media types (JSON, NDJSON, text, JavaScript, XML, SVG)
+  at least `COMPRESSION_MIN_SIZE` bytes long; already encoded responses,
+  304s and 204s pass through untouched.
+- Streaming: bodies sent in several chunks (e.g. `GET /users?format=ndjson`)
+  are compressed incrementally and each chunk is flushed, so clients get
+  every batch as soon as it is produced and memory stays flat.
+- Static payloads: the OpenAPI schema never changes after startup, so its
+  compressed variants are built once, at the encoder's highest level, and
+  served from memory (keyed by a digest of the uncompressed body, so a
+  changed schema is never served stale).
+
+Levels are configurable per encoding (`COMPRESSION_*_LEVEL`). ETags are weak
+(`app.http_cache`), so they stay valid across encodings; every negotiated
+response carries `Vary: Accept-Encoding`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from typing import Any, Iterable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import registry
+
+_responses = registry.counter(
+    "http_compressed_responses_total", "Responses compressed, by encoding.", labelnames=("encoding",)
+)
+_bytes_in = registry.counter(
+    "http_compression_input_bytes_total", "Uncompressed bytes fed to the encoders.", labelnames=("encoding",)
+)
+_bytes_out = registry.counter(
+    "http_compression_output_bytes_total", "Compressed bytes sent.", labelnames=("encoding",)
+)
+
+#: Media types worth compressing (prefix match on the `Content-Type` essence).
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+class _Gzip:
+    max_level = 9
+
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _Brotli:
+    max_level = 11
+
+    def __init__(self, level: int) -> None:
+        import brotli
+
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _Zstd:
+    max_level = 19
+
+    def __init__(self, level: int) -> None:
+        import zstandard
+
+        self._flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(self._flush_mode)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+#: Content-coding -> (encoder class, module that must be importable).
+_ENCODERS: dict[str, tuple[type, str | None]] = {
+    "gzip": (_Gzip, None),
+    "br": (_Brotli, "brotli"),
+    "zstd": (_Zstd, "zstandard"),
+}
+
+
+def available_encodings(preference: Iterable[str]) -> tuple[str, ...]:
+    """
+    Keep the encodings from `preference` that can be used in this environment.
+
+    Args:
+        preference: Content-codings in server preference order.
+
+    Returns:
+        tuple[str, ...]: Known encodings whose optional dependency is installed.
+    """
+    available = []
+    for encoding in preference:
+        spec = _ENCODERS.get(encoding)
+        if spec is None or encoding in available:
+            continue
+        if spec[1] is not None:
+            try:
+                __import__(spec[1])
+            except ImportError:
+                continue
+        available.append(encoding)
+    return tuple(available)
+
+
+def negotiate(accept_encoding: str, supported: Iterable[str]) -> str | None:
+    """
+    Pick the encoding for a request's `Accept-Encoding` header.
+
+    Args:
+        accept_encoding: Header value (e.g. "gzip, br;q=0.9, *;q=0").
+        supported: Encodings in server preference order.
+
+    Returns:
+        str | None: Highest-q supported encoding (server order breaks ties),
+        or None to send the body as is.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding.strip()] = q
+
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """One-shot compression of `data` with `encoding` at `level`."""
+    encoder = _ENCODERS[encoding][0](level)
+    return encoder.compress(data) + encoder.finish()
+
+
+def _compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) and "content-encoding" not in headers
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing eligible responses.
+
+    Args:
+        app: Wrapped ASGI application.
+        encodings: Enabled content-codings in server preference order.
+        levels: Compression level per encoding.
+        minimum_size: Smallest body (bytes) worth compressing.
+        static_paths: Paths whose bodies never change; their compressed
+            variants are built once at maximum level and reused.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Iterable[str] = ("gzip",),
+        levels: dict[str, int] | None = None,
+        minimum_size: int = 1024,
+        static_paths: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.levels = {"gzip": 6, "br": 4, "zstd": 3, **(levels or {})}
+        self.minimum_size = minimum_size
+        self.static_paths = frozenset(static_paths)
+        # (path, encoding) -> (digest of the uncompressed body, compressed body)
+        self._static: dict[tuple[str, str], tuple[bytes, bytes]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _Responder(self, send, encoding, scope["path"])
+        await self.app(scope, receive, responder.send)
+
+    def static_variant(self, path: str, encoding: str, body: bytes) -> bytes:
+        """Return the cached compressed `body` of a static path (built on first use)."""
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        cached = self._static.get((path, encoding))
+        if cached is None or cached[0] != digest:
+            encoder_cls = _ENCODERS[encoding][0]
+            cached = (digest, compress(body, encoding, encoder_cls.max_level))
+            self._static[(path, encoding)] = cached
+        return cached[1]
+
+
+class _Responder:
+    """Per-response state: decides on the first body chunk, then streams."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str, path: str) -> None:
+        self.middleware = middleware
+        self.downstream = send
+        self.encoding = encoding
+        self.path = path
+        self.start: Message | None = None
+        self.encoder: Any = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message.get("headers", []))
+            length = headers.get("content-length")
+            if (
+                message["status"] in (204, 304)
+                or not _compressible(headers)
+                or (length is not None and int(length) < self.middleware.minimum_size)
+            ):
+                self.passthrough = True
+                await self.downstream(message)
+            else:
+                self.start = message
+            return
+
+        if self.passthrough or message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            if not more_body:
+                await self._send_whole(start, body)
+                return
+            self._begin_stream(start)
+            await self.downstream(start)
+
+        chunk = self.encoder.compress(body)
+        chunk += self.encoder.flush() if more_body else self.encoder.finish()
+        _bytes_in.inc(len(body), encoding=self.encoding)
+        _bytes_out.inc(len(chunk), encoding=self.encoding)
+        await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _send_whole(self, start: Message, body: bytes) -> None:
+        headers = MutableHeaders(scope=start)
+        if len(body) < self.middleware.minimum_size:
+            await self.downstream(start)
+            await self.downstream({"type": "http.response.body", "body": body})
+            return
+
+        if self.path in self.middleware.static_paths:
+            compressed = self.middleware.static_variant(self.path, self.encoding, body)
+        else:
+            compressed = compress(body, self.encoding, self.middleware.levels[self.encoding])
+        self._set_encoding(headers)
+        headers["content-length"] = str(len(compressed))
+        _responses.inc(encoding=self.encoding)
+        _bytes_in.inc(len(body), encoding=self.encoding)
+        _bytes_out.inc(len(compressed), encoding=self.encoding)
+        await self.downstream(start)
+        await self.downstream({"type": "http.response.body", "body": compressed})
+
+    def _begin_stream(self, start: Message) -> None:
+        headers = MutableHeaders(scope=start)
+        self._set_encoding(headers)
+        if "content-length" in headers:
+            del headers["content-length"]
+        self.encoder = _ENCODERS[self.encoding][0](self.middleware.levels[self.encoding])
+        _responses.inc(encoding=self.encoding)
+
+    def _set_encoding(self, headers: MutableHeaders) -> None:
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
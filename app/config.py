@@ -5,18 +5,18 @@ This module defines strongly-typed settings using Pydantic Settings.
 Configuration is loaded from environment variables and an optional `.env` file.
 
 Notes:
+    - `.env` is read by pydantic-settings itself (`env_file`); it is not
+      loaded into `os.environ`. In Docker, variables can be provided via
+      env_file or environment.
     - `extra="allow"` allows docker-compose variables (e.g., UID/GID) to exist
       in the same `.env` without breaking Settings validation.
 """
 
 from __future__ import annotations
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from dotenv import load_dotenv
+from typing import Literal
 
-# Load .env into process environment for local/dev execution.
-# In Docker, variables can be provided via env_file or environment.
-load_dotenv()
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -29,11 +29,121 @@ class Settings(BaseSettings):
         DEBUG: Enables debug behaviors and more verbose logging.
         ALLOWED_ORIGINS: CSV list of CORS allowed origins.
         LOG_LEVEL: Logging verbosity ("debug", "info", "warning", etc.).
+        LOG_FORMAT: "json" (one JSON object per line) or "text".
+        LOG_SAMPLE_RATES: CSV of `logger=fraction` kept for records below WARNING.
+        LOG_RATE_LIMITS: CSV of `logger=records_per_second` for records below WARNING.
+        LOG_QUEUE_SIZE: Max log records waiting to be written (extra records are dropped).
+        METRICS_ENABLED: Record request metrics and serve them at `/metrics`.
+        SERVER_TIMING_ENABLED: Add `Server-Timing` (app/db time) response headers.
+        STARTUP_WARMUP: After startup, load deferred libraries (bcrypt, JWT)
+            and build the OpenAPI schema on a worker thread; `/readyz`
+            answers 503 "warming" until it finishes (see `app.lifespan`).
+        STARTUP_WARM_DB_CONNECTIONS: Pool connections opened by the warm-up
+            per sync engine (capped at the pool size; 0 = none).
+        READINESS_INTERVAL_SECONDS: How often `/readyz` dependency checks run
+            in the background (the endpoint serves the cached result).
+        READINESS_CHECK_TIMEOUT_SECONDS: Per-check timeout.
+        READINESS_MAX_HASH_SATURATION: Hashing pool usage (0.0 - 1.0) at which
+            the service reports itself not ready.
         DATABASE_URL: SQLAlchemy database URL (SQLite by default).
         DB_ECHO: If True, logs SQL statements (useful for debugging).
+        DB_POOL_SIZE: Persistent connections per pool (None = dialect default).
+        DB_MAX_OVERFLOW: Extra connections allowed under load (None = dialect default).
+        DB_POOL_TIMEOUT: Seconds to wait for a free connection before failing.
+        DB_POOL_RECYCLE: Max connection age in seconds, -1 disables (None = dialect default).
+        DB_POOL_PRE_PING: Test connections on checkout (None = dialect default).
+        SQLITE_TUNING: Enable the SQLite production profile (WAL, pragmas,
+            single writer connection); see `app.sqlite_profile`.
+        SQLITE_MMAP_SIZE: Bytes of the database file memory-mapped per connection.
+        SQLITE_CACHE_SIZE_KIB: Page cache size per connection, in KiB.
+        SQLITE_BUSY_TIMEOUT_MS: How long a connection waits on a locked database.
+        LAST_LOGIN_WRITE_BEHIND: Buffer last-login updates and write them in
+            batches instead of committing on every login.
+        LAST_LOGIN_FLUSH_INTERVAL_MS: Max delay before buffered updates are written.
+        LAST_LOGIN_FLUSH_MAX_PENDING: Pending users that trigger an immediate flush.
+        ADMIN_EMAILS: CSV of user emails allowed to call admin endpoints.
+        BULK_IMPORT_BATCH_SIZE: Rows per transaction in bulk user imports.
+        BULK_IMPORT_MAX_ERRORS: Max per-row errors listed in an import report.
+        RATE_LIMIT_ENABLED: Throttle login attempts (429 + `Retry-After`).
+        RATE_LIMIT_BACKEND: Counter storage: "memory" (per process) or
+            "shared" (the shared cache, so limits hold across workers).
+        RATE_LIMIT_MEMORY_MAXSIZE: Max counters kept by the memory backend (LRU).
+        RATE_LIMIT_TRUST_FORWARDED_FOR: Key clients by the first
+            `X-Forwarded-For` entry (only behind a trusted proxy).
+        LOGIN_RATE_LIMIT_PER_IP: Max login attempts per client IP and window.
+        LOGIN_RATE_LIMIT_PER_ACCOUNT: Max login attempts per email and window.
+        LOGIN_RATE_LIMIT_WINDOW_SECONDS: Rate-limit window length.
+        AUTH_DUMMY_VERIFY: Run a bcrypt verify against a dummy hash when the
+            email is unknown, so login time doesn't reveal registered emails.
+        AUTH_EMAIL_FILTER_ENABLED: Keep a Bloom filter of registered emails so
+            logins for unknown emails skip the database (per process: single
+            worker only; `app.server` turns it off with more than one).
+        AUTH_EMAIL_FILTER_FP_RATE: Target false-positive rate of the filter.
+        AUTH_EMAIL_FILTER_REBUILD_SECONDS: Background rebuild interval
+            (resizes the filter, drops deleted emails; <= 0 = build once).
+        AUTH_EMAIL_FILTER_SYNC_SECONDS: Interval of the incremental sync
+            that adds users inserted by other processes (CLI import, SQL);
+            such users are refused at most this long (<= 0 = off).
+        AUTH_BCRYPT_ROUNDS: bcrypt cost of new password hashes (each +1
+            doubles the CPU per login; see `python -m app.cli.calibrate_bcrypt`).
+        AUTH_REHASH_ON_LOGIN: After a successful login, rehash in the
+            background passwords stored with a cost other than
+            `AUTH_BCRYPT_ROUNDS`.
+        DB_ASYNC_ROUTES: CSV of route names served by the async DB stack
+            ("users", "login", "register", "auth", or "*" for all).
         JWT_SECRET_KEY: Secret key used to sign JWTs.
         JWT_ALGORITHM: JWT algorithm (default HS256).
         JWT_EXPIRE_MINUTES: Access token expiration in minutes.
+        JWT_BACKEND: JWT library used to sign/verify tokens ("jose" or "pyjwt").
+        JWT_DECODE_CACHE_ENABLED: Cache verified tokens until they expire.
+        JWT_DECODE_CACHE_MAXSIZE: Max verified tokens kept in the cache.
+        REFRESH_TOKENS_ENABLED: Issue rotating refresh tokens at login and
+            serve `/token/refresh` and `/logout`.
+        REFRESH_TOKEN_EXPIRE_DAYS: Lifetime of a refresh-token family (absolute,
+            from login).
+        REFRESH_TOKEN_COMPACTION_SECONDS: How often expired families are
+            deleted and the in-memory revocation index is compacted/reloaded.
+        USERS_PAGE_DEFAULT_LIMIT: Default page size for GET /users.
+        USERS_PAGE_MAX_LIMIT: Max page size accepted for GET /users.
+        USERS_STREAM_BATCH_SIZE: Rows fetched per round trip when streaming.
+        HTTP_CACHE_ENABLED: Send ETags on GET /users and GET /secure and
+            answer matching `If-None-Match` with 304.
+        HTTP_CACHE_USERS_CONTROL: `Cache-Control` for GET /users ("" = none).
+        HTTP_CACHE_SECURE_CONTROL: `Cache-Control` for GET /secure (per-user
+            data: keep it `private`).
+        USER_CACHE_ENABLED: Cache authenticated-user lookups in process.
+        USER_CACHE_MAXSIZE: Max users kept in the cache (LRU eviction).
+        USER_CACHE_TTL_SECONDS: Max age of a cached user snapshot.
+        CACHE_BACKEND: Shared cache backend ("memory", "sqlite" or "redis").
+        CACHE_URL: SQLite cache file path or Redis URL for the shared cache.
+        CACHE_KEY_PREFIX: Prefix for every shared cache key.
+        CACHE_DEFAULT_TTL_SECONDS: Default TTL for shared cache entries.
+        CACHE_MEMORY_MAXSIZE: Max entries for the memory backend.
+        CACHE_USERS_LIST_TTL_SECONDS: TTL of cached GET /users pages (0 = off).
+        SERVER_HOST: Bind address of the production server (`python -m app.server`).
+        SERVER_PORT: Bind port of the production server.
+        SERVER_WORKERS: Worker processes (0 = CPUs available to the process).
+        SERVER_MAX_REQUESTS: Recycle a worker after this many requests
+            (0 = never), bounding memory growth.
+        SERVER_MAX_REQUESTS_JITTER: Random extra requests per worker, so
+            workers don't all recycle at once.
+        SERVER_GRACEFUL_TIMEOUT_SECONDS: On SIGTERM, time given to in-flight
+            requests before they are cancelled.
+        SERVER_KEEPALIVE_SECONDS: Idle keep-alive timeout.
+        SERVER_ACCESS_LOG: Log every request (uvicorn access log).
+        COMPRESSION_ENABLED: Compress responses negotiated via `Accept-Encoding`.
+        COMPRESSION_MIN_SIZE: Smallest body (bytes) worth compressing.
+        COMPRESSION_ENCODINGS: CSV of encodings in server preference order
+            ("br" and "zstd" need the optional `brotli` / `zstandard` packages;
+            unavailable ones are skipped).
+        COMPRESSION_GZIP_LEVEL: gzip level (1-9).
+        COMPRESSION_BROTLI_QUALITY: brotli quality (0-11).
+        COMPRESSION_ZSTD_LEVEL: zstd level (1-19).
+        HASH_EXECUTOR: Worker pool used for bcrypt ("thread" or "process").
+        HASH_WORKERS: Hashing pool size (0 = number of CPUs; under
+            `app.server`, the CPUs divided among its workers).
+        HASH_QUEUE_LIMIT: Max hashing jobs waiting for a worker before
+            new requests are rejected with 503.
     """
 
     # App
@@ -42,15 +152,112 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     ALLOWED_ORIGINS: str = "http://localhost"
     LOG_LEVEL: str = "info"
+    LOG_FORMAT: Literal["json", "text"] = "json"
+    LOG_SAMPLE_RATES: str = ""
+    LOG_RATE_LIMITS: str = ""
+    LOG_QUEUE_SIZE: int = 10_000
+    METRICS_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = True
+    STARTUP_WARMUP: bool = True
+    STARTUP_WARM_DB_CONNECTIONS: int = 2
+    READINESS_INTERVAL_SECONDS: float = 5.0
+    READINESS_CHECK_TIMEOUT_SECONDS: float = 2.0
+    READINESS_MAX_HASH_SATURATION: float = 0.9
 
     # Database
     DATABASE_URL: str = "sqlite:///./app.db"
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int | None = None
+    DB_POOL_PRE_PING: bool | None = None
+    SQLITE_TUNING: bool = False
+    SQLITE_MMAP_SIZE: int = 268_435_456
+    SQLITE_CACHE_SIZE_KIB: int = 65_536
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    LAST_LOGIN_WRITE_BEHIND: bool = False
+    LAST_LOGIN_FLUSH_INTERVAL_MS: int = 500
+    LAST_LOGIN_FLUSH_MAX_PENDING: int = 1000
+    ADMIN_EMAILS: str = ""
+    BULK_IMPORT_BATCH_SIZE: int = 1000
+    BULK_IMPORT_MAX_ERRORS: int = 1000
+    DB_ASYNC_ROUTES: str = ""
+
+    # Rate limiting
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: Literal["memory", "shared"] = "memory"
+    RATE_LIMIT_MEMORY_MAXSIZE: int = 100_000
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_ACCOUNT: int = 5
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: float = 60.0
+
+    # Login hardening
+    AUTH_DUMMY_VERIFY: bool = True
+    AUTH_EMAIL_FILTER_ENABLED: bool = False
+    AUTH_EMAIL_FILTER_FP_RATE: float = 0.01
+    AUTH_EMAIL_FILTER_REBUILD_SECONDS: float = 300.0
+    AUTH_EMAIL_FILTER_SYNC_SECONDS: float = 1.0
+    AUTH_BCRYPT_ROUNDS: int = 12
+    AUTH_REHASH_ON_LOGIN: bool = True
 
     # JWT
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 30
+    JWT_BACKEND: Literal["jose", "pyjwt"] = "jose"
+    JWT_DECODE_CACHE_ENABLED: bool = True
+    JWT_DECODE_CACHE_MAXSIZE: int = 10_000
+    REFRESH_TOKENS_ENABLED: bool = True
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    REFRESH_TOKEN_COMPACTION_SECONDS: float = 3600.0
+
+    # Users listing
+    USERS_PAGE_DEFAULT_LIMIT: int = 100
+    USERS_PAGE_MAX_LIMIT: int = 1000
+    USERS_STREAM_BATCH_SIZE: int = 1000
+
+    # HTTP caching (ETag / Cache-Control)
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_USERS_CONTROL: str = "public, no-cache"
+    HTTP_CACHE_SECURE_CONTROL: str = "private, no-cache"
+
+    # Authenticated-user cache
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_MAXSIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # Shared cache
+    CACHE_BACKEND: Literal["memory", "sqlite", "redis"] = "memory"
+    CACHE_URL: str = ""
+    CACHE_KEY_PREFIX: str = "fastapi-starter:"
+    CACHE_DEFAULT_TTL_SECONDS: float = 60.0
+    CACHE_MEMORY_MAXSIZE: int = 10_000
+    CACHE_USERS_LIST_TTL_SECONDS: float = 5.0
+
+    # Production server
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_MAX_REQUESTS: int = 0
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_ACCESS_LOG: bool = False
+
+    # Response compression
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_ENCODINGS: str = "br,zstd,gzip"
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Password hashing
+    HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    HASH_WORKERS: int = 0
+    HASH_QUEUE_LIMIT: int = 64
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,242 @@
+"""
+Connection pool configuration and instrumentation.
+
+Builds per-dialect pool settings for the SQLAlchemy engines and instruments
+their pools so pool pressure is visible instead of surfacing as opaque
+timeouts:
+
+- `db_pool_checkout_seconds`: time to obtain a connection (waiting for a free
+  slot and/or opening a new connection)
+- `db_pool_timeouts_total`: checkouts that gave up after `pool_timeout`
+- `db_pool_size` / `db_pool_checked_out` / `db_pool_checked_in` /
+  `db_pool_overflow`: pool occupancy, refreshed on every metrics collection
+
+Per-dialect defaults (each overridable via `DB_POOL_*` settings):
+    - SQLite in-memory: `StaticPool` (one shared connection; pool settings unused).
+    - SQLite file: `QueuePool`, no recycling and no pre-ping (local file,
+      connections never go stale).
+    - Other databases: `QueuePool` with pre-ping and 30-minute recycling, so
+      connections dropped by the server or a proxy are replaced transparently.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from sqlalchemy import exc, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool, StaticPool
+
+from app.config import settings
+from app.metrics import registry
+
+_checkout_seconds = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time to check out a connection from the pool.",
+    labelnames=("engine",),
+)
+_timeouts = registry.counter(
+    "db_pool_timeouts_total",
+    "Connection checkouts that timed out waiting for the pool.",
+    labelnames=("engine",),
+)
+_size = registry.gauge("db_pool_size", "Configured pool size.", labelnames=("engine",))
+_checked_out = registry.gauge(
+    "db_pool_checked_out", "Connections currently in use.", labelnames=("engine",)
+)
+_checked_in = registry.gauge(
+    "db_pool_checked_in", "Idle connections held by the pool.", labelnames=("engine",)
+)
+_overflow = registry.gauge(
+    "db_pool_overflow", "Connections opened beyond pool_size.", labelnames=("engine",)
+)
+
+#: Dialect defaults: (pool_size, max_overflow, pool_recycle, pool_pre_ping).
+_DEFAULTS: dict[str, tuple[int, int, int, bool]] = {
+    "sqlite": (5, 10, -1, False),
+    "default": (10, 20, 1800, True),
+}
+
+_engines: dict[str, Any] = {}
+_instrumented_classes: dict[tuple[type, str], type] = {}
+
+
+class _TimedCheckoutMixin:
+    """Pool mixin that records checkout latency and timeouts."""
+
+    engine_label = "sync"
+
+    def connect(self):  # noqa: D401 - same contract as Pool.connect
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            _timeouts.inc(engine=self.engine_label)
+            raise
+        _checkout_seconds.observe(time.perf_counter() - started, engine=self.engine_label)
+        return connection
+
+
+def _instrumented(poolclass: type[Pool], engine_label: str) -> type[Pool]:
+    """Return a subclass of `poolclass` with checkout instrumentation."""
+    key = (poolclass, engine_label)
+    cls = _instrumented_classes.get(key)
+    if cls is None:
+        cls = type(
+            f"Instrumented{poolclass.__name__}",
+            (_TimedCheckoutMixin, poolclass),
+            {"engine_label": engine_label},
+        )
+        _instrumented_classes[key] = cls
+    return cls
+
+
+def is_sqlite_memory(database_url: str) -> bool:
+    """Return True for in-memory SQLite URLs (one DB per connection)."""
+    url = make_url(database_url)
+    database = url.database or ""
+    return (
+        url.get_backend_name() == "sqlite"
+        and (database in ("", ":memory:") or url.query.get("mode") == "memory")
+    )
+
+
+def pool_options(database_url: str, engine_label: str = "sync") -> dict[str, Any]:
+    """
+    Build `create_engine`/`create_async_engine` pool keyword arguments.
+
+    Args:
+        database_url: SQLAlchemy URL.
+        engine_label: Metrics label, e.g. "sync" or "async"; labels starting
+            with "async" select the asyncio-compatible pool class.
+
+    Returns:
+        dict[str, Any]: Keyword arguments (poolclass, pool_size, ...).
+    """
+    if is_sqlite_memory(database_url):
+        return {"poolclass": _instrumented(StaticPool, engine_label)}
+
+    backend = make_url(database_url).get_backend_name()
+    size, overflow, recycle, pre_ping = _DEFAULTS.get(backend, _DEFAULTS["default"])
+    base = AsyncAdaptedQueuePool if engine_label.startswith("async") else QueuePool
+
+    return {
+        "poolclass": _instrumented(base, engine_label),
+        "pool_size": settings.DB_POOL_SIZE if settings.DB_POOL_SIZE is not None else size,
+        "max_overflow": (
+            settings.DB_MAX_OVERFLOW if settings.DB_MAX_OVERFLOW is not None else overflow
+        ),
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE if settings.DB_POOL_RECYCLE is not None else recycle,
+        "pool_pre_ping": (
+            settings.DB_POOL_PRE_PING if settings.DB_POOL_PRE_PING is not None else pre_ping
+        ),
+    }
+
+
+def register_engine(label: str, engine: Any) -> None:
+    """
+    Track an engine so its pool occupancy is published as metrics.
+
+    Args:
+        label: Metrics label ("sync", "async", "sync-writer", ...).
+        engine: `Engine` or `AsyncEngine`.
+    """
+    _engines[label] = engine
+
+
+def pool_status(engine: Any) -> dict[str, Any]:
+    """
+    Describe the current state of an engine's pool.
+
+    Args:
+        engine: `Engine` or `AsyncEngine`.
+
+    Returns:
+        dict[str, Any]: Pool class and, for queue pools, size/usage counters.
+    """
+    sync_engine: Engine = getattr(engine, "sync_engine", engine)
+    pool = sync_engine.pool
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            timeout=pool.timeout(),
+        )
+    return status
+
+
+def pool_metrics(label: str) -> dict[str, float]:
+    """Return checkout latency and timeout counters for `label`."""
+    count = _checkout_seconds.count(engine=label)
+    total = _checkout_seconds.total(engine=label)
+    return {
+        "checkouts": count,
+        "checkout_seconds_avg": total / count if count else 0.0,
+        "timeouts": _timeouts.value(engine=label),
+    }
+
+
+def engines() -> dict[str, Any]:
+    """Return the registered engines by label."""
+    return dict(_engines)
+
+
+def prewarm(engine: Engine, connections: int) -> int:
+    """
+    Open pooled connections ahead of traffic.
+
+    Connects (and runs `SELECT 1`) up to `connections` times, holding every
+    connection until all are open, then returns them to the pool as idle
+    connections, so the first requests don't pay connection setup.
+
+    Args:
+        engine: Sync engine to warm.
+        connections: Connections to open (capped at the pool size; a single
+            one for non-queue pools).
+
+    Returns:
+        int: Connections opened.
+    """
+    pool = engine.pool
+    connections = min(connections, pool.size() if isinstance(pool, QueuePool) else 1)
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+def dispose_after_fork() -> None:
+    """
+    Drop every registered engine's pooled connections in a forked child.
+
+    Connections opened by the parent must not be shared with the child (two
+    processes on one socket corrupt the protocol). `close=False` discards
+    them without closing, leaving the parent's connections intact; the child
+    opens its own on first use.
+    """
+    for engine in _engines.values():
+        getattr(engine, "sync_engine", engine).dispose(close=False)
+
+
+def _collect_pool_gauges() -> None:
+    for label, engine in _engines.items():
+        status = pool_status(engine)
+        if "size" in status:
+            _size.set(status["size"], engine=label)
+            _checked_out.set(status["checked_out"], engine=label)
+            _checked_in.set(status["checked_in"], engine=label)
+            _overflow.set(status["overflow"], engine=label)
+
+
+registry.register_collector(_collect_pool_gauges)
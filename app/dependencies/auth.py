@@ -3,25 +3,69 @@ Authentication dependencies.
 
 This module provides reusable dependencies for protected routes, including:
 - extracting the bearer token (OAuth2)
-- decoding JWT
-- loading the current user from the database
+- decoding JWT (via `AuthService`, which caches verified tokens)
+- loading the current user from the database (sync or async stack)
+- restricting admin routes to the emails listed in `ADMIN_EMAILS`
+
+Loaded users are cached per ID (`app.cache.users`, in-process and shared), so
+repeated requests with the same token skip the database round trip.
 """
 
 from __future__ import annotations
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.cache.users import cache_user, get_cached_user
 from app.config import settings
-from app.dependencies.db import get_db
+from app.dependencies.db import get_async_db, get_db, uses_async_db
+from app.exceptions import ForbiddenException
 from app.models.db_user import DBUser
+from app.service.auth_service import AuthService
+from app.service.jwt_backends import InvalidTokenError
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/login")
+auth_service = AuthService()
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token inválido o expirado",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _decode_user_id(token: str) -> int:
+    """
+    Decode the JWT token and extract the user ID from `sub`.
+
+    Raises:
+        HTTPException: If the token is invalid/expired or `sub` is not an ID.
+    """
+    credentials_exception = _credentials_exception()
+
+    try:
+        payload = auth_service.decode_access_token(token)
+        sub = payload.get("sub")
+        if not sub:
+            raise credentials_exception
+
+        try:
+            user_id = int(sub)
+        except (TypeError, ValueError):
+            raise credentials_exception
+
+    except InvalidTokenError:
+        raise credentials_exception
+
+    return user_id
 
 
-def get_current_user(
+async def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme),
 ) -> DBUser:
@@ -36,34 +80,70 @@ def get_current_user(
         HTTPException: If token is invalid/expired, user not found, or inactive.
 
     Returns:
-        DBUser: Authenticated user ORM instance.
+        DBUser: Authenticated user ORM instance (detached when served from cache).
+
+    Notes:
+        - Runs on the event loop; only a cache miss uses the threadpool for
+          the (sync) database lookup.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Token inválido o expirado",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    user_id = _decode_user_id(token)
 
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-        )
-        sub = payload.get("sub")
-        if not sub:
-            raise credentials_exception
+    user = await get_cached_user(user_id)
+    if user is not None:
+        return user
 
-        try:
-            user_id = int(sub)
-        except (TypeError, ValueError):
-            raise credentials_exception
+    user = await run_in_threadpool(db.get, DBUser, user_id)
+    if user is None or not user.is_active:
+        raise _credentials_exception()
+
+    await cache_user(user)
+    return user
 
-    except JWTError:
-        raise credentials_exception
 
-    user = db.get(DBUser, user_id)
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    token: str = Depends(oauth2_scheme),
+) -> DBUser:
+    """
+    Async variant of `get_current_user` using the async DB stack.
+
+    Raises:
+        HTTPException: If token is invalid/expired, user not found, or inactive.
+
+    Returns:
+        DBUser: Authenticated user ORM instance.
+    """
+    user_id = _decode_user_id(token)
+
+    user = await get_cached_user(user_id)
+    if user is not None:
+        return user
+
+    user = await db.get(DBUser, user_id)
     if user is None or not user.is_active:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    await cache_user(user)
+    return user
+
+
+#: Current-user dependency for protected routes, selected by `DB_ASYNC_ROUTES` ("auth").
+get_authenticated_user = get_current_user_async if uses_async_db("auth") else get_current_user
 
-    return user
\ No newline at end of file
+
+def get_admin_user(user: DBUser = Depends(get_authenticated_user)) -> DBUser:
+    """
+    Require the authenticated user to be an administrator.
+
+    Administrators are the users whose email is listed in `settings.ADMIN_EMAILS`.
+
+    Raises:
+        ForbiddenException: If the user is not an administrator.
+
+    Returns:
+        DBUser: Authenticated administrator.
+    """
+    admins = {email.strip().lower() for email in settings.ADMIN_EMAILS.split(",") if email.strip()}
+    if user.email.lower() not in admins:
+        raise ForbiddenException("Se requieren permisos de administrador")
+    return user
@@ -5,19 +5,41 @@ This module centralizes SQLAlchemy configuration:
 - Engine creation from settings
 - Session factory (SessionLocal)
 - `get_db()` dependency for request-scoped sessions
+- Async engine/session factory and `get_async_db()` (created lazily)
 - Declarative Base for ORM models
 
 Design:
     - `get_db()` yields a session per request and guarantees cleanup.
     - SQLite requires `check_same_thread=False` for typical FastAPI usage.
+    - Pool class and limits come from `app.db_pool.pool_options()` (per-dialect
+      defaults, overridable via `DB_POOL_*` settings); pools are instrumented,
+      and query counts/time are recorded per request (`app.instrumentation`).
+    - `SQLITE_TUNING=true` enables the SQLite production profile: WAL pragmas
+      plus a single-connection writer engine that every write is routed to
+      (see `app.sqlite_profile`).
+    - The async stack is opt-in per route via `settings.DB_ASYNC_ROUTES`, so
+      routes can be migrated one at a time. The async driver is derived from
+      `DATABASE_URL` (aiosqlite for SQLite, asyncpg for PostgreSQL).
 """
 
 from __future__ import annotations
 
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.config import settings
+from app.db_pool import pool_options, register_engine
+from app.instrumentation import instrument_engine
+from app.sqlite_profile import (
+    configure_sqlite_engine,
+    routing_session_class,
+    sqlite_tuning_enabled,
+    writer_pool_options,
+)
 
 #: Declarative base used by all ORM models (e.g., DBUser).
 Base = declarative_base()
@@ -34,14 +56,38 @@ engine = create_engine(
     connect_args=connect_args,
     echo=settings.DB_ECHO,
     future=True,
+    **pool_options(settings.DATABASE_URL),
 )
+register_engine("sync", engine)
+instrument_engine(engine, "sync")
 
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    future=True,
-)
+#: Single-connection engine receiving every write (SQLite profile only).
+writer_engine = None
+if sqlite_tuning_enabled(settings.DATABASE_URL):
+    writer_engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args=connect_args,
+        echo=settings.DB_ECHO,
+        future=True,
+        **writer_pool_options(pool_options(settings.DATABASE_URL, engine_label="sync-writer")),
+    )
+    register_engine("sync-writer", writer_engine)
+    instrument_engine(writer_engine, "sync-writer")
+    configure_sqlite_engine(engine)
+    configure_sqlite_engine(writer_engine, writer=True)
+    SessionLocal = sessionmaker(
+        class_=routing_session_class(engine, writer_engine),
+        autocommit=False,
+        autoflush=False,
+        future=True,
+    )
+else:
+    SessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=engine,
+        future=True,
+    )
 
 
 def get_db():
@@ -60,3 +106,141 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+#: Async drivers used for each sync backend when building the async engine.
+_ASYNC_DRIVERS: dict[str, str] = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+_async_engine: AsyncEngine | None = None
+_async_writer_engine: AsyncEngine | None = None
+_async_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+
+
+def to_async_url(database_url: str) -> str:
+    """
+    Translate a sync database URL into its async-driver equivalent.
+
+    Args:
+        database_url: SQLAlchemy URL, e.g. `sqlite:///./app.db`.
+
+    Returns:
+        str: URL using an async driver, e.g. `sqlite+aiosqlite:///./app.db`.
+            URLs for other backends are returned unchanged.
+    """
+    driver = _ASYNC_DRIVERS.get(make_url(database_url).get_backend_name())
+    if driver is None:
+        return database_url
+    # Only swap the scheme; re-rendering the URL would escape paths like ":memory:".
+    _, _, rest = database_url.partition("://")
+    return f"{driver}://{rest}"
+
+
+def uses_async_db(route: str) -> bool:
+    """
+    Check whether a route is configured to use the async database stack.
+
+    Args:
+        route: Route name as listed in `DB_ASYNC_ROUTES` (e.g. "users").
+
+    Returns:
+        bool: True if the route (or "*") is listed.
+    """
+    routes = {r.strip() for r in settings.DB_ASYNC_ROUTES.split(",") if r.strip()}
+    return "*" in routes or route in routes
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the process-wide async engine, creating it on first use.
+
+    Created lazily so deployments that never enable async routes don't need
+    the async drivers installed.
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            to_async_url(settings.DATABASE_URL),
+            echo=settings.DB_ECHO,
+            **pool_options(settings.DATABASE_URL, engine_label="async"),
+        )
+        register_engine("async", _async_engine)
+        instrument_engine(_async_engine, "async")
+        if sqlite_tuning_enabled(settings.DATABASE_URL):
+            configure_sqlite_engine(_async_engine)
+    return _async_engine
+
+
+def get_async_writer_engine() -> AsyncEngine | None:
+    """
+    Return the async single-connection writer engine (SQLite profile only).
+
+    Returns:
+        AsyncEngine | None: Writer engine, or None when the profile is off.
+    """
+    global _async_writer_engine
+    if _async_writer_engine is None and sqlite_tuning_enabled(settings.DATABASE_URL):
+        _async_writer_engine = create_async_engine(
+            to_async_url(settings.DATABASE_URL),
+            echo=settings.DB_ECHO,
+            **writer_pool_options(
+                pool_options(settings.DATABASE_URL, engine_label="async-writer")
+            ),
+        )
+        register_engine("async-writer", _async_writer_engine)
+        instrument_engine(_async_writer_engine, "async-writer")
+        configure_sqlite_engine(_async_writer_engine, writer=True)
+    return _async_writer_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Return the async session factory bound to `get_async_engine()`.
+
+    Notes:
+        - `expire_on_commit=False` avoids implicit lazy loads after commit,
+          which are not allowed on async sessions.
+    """
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        writer = get_async_writer_engine()
+        if writer is not None:
+            _async_sessionmaker = async_sessionmaker(
+                sync_session_class=routing_session_class(get_async_engine(), writer),
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        else:
+            _async_sessionmaker = async_sessionmaker(
+                bind=get_async_engine(),
+                autoflush=False,
+                expire_on_commit=False,
+            )
+    return _async_sessionmaker
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Provide an async SQLAlchemy session for a single request.
+
+    Yields:
+        sqlalchemy.ext.asyncio.AsyncSession: An active async database session.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_engines() -> None:
+    """
+    Close every pooled connection of the sync and async engines (shutdown).
+
+    Engines stay usable: a later checkout opens a new connection.
+    """
+    engine.dispose()
+    if writer_engine is not None:
+        writer_engine.dispose()
+    for async_engine in (_async_engine, _async_writer_engine):
+        if async_engine is not None:
+            await async_engine.dispose()
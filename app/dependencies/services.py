@@ -0,0 +1,51 @@
+"""
+Service dependencies.
+
+Builds the user service for a route, choosing between the sync stack
+(`UserService` over `get_db`) and the async stack (`AsyncUserService` over
+`get_async_db`) according to `settings.DB_ASYNC_ROUTES`.
+
+Both services expose the same `*_async` use-cases, so route handlers are
+written once and the database stack is switched by configuration.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.dependencies.db import get_async_db, get_db, uses_async_db
+from app.service.async_user_service import AsyncUserService
+from app.service.refresh_token_service import RefreshTokenService
+from app.service.user_service import UserService
+
+
+def _get_sync_user_service(db: Session = Depends(get_db)) -> UserService:
+    return UserService(db)
+
+
+def _get_async_user_service(db: AsyncSession = Depends(get_async_db)) -> AsyncUserService:
+    return AsyncUserService(db)
+
+
+def user_service_for(route: str) -> Callable[..., UserService | AsyncUserService]:
+    """
+    Return the user service dependency configured for `route`.
+
+    Args:
+        route: Route name as listed in `DB_ASYNC_ROUTES` (e.g. "users").
+
+    Returns:
+        Callable: Dependency to use with `Depends(...)`.
+    """
+    if uses_async_db(route):
+        return _get_async_user_service
+    return _get_sync_user_service
+
+
+def get_refresh_token_service(db: Session = Depends(get_db)) -> RefreshTokenService:
+    """Build the refresh-token service (sync DB stack: single indexed statements)."""
+    return RefreshTokenService(db)
@@ -11,6 +11,7 @@ from typing import Any
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 
@@ -45,6 +46,23 @@ def validation_exception_handler(_: Request, exc: RequestValidationError) -> JSO
     )
 
 
+def pool_timeout_exception_handler(_: Request, __: PoolTimeoutError) -> JSONResponse:
+    """
+    Handler for connection pool exhaustion (503).
+
+    Raised when no database connection frees up within `DB_POOL_TIMEOUT`;
+    clients are told to retry shortly instead of receiving a generic 500.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={
+            "error": _status_label(503),
+            "message": "Servicio saturado, intenta nuevamente",
+        },
+        headers={"Retry-After": "1"},
+    )
+
+
 def unhandled_exception_handler(_: Request, __: Exception) -> JSONResponse:
     """
     Catch-all handler for unexpected errors (500).
@@ -66,6 +84,8 @@ def _status_label(status_code: int) -> str:
         404: "Not Found",
         409: "Conflict",
         422: "Validation Error",
+        429: "Too Many Requests",
         500: "Internal Server Error",
+        503: "Service Unavailable",
     }
     return mapping.get(status_code, "HTTP Error")
@@ -33,3 +33,32 @@ class UnauthorizedException(HTTPException):
             detail=detail,
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+class ForbiddenException(HTTPException):
+    """Exception for authenticated users lacking permission (HTTP 403)."""
+
+    def __init__(self, detail: str = "Forbidden"):
+        super().__init__(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+class TooManyRequestsException(HTTPException):
+    """Exception for clients exceeding a rate limit (HTTP 429)."""
+
+    def __init__(self, detail: str = "Too Many Requests", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class ServiceUnavailableException(HTTPException):
+    """Exception for temporarily overloaded or unavailable services (HTTP 503)."""
+
+    def __init__(self, detail: str = "Service Unavailable", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,112 @@
+"""
+HTTP caching helpers: weak ETags, conditional GET and Cache-Control.
+
+Read endpoints compute a cheap version of what they would return (e.g. the
+`(id, updated_at)` pairs of a users page, or one user's `updated_at`) and
+derive a weak ETag from it. When the client's `If-None-Match` matches, the
+route answers 304 without loading or serializing the body; otherwise the
+response carries the ETag and the configured `Cache-Control`, so clients and
+CDNs can revalidate instead of downloading identical bodies again.
+
+ETags are weak (`W/"..."`): they identify the data version, not the exact
+bytes (e.g. the JSON encoder may change).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from fastapi import Request, Response
+
+from app.metrics import registry
+
+_conditional = registry.counter(
+    "http_conditional_requests_total",
+    "Conditional GETs by outcome (not_modified = 304 served without a body).",
+    labelnames=("route", "result"),
+)
+
+
+def _token(value: Any) -> str:
+    if isinstance(value, datetime):
+        # Normalize to naive UTC: SQLite returns naive values, fresh instances are aware.
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat()
+    return str(value)
+
+
+def weak_etag(*parts: Any, rows: Iterable[Iterable[Any]] = ()) -> str:
+    """
+    Build a weak ETag from version parts.
+
+    Args:
+        parts: Scalars identifying the representation (route, query, version).
+        rows: Optional version tuples (e.g. `(id, updated_at)` rows), hashed in order.
+
+    Returns:
+        str: `W/"<hex digest>"`.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(_token(part) for part in parts).encode("utf-8"))
+    for row in rows:
+        digest.update(b"\x1e" + "\x1f".join(_token(value) for value in row).encode("utf-8"))
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Tell whether `If-None-Match` matches `etag` (weak comparison, RFC 9110).
+
+    Args:
+        request: Incoming request.
+        etag: Current ETag of the resource.
+
+    Returns:
+        bool: True if the client's cached copy is current.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def cache_headers(etag: str, cache_control: str) -> dict[str, str]:
+    """Validator and freshness headers sent on 200 and 304 responses."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
+
+
+def conditional_response(
+    request: Request, route: str, etag: str, cache_control: str, vary: str | None = None
+) -> Response | None:
+    """
+    Answer a conditional GET.
+
+    Args:
+        request: Incoming request.
+        route: Route name (metrics label).
+        etag: Current ETag of the resource.
+        cache_control: `Cache-Control` value ("" = none).
+        vary: Optional `Vary` header (e.g. "Authorization" for per-user data).
+
+    Returns:
+        Response | None: A 304 response if the client's copy is current;
+        otherwise None (the caller builds the full response).
+    """
+    if etag_matches(request, etag):
+        _conditional.inc(route=route, result="not_modified")
+        headers = cache_headers(etag, cache_control)
+        if vary:
+            headers["Vary"] = vary
+        return Response(status_code=304, headers=headers)
+    if "if-none-match" in request.headers:
+        _conditional.inc(route=route, result="modified")
+    return None
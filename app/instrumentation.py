@@ -0,0 +1,188 @@
+"""
+Request and database performance instrumentation.
+
+Provides:
+- `RequestMetricsMiddleware`: a pure ASGI middleware (no `BaseHTTPMiddleware`
+  task/stream overhead) recording, per route template, request latency,
+  status codes, in-flight requests and database time, and adding a
+  `Server-Timing` header (`app`, `db`) to every response
+- `instrument_engine()`: SQLAlchemy cursor events counting queries and DB
+  time, attributed to the current request through a context variable
+
+Metrics are labelled by route template (e.g. `/api/v1/users`), never by raw
+path, so cardinality stays bounded; requests that match no route are
+labelled `unmatched`.
+
+Notes:
+    - Sync DB work runs in Starlette's threadpool, which copies the request's
+      context, so queries executed there are attributed to the request too.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import registry
+
+_request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency (until the response body is sent).",
+    labelnames=("method", "route"),
+)
+_requests = registry.counter(
+    "http_requests_total",
+    "HTTP requests by response status.",
+    labelnames=("method", "route", "status"),
+)
+_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.", labelnames=("method",)
+)
+_request_db_seconds = registry.histogram(
+    "http_request_db_seconds",
+    "Database time spent per HTTP request.",
+    labelnames=("method", "route"),
+)
+_request_db_queries = registry.histogram(
+    "http_request_db_queries",
+    "Database queries executed per HTTP request.",
+    labelnames=("method", "route"),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+_query_seconds = registry.histogram(
+    "db_query_duration_seconds", "Database statement execution time.", labelnames=("engine",)
+)
+
+
+class RequestStats:
+    """Per-request accumulator for database activity."""
+
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+_current_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> RequestStats | None:
+    """Return the database stats of the request being served, if any."""
+    return _current_stats.get()
+
+
+def instrument_engine(engine: Any, label: str) -> None:
+    """
+    Record query counts and durations for an engine.
+
+    Args:
+        engine: `Engine` or `AsyncEngine`.
+        label: Metrics label ("sync", "async", ...).
+    """
+    sync_engine: Engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, _cursor, _statement, _params, _context, _executemany) -> None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, _cursor, _statement, _params, _context, _executemany) -> None:
+        _record(conn, label)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context) -> None:
+        if context.connection is not None:
+            _record(context.connection, label)
+
+
+def _record(conn, label: str) -> None:
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    _query_seconds.observe(elapsed, engine=label)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+
+def _route_template(scope: Scope) -> str:
+    """
+    Return the full path template of the matched route (e.g. `/api/v1/users`).
+
+    Recent FastAPI versions keep included routers nested, so `route.path_format`
+    lacks the include prefix; the prefix is recovered from the request path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return "unmatched"
+
+    path = scope.get("path", "")
+    try:
+        concrete = template.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return template
+    if concrete and path.endswith(concrete):
+        return path[: len(path) - len(concrete)] + template
+    return template
+
+
+class RequestMetricsMiddleware:
+    """
+    Pure ASGI middleware timing HTTP requests.
+
+    Args:
+        app: Wrapped ASGI application.
+        server_timing: Add a `Server-Timing` header to responses.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    timing = (
+                        f"app;dur={elapsed_ms:.1f}, "
+                        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"'
+                    )
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timing.encode("latin-1")))
+                    message["headers"] = headers
+            await send(message)
+
+        _in_flight.inc(method=method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _in_flight.dec(method=method)
+            _current_stats.reset(token)
+
+            route = _route_template(scope)
+            _request_seconds.observe(time.perf_counter() - started, method=method, route=route)
+            _requests.inc(method=method, route=route, status=str(status_code))
+            _request_db_seconds.observe(stats.db_seconds, method=method, route=route)
+            _request_db_queries.observe(stats.queries, method=method, route=route)
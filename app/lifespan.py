@@ -0,0 +1,248 @@
+"""
+Application lifespan: ordered startup and shutdown hooks.
+
+Each subsystem that owns a background task or a resource registers a hook
+with an optional `startup` and `shutdown` callable (sync or async). Startup
+hooks run in registration order; shutdown hooks run in reverse order, only
+for hooks whose startup completed, so resources are released after
+everything that uses them (buffers flush to the database before its engine
+is disposed). A failing shutdown hook is logged and the rest still run.
+
+Hooks (`build_lifespan`):
+    1. database: dispose the engines on shutdown
+    2. hashing-pool: shut the bcrypt pool down
+    3. shared-cache: bind the app loop for cache work from background
+       threads; close the shared cache backend
+    4. password-rehasher: finish pending rehashes
+    5. last-login-buffer: flush buffered `last_login_at` writes
+    6. readiness: background readiness checks
+    7. email-filter: background Bloom filter rebuilds (when enabled)
+    8. refresh-compaction: background refresh-token compaction (when enabled)
+    9. warm-up: pre-open pool connections, load bcrypt/JWT (one dummy hash,
+       verify and token round trip), build the OpenAPI schema and connect
+       the shared cache
+
+The warm-up runs off the event loop without delaying startup; while it runs
+`/readyz` answers 503 "warming", so orchestrators only route traffic to a
+process whose first requests cost the same as steady state.
+
+Each hook's duration is exported as `lifespan_hook_seconds{hook,phase}`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import FastAPI
+
+from app.cache.emails import get_email_filter
+from app.cache.revocations import get_revocation_compactor
+from app.cache.shared import bind_loop, get_cache
+from app.config import settings
+from app.db_pool import engines, prewarm
+from app.dependencies.db import dispose_engines
+from app.metrics import registry
+from app.readiness import get_readiness_probe
+from app.repositories.last_login_buffer import shutdown_last_login_buffer
+from app.service.hashing import get_hashing_executor
+from app.service.password_rehash import shutdown_password_rehasher
+from app.startup import warm_up
+
+log = logging.getLogger(__name__)
+
+_hook_seconds = registry.histogram(
+    "lifespan_hook_seconds", "Duration of lifespan hooks.", labelnames=("hook", "phase")
+)
+
+#: A hook callable; may return an awaitable.
+HookFn = Callable[[], Any]
+
+
+class LifespanHook:
+    """
+    One startup/shutdown step.
+
+    Args:
+        name: Hook name (logs and metrics).
+        startup: Called at startup (optional).
+        shutdown: Called at shutdown (optional).
+    """
+
+    __slots__ = ("name", "startup", "shutdown")
+
+    def __init__(self, name: str, startup: HookFn | None = None, shutdown: HookFn | None = None) -> None:
+        self.name = name
+        self.startup = startup
+        self.shutdown = shutdown
+
+
+async def _call(hook: LifespanHook, phase: str, fn: HookFn) -> None:
+    started = time.perf_counter()
+    result = fn()
+    if inspect.isawaitable(result):
+        await result
+    elapsed = time.perf_counter() - started
+    _hook_seconds.observe(elapsed, hook=hook.name, phase=phase)
+    log.debug("Lifespan %s %s: %.1f ms", phase, hook.name, elapsed * 1000)
+
+
+class LifespanManager:
+    """
+    Ordered registry of lifespan hooks, usable as a FastAPI `lifespan`.
+
+    Attributes:
+        app: Application being served (set when the lifespan starts).
+    """
+
+    def __init__(self) -> None:
+        self.hooks: list[LifespanHook] = []
+        self.app: FastAPI | None = None
+        self._started: list[LifespanHook] = []
+
+    def add(self, name: str, startup: HookFn | None = None, shutdown: HookFn | None = None) -> None:
+        """
+        Register a hook (startup in this order, shutdown in reverse).
+
+        Args:
+            name: Hook name.
+            startup: Callable run at startup.
+            shutdown: Callable run at shutdown.
+        """
+        self.hooks.append(LifespanHook(name, startup, shutdown))
+
+    async def startup(self) -> None:
+        """
+        Run the startup hooks in order.
+
+        Raises:
+            Exception: Whatever a startup hook raised; hooks already started
+                are shut down first.
+        """
+        for hook in self.hooks:
+            if hook.startup is not None:
+                try:
+                    await _call(hook, "startup", hook.startup)
+                except Exception:
+                    log.exception("Lifespan startup failed: %s", hook.name)
+                    await self.shutdown()
+                    raise
+            self._started.append(hook)
+
+    async def shutdown(self) -> None:
+        """Run the shutdown hooks of started hooks in reverse order."""
+        started, self._started = self._started, []
+        for hook in reversed(started):
+            if hook.shutdown is None:
+                continue
+            try:
+                await _call(hook, "shutdown", hook.shutdown)
+            except Exception:  # noqa: BLE001 - release the remaining resources anyway
+                log.exception("Lifespan shutdown failed: %s", hook.name)
+
+    @asynccontextmanager
+    async def __call__(self, app: FastAPI) -> AsyncIterator[None]:
+        self.app = app
+        await self.startup()
+        try:
+            yield
+        finally:
+            await self.shutdown()
+
+
+def _bind_cache_loop() -> None:
+    bind_loop(asyncio.get_running_loop())
+
+
+async def _close_cache() -> None:
+    bind_loop(None)
+    await get_cache().close()
+
+
+def _warm_database() -> None:
+    for label, engine in engines().items():
+        if not label.startswith("async"):
+            prewarm(engine, settings.STARTUP_WARM_DB_CONNECTIONS)
+
+
+class _Background:
+    """
+    Start/stop adapter for a background service resolved at startup.
+
+    `factory` returns the process-wide service, or None when it is disabled
+    by settings; the instance started is the one stopped.
+    """
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.factory = factory
+        self._service: Any = None
+
+    def start(self) -> None:
+        self._service = self.factory()
+        if self._service is not None:
+            self._service.start()
+
+    async def stop(self) -> None:
+        service, self._service = self._service, None
+        if service is not None:
+            await service.stop()
+
+
+class _WarmUp:
+    """Background warm-up; `/readyz` reports "warming" until it finishes."""
+
+    def __init__(self, lifespan: LifespanManager) -> None:
+        self.lifespan = lifespan
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if settings.STARTUP_WARMUP:
+            get_readiness_probe().warming = True
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="startup-warm-up")
+
+    async def _run(self) -> None:
+        try:
+            if settings.STARTUP_WARM_DB_CONNECTIONS > 0:
+                await asyncio.to_thread(_warm_database)
+            await asyncio.to_thread(warm_up, self.lifespan.app)
+            await get_cache().ping()
+        except Exception:  # noqa: BLE001 - warm-up is best effort
+            log.exception("Startup warm-up failed")
+        finally:
+            get_readiness_probe().warming = False
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            await task
+
+
+def build_lifespan() -> LifespanManager:
+    """
+    Register the application's hooks (see the module docstring for the order).
+
+    Returns:
+        LifespanManager: Manager to pass as `FastAPI(lifespan=...)`.
+    """
+    lifespan = LifespanManager()
+    lifespan.add("database", shutdown=dispose_engines)
+    lifespan.add("hashing-pool", shutdown=lambda: asyncio.to_thread(get_hashing_executor().shutdown))
+    lifespan.add("shared-cache", startup=_bind_cache_loop, shutdown=_close_cache)
+    lifespan.add("password-rehasher", shutdown=lambda: asyncio.to_thread(shutdown_password_rehasher))
+    lifespan.add("last-login-buffer", shutdown=lambda: asyncio.to_thread(shutdown_last_login_buffer))
+
+    for name, factory in (
+        ("readiness", get_readiness_probe),
+        ("email-filter", get_email_filter),
+        ("refresh-compaction", get_revocation_compactor),
+    ):
+        service = _Background(factory)
+        lifespan.add(name, startup=service.start, shutdown=service.stop)
+
+    warm = _WarmUp(lifespan)
+    lifespan.add("warm-up", startup=warm.start, shutdown=warm.stop)
+    return lifespan
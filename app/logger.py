@@ -1,31 +1,274 @@
 """
 Configuración del sistema de logging para la aplicación.
 Inicializa un logger global con formato estructurado para producción o desarrollo.
+
+Pipeline no bloqueante:
+    - Los hilos de request solo encolan el registro (`QueueHandler`); el
+      formateo (JSON por línea) y la escritura a stdout ocurren en el hilo del
+      `QueueListener`, fuera del camino de la request y sin competir por el
+      lock del handler.
+    - Muestreo (`LOG_SAMPLE_RATES`) y límite por segundo (`LOG_RATE_LIMITS`)
+      por logger, aplicados antes de encolar; WARNING o superior nunca se
+      descarta.
+    - La cola es acotada (`LOG_QUEUE_SIZE`): si el destino no da abasto, los
+      registros nuevos se descartan (y se cuentan) en lugar de acumular
+      memoria o bloquear la request.
+    - Cada registro incluye el `request_id` de la request en curso
+      (`request_id_var`, fijado por `RequestIdMiddleware`).
 """
 
+from __future__ import annotations
+
+import atexit
+import copy
+import json
 import logging
+import queue
+import random
 import sys
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO
+
 from app.config import settings
+from app.metrics import registry
+
+#: ID de la request en curso (None fuera de una request).
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+_dropped = registry.counter(
+    "log_records_dropped_total",
+    "Log records dropped by sampling or rate limiting.",
+    labelnames=("logger", "reason"),
+)
+
+_TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(request_id)s | %(message)s"
+
+_listener: QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatea cada registro como una línea JSON.
+
+    Campos: `ts`, `level`, `logger`, `message`, `request_id` y, si aplica,
+    `exc_info`.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+        }
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        elif record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class RequestIdFilter(logging.Filter):
+    """Agrega `record.request_id` desde `request_id_var`."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+def _parse_rules(raw: str) -> dict[str, float]:
+    """Parsea `logger=valor,otro=valor` (valores numéricos)."""
+    rules: dict[str, float] = {}
+    for item in raw.split(","):
+        name, sep, value = item.rpartition("=")
+        if sep and name.strip():
+            rules[name.strip()] = float(value)
+    return rules
+
+
+def _match(rules: dict[str, float], name: str) -> str | None:
+    """Retorna la regla más específica que aplica a `name` (o a un ancestro)."""
+    while name:
+        if name in rules:
+            return name
+        name = name.rpartition(".")[0]
+    return None
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Muestreo y límite por segundo por logger para mensajes del camino caliente.
+
+    Args:
+        sample_rates: logger -> fracción de registros conservados (0.0 - 1.0).
+        rate_limits: logger -> máximo de registros por segundo (token bucket).
+
+    Notes:
+        - Las reglas aplican al logger indicado y a sus hijos.
+        - WARNING o superior siempre pasa.
+    """
+
+    def __init__(self, sample_rates: dict[str, float], rate_limits: dict[str, float]) -> None:
+        super().__init__()
+        self.sample_rates = sample_rates
+        self.rate_limits = rate_limits
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
 
+        rule = _match(self.sample_rates, record.name)
+        if rule is not None and random.random() >= self.sample_rates[rule]:
+            _dropped.inc(logger=rule, reason="sampled")
+            return False
 
-def setup_logger() -> None:
+        rule = _match(self.rate_limits, record.name)
+        if rule is not None and not self._take_token(rule):
+            _dropped.inc(logger=rule, reason="rate_limited")
+            return False
+        return True
+
+    def _take_token(self, rule: str) -> bool:
+        rate = self.rate_limits[rule]
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(rule, (rate, now))
+            tokens = min(rate, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            self._buckets[rule] = (tokens - 1 if allowed else tokens, now)
+        return allowed
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    `QueueHandler` que solo resuelve el mensaje antes de encolar.
+
+    El `QueueHandler` estándar formatea el registro completo en el hilo que
+    loguea; aquí el formateo (JSON) queda para el hilo del listener.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _dropped.inc(logger=record.name, reason="queue_full")
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copy so other handlers (e.g. test capture) see the original record.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class _BoundedQueueListener(QueueListener):
+    """
+    `QueueListener` cuyo `stop()` nunca lanza ni se cuelga.
+
+    El estándar encola el centinela con `put_nowait` (lanza `queue.Full` si la
+    cola acotada está llena) y espera al hilo sin límite (se cuelga si el
+    destino está bloqueado). Aquí el centinela espera lugar y, si no lo hay,
+    descarta el registro pendiente más antiguo; la espera al hilo tiene
+    límite (`stop_timeout`).
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        stop_timeout: float = 5.0,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.stop_timeout = stop_timeout
+
+    def enqueue_sentinel(self) -> None:
+        while True:
+            try:
+                self.queue.put(self._sentinel, timeout=min(self.stop_timeout, 0.5))
+                return
+            except queue.Full:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    continue
+                if record is not self._sentinel:
+                    _dropped.inc(logger=getattr(record, "name", "-"), reason="shutdown")
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self.enqueue_sentinel()
+        self._thread.join(self.stop_timeout)
+        self._thread = None
+
+
+def setup_logger(stream: IO[str] | None = None, announce: bool = True) -> None:
     """
     Inicializa el logger global con nivel y formato adecuado
     según el entorno configurado en las variables de entorno.
+
+    Args:
+        stream: Destino de los logs (por defecto `sys.stdout`).
+        announce: Registrar el mensaje de inicialización (el servidor
+            reinicia el logging en cada fork sin anunciarlo).
     """
-    log_level = logging.DEBUG if settings.DEBUG else logging.INFO
+    global _listener
+    log_level = logging.DEBUG if settings.DEBUG else logging.getLevelName(settings.LOG_LEVEL.upper())
+
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else logging.Formatter(_TEXT_FORMAT))
 
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s | %(levelname)s | %(message)s',
-        handlers=[logging.StreamHandler(sys.stdout)]
+    handler = _DeferredQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    # Sampling first: dropped records cost nothing else.
+    handler.addFilter(
+        SamplingFilter(_parse_rules(settings.LOG_SAMPLE_RATES), _parse_rules(settings.LOG_RATE_LIMITS))
     )
+    handler.addFilter(RequestIdFilter())
 
-    logging.info("Logger inicializado en nivel %s", logging.getLevelName(log_level))
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(log_level)
+
+    _listener = _BoundedQueueListener(handler.queue, output, respect_handler_level=True)
+    _listener.start()
+
+    if announce:
+        logging.info("Logger inicializado en nivel %s", logging.getLevelName(log_level))
+
+
+def shutdown_logging() -> None:
+    """
+    Detiene el listener y escribe los registros pendientes.
+
+    Nunca lanza: se llama desde `atexit` y antes de cada `fork` del servidor.
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        try:
+            listener.stop()
+        except Exception:  # noqa: BLE001 - logging shutdown must not fail the process
+            pass
 
 
 # Llamada para inicializar el logger global
 setup_logger()
+atexit.register(shutdown_logging)
 
 # Instancia del logger para importar en cualquier parte del código
-logger = logging.getLogger(settings.APP_NAME)
\ No newline at end of file
+logger = logging.getLogger(settings.APP_NAME)
@@ -1,9 +1,12 @@
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.error_handlers import (
     http_exception_handler,
+    pool_timeout_exception_handler,
     validation_exception_handler,
     unhandled_exception_handler,
 )
@@ -11,13 +14,16 @@ from app.error_handlers import (
 from app.api.v1.routes import router
 from app.api.v1.health_routes import router as health_router
 from app.api.v1.healthz_routes import router as healthz_router
+from app.api.v1.readyz_routes import router as readyz_router
 from app.api.v1.auth_routes import router as auth_router
 from app.api.v1.secure_routes import router as secure_router
+from app.api.v1.admin_routes import router as admin_router
 from app.exceptions import NotFoundException, BadRequestException
 from app.middleware import setup_middlewares
+from app.lifespan import build_lifespan
 
 from app.config import settings
-from app.api.v1.debug_routes import router as debug_router
+from app.api.v1.metrics_routes import router as metrics_router
 
 
 
@@ -34,6 +40,10 @@ tags_metadata = [
         "name": "Debug",
         "description": "Endpoints de prueba (solo disponibles en development).",
     },
+    {
+        "name": "Diagnostics",
+        "description": "Estado interno del servicio (pool de conexiones, etc.).",
+    },
     {
         "name": "Health",
         "description": "Endpoints de salud y verificación de disponibilidad del servicio.",
@@ -46,6 +56,10 @@ tags_metadata = [
         "name": "Secure",
         "description": "Endpoints protegidos que requieren JWT válido.",
     },
+    {
+        "name": "Admin",
+        "description": "Operaciones administrativas (requiere email en ADMIN_EMAILS).",
+    },
     {
         "name": "Core",
         "description": "Rutas base y recursos principales de la API.",
@@ -58,6 +72,7 @@ app = FastAPI(
     version="1.0.0",
     description="Starter API con patron Repository + Service",
     openapi_tags=tags_metadata,
+    lifespan=build_lifespan(),
     contact={
         "name": "Elyares",
         "url": "https://elyares.org",
@@ -73,6 +88,7 @@ app = FastAPI(
 # -----------------------------
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
+app.add_exception_handler(PoolTimeoutError, pool_timeout_exception_handler)
 app.add_exception_handler(Exception, unhandled_exception_handler)
 
 
@@ -85,9 +101,19 @@ setup_middlewares(app)
 app.include_router(router, prefix="/api/v1")
 app.include_router(health_router, prefix="/api/v1")
 app.include_router(healthz_router, prefix="/api/v1")
+app.include_router(readyz_router, prefix="/api/v1")
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(secure_router, prefix="/api/v1")
+app.include_router(admin_router, prefix="/api/v1")
+
+# Métricas Prometheus en la raíz (convención de scraping: GET /metrics)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
 
-# Rutas debug solo en development / debug
+# Rutas debug solo en development / debug (importadas solo si se montan)
 if settings.DEBUG or settings.APP_ENV != "production":
+    from app.api.v1.debug_routes import router as debug_router
+    from app.api.v1.diagnostics_routes import router as diagnostics_router
+
     app.include_router(debug_router, prefix="/api/v1")
+    app.include_router(diagnostics_router, prefix="/api/v1")
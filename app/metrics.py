@@ -0,0 +1,308 @@
+"""
+In-process metrics registry.
+
+Provides a small, dependency-free set of metric primitives (counters, gauges
+and histograms) that subsystems use to publish operational data, e.g. how long
+password hashing jobs wait in the queue versus how long bcrypt itself takes.
+
+Design:
+    - Metrics are registered once (get-or-create by name) in a global registry.
+    - Each metric keeps one series per label-value tuple.
+    - All updates are guarded by a lock so metrics can be updated from the
+      event loop, Starlette's threadpool and executor callbacks alike.
+    - Values that are cheaper to read on demand (e.g. pool status) are
+      refreshed by collectors registered with `register_collector()`, which
+      run on every `collect()`.
+    - `render_prometheus()` exports the registry in the Prometheus text
+      exposition format (served at `/metrics`).
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+#: Default histogram buckets (seconds), tuned for request/DB/hash latencies.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _Metric:
+    """
+    Base class for labelled metrics.
+
+    Args:
+        name: Metric name (Prometheus naming conventions, e.g. `foo_seconds`).
+        help_text: Human-readable description.
+        labelnames: Ordered label names accepted by the metric.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """
+        Build the series key for a set of labels.
+
+        Raises:
+            ValueError: If the labels do not match the declared label names.
+        """
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the series identified by `labels`."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the series identified by `labels`."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> dict[tuple[str, ...], float]:
+        """Return a snapshot of all series."""
+        with self._lock:
+            return dict(self._values)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (e.g. in-flight requests, pool usage)."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the series identified by `labels` to `value`."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the series identified by `labels`."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the series identified by `labels`."""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the series identified by `labels`."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> dict[tuple[str, ...], float]:
+        """Return a snapshot of all series."""
+        with self._lock:
+            return dict(self._values)
+
+
+class Histogram(_Metric):
+    """
+    Histogram with fixed buckets.
+
+    Per-bucket counts are stored non-cumulatively; exporters accumulate them.
+
+    Args:
+        buckets: Upper bounds (inclusive) in ascending order; `+Inf` is implicit.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        # key -> [bucket counts..., count, sum]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for the series identified by `labels`."""
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = series
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for the series identified by `labels`."""
+        with self._lock:
+            series = self._values.get(self._key(labels))
+            return int(series[-2]) if series else 0
+
+    def total(self, **labels: str) -> float:
+        """Return the sum of observations for the series identified by `labels`."""
+        with self._lock:
+            series = self._values.get(self._key(labels))
+            return series[-1] if series else 0.0
+
+    def samples(self) -> dict[tuple[str, ...], list[float]]:
+        """Return a snapshot of all series (per-bucket counts, count, sum)."""
+        with self._lock:
+            return {key: list(series) for key, series in self._values.items()}
+
+
+class MetricsRegistry:
+    """
+    Registry of named metrics.
+
+    Metrics are created lazily with get-or-create semantics so modules can
+    declare the metrics they publish at import time without coordination.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type[_Metric], name: str, *args, **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, *args, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Counter:
+        """Return the counter `name`, creating it if needed."""
+        return self._get_or_create(Counter, name, help_text, labelnames)  # type: ignore[return-value]
+
+    def gauge(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Gauge:
+        """Return the gauge `name`, creating it if needed."""
+        return self._get_or_create(Gauge, name, help_text, labelnames)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram `name`, creating it if needed."""
+        return self._get_or_create(  # type: ignore[return-value]
+            Histogram, name, help_text, labelnames, buckets=buckets
+        )
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callable that refreshes gauges right before collection."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def collect(self) -> list[_Metric]:
+        """Run collectors, then return all registered metrics ordered by name."""
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            collector()
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+
+#: Content type of the Prometheus text exposition format.
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def render_prometheus(source: MetricsRegistry | None = None) -> str:
+    """
+    Render metrics in the Prometheus text exposition format (version 0.0.4).
+
+    Args:
+        source: Registry to export (defaults to the global registry).
+
+    Returns:
+        str: Exposition text, one `# HELP`/`# TYPE` block per metric.
+    """
+    lines: list[str] = []
+    for metric in (source or registry).collect():
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        names = metric.labelnames
+
+        if isinstance(metric, Histogram):
+            for key, series in sorted(metric.samples().items()):
+                cumulative = 0.0
+                for bound, count in zip(metric.buckets, series):
+                    cumulative += count
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(f"{metric.name}_bucket{_labels(names, key, le)} {_format_value(cumulative)}")
+                total_count, total_sum = series[-2], series[-1]
+                inf = _labels(names, key, 'le="+Inf"')
+                lines.append(f"{metric.name}_bucket{inf} {_format_value(total_count)}")
+                lines.append(f"{metric.name}_sum{_labels(names, key)} {_format_value(total_sum)}")
+                lines.append(f"{metric.name}_count{_labels(names, key)} {_format_value(total_count)}")
+        else:
+            for key, value in sorted(metric.samples().items()):  # type: ignore[attr-defined]
+                lines.append(f"{metric.name}{_labels(names, key)} {_format_value(value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+#: Global registry shared by the whole application.
+registry = MetricsRegistry()
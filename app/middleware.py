@@ -1,17 +1,73 @@
 """
 Configuracion de middlewares globales para la aplicacion FastApi
-Incluyendo el soporte para CORS
+Incluyendo el soporte para CORS, la compresión de respuestas, las métricas
+de rendimiento por request y la correlación de logs por request-id
 """
 
+import uuid
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.compression import CompressionMiddleware
 from app.config import settings
+from app.instrumentation import RequestMetricsMiddleware
+from app.logger import request_id_var
+
+#: Header usado para propagar el ID de la request.
+REQUEST_ID_HEADER = "x-request-id"
+
+
+class RequestIdMiddleware:
+    """
+    Middleware ASGI que asigna un ID a cada request.
+
+    Reutiliza el header `X-Request-ID` entrante si es válido (lo envía un
+    proxy/gateway) o genera uno nuevo; lo expone a los logs vía
+    `request_id_var` y lo devuelve en la respuesta.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER.encode("latin-1"):
+                candidate = value.decode("latin-1")
+                if 0 < len(candidate) <= 128 and candidate.isprintable():
+                    request_id = candidate
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER.encode("latin-1"), request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
 
 
 def setup_middlewares(app: FastAPI) -> None:
 
     """
     Configura middlewares globales como CORS según el entorno de ejecución.
+
+    La compresión va justo por fuera de CORS. El middleware de métricas se
+    agrega al final para quedar como el más externo y medir también el tiempo
+    de los demás middlewares (incluida la compresión); el de request-id va
+    después (aún más externo) para que todo log de la request lleve su ID.
     """
     # CSV -> list, ejemplo:
     # ALLOWED_ORIGINS=http://localhost,http://127.0.0.1,http://localhost:5173
@@ -28,4 +84,25 @@ def setup_middlewares(app: FastAPI) -> None:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
-    )
\ No newline at end of file
+    )
+
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            encodings=[e.strip().lower() for e in settings.COMPRESSION_ENCODINGS.split(",") if e.strip()],
+            levels={
+                "gzip": settings.COMPRESSION_GZIP_LEVEL,
+                "br": settings.COMPRESSION_BROTLI_QUALITY,
+                "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+            },
+            minimum_size=settings.COMPRESSION_MIN_SIZE,
+            static_paths=[app.openapi_url] if app.openapi_url else [],
+        )
+
+    if settings.METRICS_ENABLED:
+        app.add_middleware(
+            RequestMetricsMiddleware,
+            server_timing=settings.SERVER_TIMING_ENABLED,
+        )
+
+    app.add_middleware(RequestIdMiddleware)
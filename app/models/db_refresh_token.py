@@ -0,0 +1,45 @@
+"""
+Database model for refresh-token families.
+
+A family is created at login and follows every token rotated from it. Only
+its state is stored (never the tokens): refresh tokens are HMAC-signed
+`<family id>.<generation>` pairs (see `AuthService.create_refresh_token`),
+and a token is valid while its generation is the family's current one.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.dependencies.db import Base
+
+
+class DBRefreshTokenFamily(Base):
+    """
+    SQLAlchemy ORM model for the `refresh_token_families` table.
+
+    Notes:
+        - `generation` is bumped on every rotation; presenting an older
+          generation means the token was reused (likely stolen), and the
+          whole family is revoked.
+        - `expires_at` is absolute (set at login); expired rows are deleted by
+          the periodic compaction (`app.cache.revocations`).
+    """
+
+    __tablename__ = "refresh_token_families"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    generation: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True, nullable=False)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -8,7 +8,7 @@ Pydantic schemas (transport layer) and domain models (business layer).
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy import Boolean, DateTime, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
@@ -16,6 +16,11 @@ from sqlalchemy.orm import Mapped, mapped_column
 from app.dependencies.db import Base
 
 
+def _utcnow() -> datetime:
+    # Python-side default: microsecond precision (SQLite's CURRENT_TIMESTAMP has 1 s).
+    return datetime.now(timezone.utc)
+
+
 class DBUser(Base):
     """
     SQLAlchemy ORM model for the `users` table.
@@ -29,6 +34,10 @@ class DBUser(Base):
     Notes:
         - `created_at` is generated at the database level using `func.now()`.
         - `last_login_at` is updated after successful authentication.
+        - `updated_at` tracks changes to the public profile (the fields in
+          `UserResponse`); it is the version behind HTTP ETags. Repositories
+          set it on profile writes; last-login updates leave it untouched so
+          logins don't invalidate client caches.
     """
 
     __tablename__ = "users"
@@ -51,3 +60,9 @@ class DBUser(Base):
         nullable=False,
     )
     last_login_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=_utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
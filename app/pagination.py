@@ -0,0 +1,61 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque to clients: they encode the last primary key of the previous
+page as URL-safe base64 JSON. Keyset pagination (`WHERE id > :after ORDER BY id
+LIMIT :n`) walks the primary key index, so every page costs the same regardless
+of how deep the client has paged, unlike `OFFSET`.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+
+from app.exceptions import BadRequestException
+
+#: Largest primary key a cursor may carry (signed 64-bit, the widest database INTEGER).
+MAX_CURSOR_ID = 2**63 - 1
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Build an opaque cursor pointing after `last_id`.
+
+    Args:
+        last_id: Primary key of the last item in the current page.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: Cursor string from the client (or None for the first page).
+
+    Raises:
+        BadRequestException: If the cursor is malformed or its id is out of
+            range (negative or above `MAX_CURSOR_ID`).
+
+    Returns:
+        int | None: Last seen primary key, or None if no cursor was given.
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = payload["id"]
+        if not isinstance(last_id, int) or isinstance(last_id, bool) or not 0 <= last_id <= MAX_CURSOR_ID:
+            raise ValueError("invalid id")
+    except (ValueError, TypeError, KeyError, UnicodeEncodeError):
+        raise BadRequestException("Cursor de paginación inválido")
+
+    return last_id
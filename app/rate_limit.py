@@ -0,0 +1,210 @@
+"""
+Rate limiting (sliding-window counters).
+
+Used to throttle `/api/v1/login` before any bcrypt work happens, so a
+credential-stuffing burst is rejected with 429 instead of exhausting the
+hashing pool.
+
+Algorithm (sliding window counter):
+    Time is split into fixed windows of `window` seconds. Each key keeps one
+    counter per window; the request rate is estimated as
+
+        previous_window_count * (1 - elapsed_fraction) + current_window_count
+
+    which smooths the burst allowed at window boundaries by a plain fixed
+    window, while needing only two integers per key.
+
+Storage:
+    Counters live in a `SharedCache` and expire after two windows, so idle
+    keys disappear on their own. With `RATE_LIMIT_BACKEND="memory"` they are
+    kept in a process-local bounded LRU (`RATE_LIMIT_MEMORY_MAXSIZE`), so even
+    millions of distinct keys use bounded memory; eviction only forgets old
+    counters. With `"shared"` the configured shared cache (SQLite/Redis) is
+    used, so limits hold across worker processes and hosts.
+
+Notes:
+    - Every attempt counts, including rejected ones: a client hammering
+      past the limit stays blocked until it slows down.
+    - A cache outage fails open (the attempt is allowed), like the rest of
+      the shared cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import time
+from typing import Callable
+
+from fastapi import Request
+
+from app.cache.backends import MemoryCacheBackend
+from app.cache.shared import SharedCache, get_cache
+from app.config import settings
+from app.exceptions import TooManyRequestsException
+from app.metrics import registry
+
+_rejected = registry.counter(
+    "rate_limit_rejected_total", "Requests rejected by a rate limiter.", labelnames=("limiter",)
+)
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding-window counter limiting events per key.
+
+    Args:
+        cache: Counter storage.
+        name: Limiter name (key prefix and metrics label).
+        limit: Max events per window (<= 0 disables the limiter).
+        window: Window length in seconds.
+        clock: Wall-clock time source (shared by every process using the cache).
+    """
+
+    def __init__(
+        self,
+        cache: SharedCache,
+        name: str,
+        limit: int,
+        window: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache = cache
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self._clock = clock
+
+    def _key(self, key: str, index: int) -> str:
+        return f"rl:{self.name}:{key}:{index}"
+
+    async def hit(self, key: str) -> float:
+        """
+        Record one event for `key`.
+
+        Returns:
+            float: 0 if the event is allowed, otherwise seconds until it would be.
+        """
+        if self.limit <= 0:
+            return 0.0
+
+        now = self._clock()
+        index, offset = divmod(now, self.window)
+        index = int(index)
+        elapsed = offset / self.window
+
+        current = await self.cache.incr(self._key(key, index), ttl=self.window * 2)
+        if current is None:  # cache unavailable: fail open
+            return 0.0
+        previous = int(await self.cache.get(self._key(key, index - 1)) or 0)
+
+        if previous * (1 - elapsed) + current <= self.limit:
+            return 0.0
+        _rejected.inc(limiter=self.name)
+        return self._retry_after(previous, current, elapsed)
+
+    def _retry_after(self, previous: int, current: int, elapsed: float) -> float:
+        # Time until one more event fits, assuming no other events meanwhile.
+        room = self.limit - 1
+        if current <= room:
+            # Later in this window, once enough of the previous window has slid out.
+            return max((1 - (room - current) / previous - elapsed) * self.window, 0.0)
+        # In the next window, once enough of this window's count has slid out.
+        return (1 - elapsed + 1 - room / current) * self.window
+
+    async def reset(self, key: str) -> None:
+        """Forget the events recorded for `key`."""
+        index = int(self._clock() // self.window)
+        await self.cache.delete(self._key(key, index))
+        await self.cache.delete(self._key(key, index - 1))
+
+
+def client_ip(request: Request) -> str:
+    """
+    Return the client IP used as the rate-limit key.
+
+    Honors the first `X-Forwarded-For` entry only when
+    `RATE_LIMIT_TRUST_FORWARDED_FOR` is set (i.e. behind a trusted proxy);
+    otherwise clients could pick their own key.
+    """
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",", 1)[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _account_key(email: str) -> str:
+    # Hashed: bounded key size and no plaintext emails in a shared cache.
+    return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()[:32]
+
+
+class LoginRateLimiter:
+    """
+    Login throttling per client IP and per account.
+
+    Args:
+        cache: Counter storage.
+        per_ip: Max login attempts per IP and window.
+        per_account: Max login attempts per email and window.
+        window: Window length in seconds.
+    """
+
+    def __init__(self, cache: SharedCache, per_ip: int, per_account: int, window: float) -> None:
+        self.by_ip = SlidingWindowLimiter(cache, "login-ip", per_ip, window)
+        self.by_account = SlidingWindowLimiter(cache, "login-account", per_account, window)
+
+    async def check(self, ip: str, email: str) -> None:
+        """
+        Count a login attempt, before any password verification.
+
+        Raises:
+            TooManyRequestsException: If the IP or the account is over its limit.
+        """
+        retry_after = await self.by_ip.hit(ip)
+        if not retry_after:
+            retry_after = await self.by_account.hit(_account_key(email))
+        if retry_after:
+            raise TooManyRequestsException(
+                "Demasiados intentos de inicio de sesión, intenta más tarde",
+                retry_after=max(math.ceil(retry_after), 1),
+            )
+
+    async def reset_account(self, email: str) -> None:
+        """Clear the account counter after a successful login."""
+        await self.by_account.reset(_account_key(email))
+
+
+_login_limiter: LoginRateLimiter | None = None
+
+
+def get_login_rate_limiter() -> LoginRateLimiter | None:
+    """
+    Return the process-wide login limiter configured from settings.
+
+    Returns:
+        LoginRateLimiter | None: Limiter, or None when `RATE_LIMIT_ENABLED` is off.
+    """
+    global _login_limiter
+    if not settings.RATE_LIMIT_ENABLED:
+        return None
+    if _login_limiter is None:
+        if settings.RATE_LIMIT_BACKEND == "shared":
+            cache = get_cache()
+        else:
+            cache = SharedCache(
+                MemoryCacheBackend(maxsize=settings.RATE_LIMIT_MEMORY_MAXSIZE, name="rate-limit")
+            )
+        _login_limiter = LoginRateLimiter(
+            cache,
+            per_ip=settings.LOGIN_RATE_LIMIT_PER_IP,
+            per_account=settings.LOGIN_RATE_LIMIT_PER_ACCOUNT,
+            window=settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS,
+        )
+    return _login_limiter
+
+
+def set_login_rate_limiter(limiter: LoginRateLimiter | None) -> None:
+    """Replace the process-wide login limiter (tests)."""
+    global _login_limiter
+    _login_limiter = limiter
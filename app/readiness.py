@@ -0,0 +1,232 @@
+"""
+Readiness probe with cached dependency checks.
+
+`/readyz` must be cheap: orchestrators may probe every second from several
+places, and a probe that queries the database on every call turns a probe
+storm into database load. Checks therefore run on a background task every
+`READINESS_INTERVAL_SECONDS`; the endpoint only returns the last snapshot.
+
+Checks:
+- database (critical): pool checkout + `SELECT 1` on the sync engine
+- hashing (critical): hashing pool saturation below
+  `READINESS_MAX_HASH_SATURATION` (a full pool answers logins with 503)
+- cache (non-critical): shared cache backend reachable (`PING`); the cache
+  fails open, so an outage degrades latency but not correctness
+
+Status:
+    - "ok": every check passed
+    - "degraded": only non-critical checks failed (still ready, HTTP 200)
+    - "fail": a critical check failed (HTTP 503)
+    - "starting" / "stale": no snapshot yet, or the last one is older than
+      three intervals (background task stuck); both are HTTP 503
+    - "warming": the startup warm-up (`app.lifespan`) is still running, so
+      traffic is not routed to a cold process yet (HTTP 503)
+
+A failed check reports only "error" or "timeout" as its detail; the
+exception itself is logged, never returned by the (unauthenticated) endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+
+from app.cache.shared import get_cache
+from app.config import settings
+from app.dependencies.db import engine
+from app.metrics import registry
+from app.service.hashing import get_hashing_executor
+
+log = logging.getLogger(__name__)
+
+_check_ok = registry.gauge(
+    "readiness_check_ok", "Last readiness check result (1 = passed).", labelnames=("check",)
+)
+_check_seconds = registry.histogram(
+    "readiness_check_duration_seconds", "Readiness check duration.", labelnames=("check",)
+)
+
+#: A check returns an optional detail string and raises (or returns False) on failure.
+CheckFn = Callable[[], Awaitable[Any]]
+
+
+class Check:
+    """
+    One readiness dependency check.
+
+    Args:
+        name: Check name reported in the response.
+        run: Coroutine function performing the check.
+        critical: Whether a failure makes the service not ready.
+    """
+
+    __slots__ = ("name", "run", "critical")
+
+    def __init__(self, name: str, run: CheckFn, critical: bool = True) -> None:
+        self.name = name
+        self.run = run
+        self.critical = critical
+
+
+class ReadinessProbe:
+    """
+    Runs readiness checks periodically and serves the cached result.
+
+    Args:
+        checks: Checks to run (concurrently) on each refresh.
+        interval: Seconds between refreshes.
+        timeout: Per-check timeout in seconds.
+    """
+
+    def __init__(self, checks: list[Check], interval: float, timeout: float) -> None:
+        self.checks = checks
+        self.interval = interval
+        self.timeout = timeout
+        self._snapshot: dict | None = None
+        self._updated = 0.0
+        self._task: asyncio.Task | None = None
+        #: Set by the lifespan while the startup warm-up runs.
+        self.warming = False
+
+    async def _run_check(self, check: Check) -> dict:
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(check.run(), self.timeout)
+            ok = result is not False
+            detail = result if isinstance(result, str) else None
+        except asyncio.TimeoutError:
+            log.warning("Readiness check %s timed out after %gs", check.name, self.timeout)
+            ok, detail = False, "timeout"
+        except Exception:  # noqa: BLE001 - any failure means "not ready"
+            # The exception (DSNs, hosts, SQL) goes to the logs only; `/readyz` is public.
+            log.warning("Readiness check %s failed", check.name, exc_info=True)
+            ok, detail = False, "error"
+        elapsed = time.perf_counter() - started
+
+        _check_ok.set(1.0 if ok else 0.0, check=check.name)
+        _check_seconds.observe(elapsed, check=check.name)
+        entry: dict[str, Any] = {"ok": ok, "critical": check.critical, "latency_ms": round(elapsed * 1000, 2)}
+        if detail:
+            entry["detail"] = detail
+        return entry
+
+    async def refresh(self) -> dict:
+        """
+        Run every check now and store the result.
+
+        Returns:
+            dict: The new snapshot.
+        """
+        results = await asyncio.gather(*(self._run_check(check) for check in self.checks))
+        checks = {check.name: result for check, result in zip(self.checks, results)}
+
+        if any(not r["ok"] and r["critical"] for r in checks.values()):
+            status = "fail"
+        elif any(not r["ok"] for r in checks.values()):
+            status = "degraded"
+        else:
+            status = "ok"
+
+        previous = self._snapshot["status"] if self._snapshot else None
+        if status != previous and previous is not None:
+            log.warning("Readiness changed: %s -> %s", previous, status)
+
+        self._snapshot = {
+            "status": status,
+            "checked_at": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "checks": checks,
+        }
+        self._updated = time.monotonic()
+        return self._snapshot
+
+    def snapshot(self) -> tuple[int, dict]:
+        """
+        Return the cached result without running any check.
+
+        Returns:
+            tuple[int, dict]: HTTP status code and response body.
+        """
+        if self.warming:
+            return 503, {"status": "warming", "checks": (self._snapshot or {}).get("checks", {})}
+        if self._snapshot is None:
+            return 503, {"status": "starting", "checks": {}}
+        if time.monotonic() - self._updated > self.interval * 3:
+            return 503, {**self._snapshot, "status": "stale"}
+        return (503 if self._snapshot["status"] == "fail" else 200), self._snapshot
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:  # pragma: no cover - checks already catch their errors
+                log.exception("Readiness refresh failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background refresh task (first run happens immediately)."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._loop(), name="readiness-probe")
+
+    async def stop(self) -> None:
+        """Cancel the background refresh task."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+async def check_database() -> None:
+    """Check out a pooled connection and run `SELECT 1`."""
+
+    def ping() -> None:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    await run_in_threadpool(ping)
+
+
+async def check_hashing() -> str:
+    """Fail when the hashing pool is (nearly) saturated."""
+    executor = get_hashing_executor()
+    saturation = executor.saturation
+    if saturation >= settings.READINESS_MAX_HASH_SATURATION:
+        raise RuntimeError(f"saturation {saturation:.0%} ({executor.in_flight}/{executor.capacity})")
+    return f"saturation {saturation:.0%}"
+
+
+async def check_cache() -> bool:
+    """Ping the shared cache backend."""
+    return await get_cache().ping()
+
+
+_probe: ReadinessProbe | None = None
+
+
+def get_readiness_probe() -> ReadinessProbe:
+    """
+    Return the process-wide readiness probe configured from settings.
+
+    Returns:
+        ReadinessProbe: Shared probe instance.
+    """
+    global _probe
+    if _probe is None:
+        _probe = ReadinessProbe(
+            [
+                Check("database", check_database),
+                Check("hashing", check_hashing),
+                Check("cache", check_cache, critical=False),
+            ],
+            interval=settings.READINESS_INTERVAL_SECONDS,
+            timeout=settings.READINESS_CHECK_TIMEOUT_SECONDS,
+        )
+    return _probe
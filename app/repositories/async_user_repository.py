@@ -0,0 +1,197 @@
+"""
+Async user repository implementation (persistence layer).
+
+Async counterpart of `UserRepository` for routes served by the async database
+stack (`get_async_db`). Method names and semantics mirror the sync repository
+so services can be migrated route by route.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import AsyncIterator
+
+from sqlalchemy import Row, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.cache.emails import remember_emails
+from app.cache.users import invalidate_user, invalidate_users_list
+from app.config import settings
+from app.models.db_user import DBUser
+from app.repositories.last_login_buffer import get_last_login_buffer
+from app.repositories.user_repository import (
+    DuplicateEmailError,
+    is_duplicate_email,
+    public_user_rows_stmt,
+    user_versions_stmt,
+)
+
+
+class AsyncUserRepository:
+    """
+    Repository for user persistence operations over an `AsyncSession`.
+
+    Args:
+        db: Async SQLAlchemy session used for all repository operations.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def update_last_login(self, user: DBUser) -> DBUser:
+        """
+        Update the user's last_login_at timestamp.
+
+        With `LAST_LOGIN_WRITE_BEHIND` enabled, the timestamp is queued in the
+        write-behind buffer and set on the instance as already persisted, so a
+        later commit on the same session (e.g. issuing a refresh token) does
+        not write it synchronously as well.
+
+        Args:
+            user: ORM user to update.
+
+        Returns:
+            DBUser: Updated ORM user.
+        """
+        if settings.LAST_LOGIN_WRITE_BEHIND:
+            set_committed_value(user, "last_login_at", get_last_login_buffer().record(user.id))
+            return user
+
+        user.last_login_at = datetime.now(timezone.utc)
+        self.db.add(user)
+        await self.db.commit()
+        invalidate_user(user.id)
+        await self.db.refresh(user)
+        return user
+
+    async def set_active(self, user: DBUser, is_active: bool) -> DBUser:
+        """
+        Activate or deactivate a user.
+
+        Args:
+            user: ORM user to update.
+            is_active: New active flag.
+
+        Returns:
+            DBUser: Updated ORM user.
+        """
+        user.is_active = is_active
+        user.updated_at = datetime.now(timezone.utc)
+        self.db.add(user)
+        await self.db.commit()
+        invalidate_user(user.id)
+        invalidate_users_list()
+        await self.db.refresh(user)
+        return user
+
+    async def create_user(
+        self, email: str, hashed_password: str, full_name: str | None = None
+    ) -> DBUser:
+        """
+        Persist a new user in the database (the unique index checks the email).
+
+        Args:
+            email: Unique email.
+            hashed_password: bcrypt hashed password.
+            full_name: Optional full name.
+
+        Raises:
+            DuplicateEmailError: If the email is already registered.
+
+        Returns:
+            DBUser: Created ORM user.
+        """
+        user = DBUser(email=email, hashed_password=hashed_password, full_name=full_name)
+        self.db.add(user)
+        try:
+            await self.db.commit()
+        except IntegrityError as exc:
+            await self.db.rollback()
+            if is_duplicate_email(exc):
+                raise DuplicateEmailError(email) from exc
+            raise
+        invalidate_users_list()
+        remember_emails((email,))
+        await self.db.refresh(user)
+        return user
+
+    async def list_users(self) -> list[DBUser]:
+        """
+        Fetch all users ordered by ascending ID.
+
+        Returns:
+            list[DBUser]: List of users from the database.
+        """
+        stmt = select(DBUser).order_by(DBUser.id.asc())
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def list_user_rows_page(self, limit: int, after_id: int | None = None) -> list[Row]:
+        """
+        Fetch one keyset page of public user columns as row tuples.
+
+        Args:
+            limit: Max number of rows to return.
+            after_id: Return only users with `id > after_id`.
+
+        Returns:
+            list[Row]: `(id, email, full_name, is_active)` rows.
+        """
+        return list((await self.db.execute(public_user_rows_stmt(after_id).limit(limit))).all())
+
+    async def list_user_versions_page(self, limit: int, after_id: int | None = None) -> list[Row]:
+        """
+        Fetch `(id, updated_at)` for one keyset page of users.
+
+        Args:
+            limit: Max number of rows to return.
+            after_id: Return only users with `id > after_id`.
+
+        Returns:
+            list[Row]: `(id, updated_at)` rows.
+        """
+        return list((await self.db.execute(user_versions_stmt(limit, after_id))).all())
+
+    async def iter_user_rows(
+        self, after_id: int | None = None, batch_size: int = 1000
+    ) -> AsyncIterator[Row]:
+        """
+        Stream public user columns as row tuples using a server-side cursor.
+
+        Args:
+            after_id: Start after this ID.
+            batch_size: Rows buffered per fetch.
+
+        Yields:
+            Row: `(id, email, full_name, is_active)` rows.
+        """
+        stmt = public_user_rows_stmt(after_id).execution_options(yield_per=batch_size)
+        result = await self.db.stream(stmt)
+        async for row in result:
+            yield row
+
+    async def get_by_email(self, email: str) -> DBUser | None:
+        """
+        Fetch a user by email.
+
+        Args:
+            email: User email.
+
+        Returns:
+            DBUser | None: User if found; otherwise None.
+        """
+        stmt = select(DBUser).where(DBUser.email == email)
+        return (await self.db.execute(stmt)).scalars().first()
+
+    async def get_by_id(self, user_id: int) -> DBUser | None:
+        """
+        Fetch a user by primary key ID.
+
+        Args:
+            user_id: User ID.
+
+        Returns:
+            DBUser | None: User if found; otherwise None.
+        """
+        return await self.db.get(DBUser, user_id)
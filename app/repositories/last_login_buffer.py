@@ -0,0 +1,216 @@
+"""
+Write-behind buffer for `last_login_at` updates.
+
+Recording a login timestamp used to cost a full write transaction (UPDATE +
+COMMIT + refresh) on every successful login. With
+`LAST_LOGIN_WRITE_BEHIND=true`, repositories hand the timestamp to this
+buffer instead:
+
+- updates are coalesced per user in memory (latest timestamp wins)
+- a background thread flushes them every `LAST_LOGIN_FLUSH_INTERVAL_MS`, or
+  as soon as `LAST_LOGIN_FLUSH_MAX_PENDING` users are pending, as a single
+  executemany UPDATE (Core, by primary key) in one transaction; ids that
+  no longer exist simply match no row
+- the app lifespan flushes what is left on shutdown
+
+Trade-off: a hard crash loses at most one interval of login timestamps,
+which are informational only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.cache.users import invalidate_user
+from app.config import settings
+from app.dependencies.db import SessionLocal
+from app.logger import logger
+from app.metrics import registry
+from app.models.db_user import DBUser
+
+_flush_seconds = registry.histogram(
+    "last_login_flush_seconds", "Duration of write-behind last-login flushes."
+)
+_flushed = registry.counter(
+    "last_login_flushed_total", "Last-login updates written by write-behind flushes."
+)
+_flush_errors = registry.counter(
+    "last_login_flush_errors_total", "Write-behind last-login flushes that failed."
+)
+_pending_gauge = registry.gauge(
+    "last_login_pending", "Last-login updates waiting to be flushed."
+)
+
+# Core executemany: unlike the ORM bulk UPDATE by primary key, a row count of
+# 0 (user deleted meanwhile) is not a StaleDataError.
+_users = DBUser.__table__
+_UPDATE_LAST_LOGIN = (
+    update(_users)
+    .where(_users.c.id == bindparam("b_id"))
+    .values(last_login_at=bindparam("b_when"))
+)
+
+
+class LastLoginBuffer:
+    """
+    Coalescing write-behind buffer for `users.last_login_at`.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy `Session`.
+        flush_interval: Seconds between background flushes.
+        max_pending: Pending users that trigger an immediate flush.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        flush_interval: float = 0.5,
+        max_pending: int = 1000,
+    ) -> None:
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes (background thread vs. explicit flush/stop).
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, user_id: int, when: datetime | None = None) -> datetime:
+        """
+        Queue a last-login timestamp for `user_id`.
+
+        Args:
+            user_id: User primary key.
+            when: Login time (defaults to now, UTC).
+
+        Returns:
+            datetime: The recorded timestamp.
+        """
+        when = when or datetime.now(timezone.utc)
+        with self._lock:
+            current = self._pending.get(user_id)
+            if current is None or when > current:
+                self._pending[user_id] = when
+            full = len(self._pending) >= self.max_pending
+
+        self._ensure_started()
+        if full:
+            self._wake.set()
+        return when
+
+    def flush(self) -> int:
+        """
+        Write every pending timestamp in one transaction.
+
+        Failed batches are re-queued (newer timestamps recorded meanwhile win).
+        Users deleted since their login match no row and are dropped, so
+        they never hold the rest of the batch back.
+
+        Returns:
+            int: Number of users updated.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                with self.session_factory() as db:
+                    db.execute(
+                        _UPDATE_LAST_LOGIN,
+                        [{"b_id": user_id, "b_when": when} for user_id, when in batch.items()],
+                    )
+                    db.commit()
+            except Exception:
+                _flush_errors.inc()
+                logger.exception("Last-login flush failed; %s updates re-queued", len(batch))
+                with self._lock:
+                    for user_id, when in batch.items():
+                        current = self._pending.get(user_id)
+                        if current is None or when > current:
+                            self._pending[user_id] = when
+                return 0
+
+            _flush_seconds.observe(time.perf_counter() - started)
+            _flushed.inc(len(batch))
+            for user_id in batch:
+                invalidate_user(user_id)
+            return len(batch)
+
+    def stop(self) -> None:
+        """Stop the background thread and flush what is left."""
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None or self._stopping:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="last-login-flusher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if not self._stopping:
+                self.flush()
+
+
+_buffer: LastLoginBuffer | None = None
+_buffer_lock = threading.Lock()
+
+
+def get_last_login_buffer() -> LastLoginBuffer:
+    """
+    Return the process-wide buffer, writing through `SessionLocal`.
+
+    Returns:
+        LastLoginBuffer: Shared buffer (its flusher thread starts on first use).
+    """
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = LastLoginBuffer(
+                    SessionLocal,
+                    flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL_MS / 1000,
+                    max_pending=settings.LAST_LOGIN_FLUSH_MAX_PENDING,
+                )
+    return _buffer
+
+
+def shutdown_last_login_buffer() -> None:
+    """Flush and stop the process-wide buffer, if it was ever used."""
+    global _buffer
+    if _buffer is not None:
+        _buffer.stop()
+        _buffer = None
+
+
+def _collect_pending() -> None:
+    _pending_gauge.set(len(_buffer) if _buffer is not None else 0)
+
+
+registry.register_collector(_collect_pending)
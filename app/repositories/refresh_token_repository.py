@@ -0,0 +1,140 @@
+"""
+Refresh-token family repository (persistence layer).
+
+Every operation is a single statement on the primary key (or the
+`expires_at` index for compaction), so refreshing a token costs one indexed
+UPDATE instead of a bcrypt verify.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.models.db_refresh_token import DBRefreshTokenFamily
+
+
+class RefreshTokenRepository:
+    """
+    Repository for refresh-token family persistence operations.
+
+    Args:
+        db: SQLAlchemy session used for all repository operations.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def create(self, family_id: str, user_id: int, expires_at: datetime) -> DBRefreshTokenFamily:
+        """
+        Persist a new token family (generation 0).
+
+        Args:
+            family_id: Random family ID.
+            user_id: Owner of the family.
+            expires_at: Absolute expiry of every token in the family.
+
+        Returns:
+            DBRefreshTokenFamily: Created family.
+        """
+        family = DBRefreshTokenFamily(id=family_id, user_id=user_id, generation=0, expires_at=expires_at)
+        self.db.add(family)
+        self.db.commit()
+        return family
+
+    def rotate(self, family_id: str, generation: int, now: datetime) -> int | None:
+        """
+        Advance a family to the next generation if `generation` is current.
+
+        Compare-and-swap in one UPDATE: of two concurrent refreshes with the
+        same token, exactly one succeeds.
+
+        Args:
+            family_id: Family ID from the token.
+            generation: Generation from the token.
+            now: Current time (expired families don't rotate).
+
+        Returns:
+            int | None: Owner user ID, or None if the family is unknown,
+            revoked, expired, or `generation` is not current.
+        """
+        stmt = (
+            update(DBRefreshTokenFamily)
+            .where(
+                DBRefreshTokenFamily.id == family_id,
+                DBRefreshTokenFamily.generation == generation,
+                DBRefreshTokenFamily.revoked_at.is_(None),
+                DBRefreshTokenFamily.expires_at > now,
+            )
+            .values(generation=DBRefreshTokenFamily.generation + 1)
+            .returning(DBRefreshTokenFamily.user_id)
+        )
+        user_id = self.db.execute(stmt).scalar_one_or_none()
+        self.db.commit()
+        return user_id
+
+    def get(self, family_id: str) -> DBRefreshTokenFamily | None:
+        """
+        Fetch a family by ID.
+
+        Args:
+            family_id: Family ID.
+
+        Returns:
+            DBRefreshTokenFamily | None: Family if found; otherwise None.
+        """
+        return self.db.get(DBRefreshTokenFamily, family_id)
+
+    def revoke(self, family_id: str, now: datetime) -> datetime | None:
+        """
+        Revoke a family (idempotent).
+
+        Args:
+            family_id: Family ID.
+            now: Revocation time.
+
+        Returns:
+            datetime | None: The family's `expires_at`, or None if it doesn't exist.
+        """
+        stmt = (
+            update(DBRefreshTokenFamily)
+            .where(DBRefreshTokenFamily.id == family_id, DBRefreshTokenFamily.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+        return self.db.scalar(
+            select(DBRefreshTokenFamily.expires_at).where(DBRefreshTokenFamily.id == family_id)
+        )
+
+    def list_revoked(self, now: datetime) -> list[tuple[str, datetime]]:
+        """
+        Return revoked families that have not expired yet.
+
+        Args:
+            now: Current time.
+
+        Returns:
+            list[tuple[str, datetime]]: `(family_id, expires_at)` pairs.
+        """
+        stmt = select(DBRefreshTokenFamily.id, DBRefreshTokenFamily.expires_at).where(
+            DBRefreshTokenFamily.revoked_at.is_not(None),
+            DBRefreshTokenFamily.expires_at > now,
+        )
+        return [(family_id, expires_at) for family_id, expires_at in self.db.execute(stmt)]
+
+    def delete_expired(self, now: datetime) -> int:
+        """
+        Delete expired families (their tokens can no longer be used).
+
+        Args:
+            now: Current time.
+
+        Returns:
+            int: Rows deleted.
+        """
+        result = self.db.execute(delete(DBRefreshTokenFamily).where(DBRefreshTokenFamily.expires_at <= now))
+        self.db.commit()
+        return result.rowcount or 0
@@ -12,12 +12,89 @@ Business rules (e.g., validation, password rules) must remain in the Service lay
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import Iterator, Sequence
+
+from sqlalchemy import Row, Select, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.cache.emails import remember_emails
+from app.cache.users import invalidate_user, invalidate_users_list
+from app.config import settings
 from app.models.db_user import DBUser
+from app.repositories.last_login_buffer import get_last_login_buffer
 from datetime import datetime, timezone
 
+#: Public columns projected by the fast listing path (same fields as UserResponse).
+PUBLIC_USER_COLUMNS = (DBUser.id, DBUser.email, DBUser.full_name, DBUser.is_active)
+
+#: Unique index enforcing email uniqueness (`unique=True, index=True` on `DBUser.email`).
+EMAIL_UNIQUE_INDEX = "ix_users_email"
+
+
+class DuplicateEmailError(Exception):
+    """Raised by `create_user` when the email is already registered."""
+
+
+def is_duplicate_email(exc: IntegrityError) -> bool:
+    """
+    Tell whether an `IntegrityError` is a violation of the email unique index.
+
+    PostgreSQL drivers expose the violated constraint name; SQLite only
+    reports it in the message (`UNIQUE constraint failed: users.email`).
+
+    Args:
+        exc: Error raised by an INSERT/UPDATE on `users`.
+
+    Returns:
+        bool: True for a duplicate email; False for any other constraint.
+    """
+    orig = exc.orig
+    constraint = getattr(getattr(orig, "diag", None), "constraint_name", None) or getattr(
+        orig, "constraint_name", None
+    )
+    if constraint:
+        return constraint == EMAIL_UNIQUE_INDEX
+    message = str(orig)
+    return EMAIL_UNIQUE_INDEX in message or "users.email" in message
+
+
+def user_versions_stmt(limit: int, after_id: int | None = None) -> Select:
+    """
+    Build a keyset query selecting `(id, updated_at)` for one page of users.
+
+    Reads only `limit` rows along the primary key, so the version of a page
+    (see `app.http_cache`) is cheap to compute regardless of table size.
+
+    Args:
+        limit: Page size.
+        after_id: Return only users with `id > after_id` (None = first page).
+
+    Returns:
+        Select: Statement ordered by ascending ID.
+    """
+    stmt = select(DBUser.id, DBUser.updated_at).order_by(DBUser.id.asc()).limit(limit)
+    if after_id is not None:
+        stmt = stmt.where(DBUser.id > after_id)
+    return stmt
+
+
+def public_user_rows_stmt(after_id: int | None = None) -> Select:
+    """
+    Build a keyset query selecting only the public user columns.
+
+    Args:
+        after_id: Return only users with `id > after_id` (None = from the beginning).
+
+    Returns:
+        Select: Statement ordered by ascending ID yielding plain row tuples.
+    """
+    stmt = select(*PUBLIC_USER_COLUMNS).order_by(DBUser.id.asc())
+    if after_id is not None:
+        stmt = stmt.where(DBUser.id > after_id)
+    return stmt
+
 
 class UserRepository:
     """
@@ -39,37 +116,158 @@ class UserRepository:
         """
         Update the user's last_login_at timestamp
 
+        With `LAST_LOGIN_WRITE_BEHIND` enabled, the timestamp is queued in the
+        write-behind buffer and set on the instance as already persisted, so a
+        later commit on the same session (e.g. issuing a refresh token) does
+        not write it synchronously as well.
+
         Args:
             user: ORM user to update.
 
         Returns:
             DBUser: Updated ORM user.
         """
+        if settings.LAST_LOGIN_WRITE_BEHIND:
+            set_committed_value(user, "last_login_at", get_last_login_buffer().record(user.id))
+            return user
+
         user.last_login_at = datetime.now(timezone.utc)
         self.db.add(user)
         self.db.commit()
+        invalidate_user(user.id)
         self.db.refresh(user)
         return user
+
+    def set_active(self, user: DBUser, is_active: bool) -> DBUser:
+        """
+        Activate or deactivate a user.
+
+        Args:
+            user: ORM user to update.
+            is_active: New active flag.
+
+        Returns:
+            DBUser: Updated ORM user.
+        """
+        user.is_active = is_active
+        user.updated_at = datetime.now(timezone.utc)
+        self.db.add(user)
+        self.db.commit()
+        invalidate_user(user.id)
+        invalidate_users_list()
+        self.db.refresh(user)
+        return user
+
+    def replace_password_hash(self, user_id: int, old_hash: str, new_hash: str) -> bool:
+        """
+        Swap a user's password hash, only if it is still `old_hash`.
+
+        Used to upgrade the bcrypt cost after a login; the compare-and-swap
+        keeps a password changed in the meantime from being overwritten.
+        `updated_at` is left alone (no public field changes).
+
+        Args:
+            user_id: User primary key.
+            old_hash: Hash the new one was derived from.
+            new_hash: Replacement hash (same password, current cost).
+
+        Returns:
+            bool: True if the hash was replaced.
+        """
+        stmt = (
+            update(DBUser)
+            .where(DBUser.id == user_id, DBUser.hashed_password == old_hash)
+            .values(hashed_password=new_hash)
+        )
+        replaced = bool(self.db.execute(stmt).rowcount)
+        self.db.commit()
+        if replaced:
+            invalidate_user(user_id)
+        return replaced
     
 
     def create_user(self, email: str, hashed_password: str, full_name: str | None = None) -> DBUser:
         """
         Persist a new user in the database.
 
+        The unique index on `email` is the uniqueness check: no SELECT runs
+        first, and concurrent registrations of the same email cannot both win.
+
         Args:
             email: Unique email.
             hashed_password: bcrypt hashed password.
             full_name: Optional full name.
 
+        Raises:
+            DuplicateEmailError: If the email is already registered.
+
         Returns:
             DBUser: Created ORM user.
         """
         user = DBUser(email=email, hashed_password=hashed_password, full_name=full_name)
         self.db.add(user)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError as exc:
+            self.db.rollback()
+            if is_duplicate_email(exc):
+                raise DuplicateEmailError(email) from exc
+            raise
+        invalidate_users_list()
+        remember_emails((email,))
         self.db.refresh(user)
         return user
 
+    def existing_emails(self, emails: Sequence[str]) -> set[str]:
+        """
+        Return which of `emails` are already registered (one indexed query).
+
+        Args:
+            emails: Candidate emails.
+
+        Returns:
+            set[str]: Registered emails among `emails`.
+        """
+        if not emails:
+            return set()
+        return set(self.db.scalars(select(DBUser.email).where(DBUser.email.in_(emails))))
+
+    def bulk_create_users(self, rows: Sequence[dict]) -> list[tuple[dict, str]]:
+        """
+        Insert many users in a single transaction (executemany).
+
+        If the batch hits a constraint (e.g. an email registered concurrently),
+        it is retried row by row (one commit each) so only offending rows fail.
+
+        Args:
+            rows: Column dicts (`email`, `hashed_password`, `full_name`).
+
+        Returns:
+            list[tuple[dict, str]]: Rejected rows with the database error.
+        """
+        if not rows:
+            return []
+
+        try:
+            self.db.execute(insert(DBUser), list(rows))
+            self.db.commit()
+            rejected: list[tuple[dict, str]] = []
+        except IntegrityError:
+            self.db.rollback()
+            rejected = []
+            for row in rows:
+                try:
+                    self.db.execute(insert(DBUser), [row])
+                    self.db.commit()
+                except IntegrityError as exc:
+                    self.db.rollback()
+                    rejected.append((row, str(exc.orig)))
+
+        if len(rejected) < len(rows):
+            invalidate_users_list()
+            remember_emails(row["email"] for row in rows)
+        return rejected
+
     def list_users(self) -> list[DBUser]:
         """
         Fetch all users ordered by ascending ID.
@@ -80,6 +278,50 @@ class UserRepository:
         stmt = select(DBUser).order_by(DBUser.id.asc())
         return list(self.db.execute(stmt).scalars().all())
 
+    def list_user_rows_page(self, limit: int, after_id: int | None = None) -> list[Row]:
+        """
+        Fetch one keyset page of public user columns as row tuples.
+
+        Unlike `list_users`, no ORM entities are built (no identity map,
+        no `hashed_password`/timestamps loaded), which makes this the cheap
+        path for read-only listings.
+
+        Args:
+            limit: Max number of rows to return.
+            after_id: Return only users with `id > after_id`.
+
+        Returns:
+            list[Row]: `(id, email, full_name, is_active)` rows.
+        """
+        return list(self.db.execute(public_user_rows_stmt(after_id).limit(limit)).all())
+
+    def list_user_versions_page(self, limit: int, after_id: int | None = None) -> list[Row]:
+        """
+        Fetch `(id, updated_at)` for one keyset page of users.
+
+        Args:
+            limit: Max number of rows to return.
+            after_id: Return only users with `id > after_id`.
+
+        Returns:
+            list[Row]: `(id, updated_at)` rows.
+        """
+        return list(self.db.execute(user_versions_stmt(limit, after_id)).all())
+
+    def iter_user_rows(self, after_id: int | None = None, batch_size: int = 1000) -> Iterator[Row]:
+        """
+        Stream public user columns as row tuples using a server-side cursor.
+
+        Args:
+            after_id: Start after this ID.
+            batch_size: Rows buffered per fetch.
+
+        Yields:
+            Row: `(id, email, full_name, is_active)` rows.
+        """
+        stmt = public_user_rows_stmt(after_id).execution_options(yield_per=batch_size)
+        yield from self.db.execute(stmt)
+
     def get_by_email(self, email: str) -> DBUser | None:
         """
         Fetch a user by email.
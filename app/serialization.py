@@ -0,0 +1,95 @@
+"""
+Fast JSON serialization for trusted, column-projected rows.
+
+List endpoints select only public columns as row tuples (see
+`UserRepository.list_user_rows_page`). These values come straight from our own
+database, so re-validating them through Pydantic (`EmailStr` etc.) on every
+response is wasted work. This module turns rows into JSON bytes directly.
+
+Notes:
+    - Uses `orjson` when installed; falls back to the standard library.
+    - Field names match `UserResponse`, so the API contract is unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator, Iterable, Sequence
+
+try:  # pragma: no cover - depends on the environment
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+#: Public user fields, in the order selected by `PUBLIC_USER_COLUMNS`.
+USER_FIELDS: tuple[str, ...] = ("id", "email", "full_name", "is_active")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a JSON-compatible value to compact UTF-8 bytes.
+
+    Args:
+        value: dict/list/str/int/... value.
+
+    Returns:
+        bytes: JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def rows_to_dicts(rows: Iterable[Sequence[Any]], fields: Sequence[str] = USER_FIELDS) -> list[dict]:
+    """Map row tuples to dicts keyed by `fields`."""
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def rows_to_json(rows: Iterable[Sequence[Any]], fields: Sequence[str] = USER_FIELDS) -> bytes:
+    """
+    Serialize row tuples to a JSON array of objects.
+
+    Args:
+        rows: Row tuples (e.g. SQLAlchemy `Row`).
+        fields: Field name for each tuple position.
+
+    Returns:
+        bytes: JSON array.
+    """
+    return dumps(rows_to_dicts(rows, fields))
+
+
+def rows_to_ndjson(
+    rows: Iterable[Sequence[Any]],
+    fields: Sequence[str] = USER_FIELDS,
+    chunk_size: int = 1000,
+) -> Iterable[bytes]:
+    """
+    Serialize row tuples to NDJSON, yielding chunks of up to `chunk_size` lines.
+
+    Grouping lines keeps the number of ASGI send calls low for large streams.
+    """
+    chunk: list[bytes] = []
+    for row in rows:
+        chunk.append(dumps(dict(zip(fields, row))))
+        if len(chunk) >= chunk_size:
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
+
+
+async def rows_to_ndjson_async(
+    rows: AsyncIterator[Sequence[Any]],
+    fields: Sequence[str] = USER_FIELDS,
+    chunk_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """Async variant of `rows_to_ndjson` for async row streams."""
+    chunk: list[bytes] = []
+    async for row in rows:
+        chunk.append(dumps(dict(zip(fields, row))))
+        if len(chunk) >= chunk_size:
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
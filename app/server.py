@@ -0,0 +1,326 @@
+"""
+Production server: prefork uvicorn workers under a small supervisor.
+
+`uvicorn app.main:app` serves from one process, i.e. one core. This launcher
+runs `SERVER_WORKERS` processes (default: one per available CPU) sharing a
+single listening socket:
+
+- The app is imported and warmed up (OpenAPI schema, passlib/bcrypt, JWT) in
+  the supervisor *before* forking, then `gc.freeze()`d, so workers start
+  instantly and share those pages copy-on-write.
+- Each worker drops the SQLAlchemy pool connections inherited from the
+  supervisor (`dispose_after_fork`), restarts the logging listener thread
+  (threads don't survive `fork`) and runs uvicorn with uvloop + httptools.
+- SIGTERM/SIGINT: the supervisor forwards SIGTERM; each worker stops
+  accepting, finishes in-flight requests (uvicorn tracks open connections and
+  tasks) for up to `SERVER_GRACEFUL_TIMEOUT_SECONDS`, runs the lifespan
+  shutdown (buffered writes are flushed) and exits. Stragglers are killed.
+- Recycling: a worker exits after `SERVER_MAX_REQUESTS` (+ jitter) requests
+  and is replaced, bounding memory growth from fragmentation or leaks. In-flight
+  requests complete, but a connection the exiting worker accepted without
+  reading a request yet is closed unanswered; the reverse proxy in front
+  should retry idempotent requests on such errors (nginx does by default).
+- Workers that die are replaced; workers that keep failing during startup
+  stop the supervisor instead of looping.
+
+Usage:
+    python -m app.server
+    python -m app.server --workers 4 --port 8080 --max-requests 10000
+
+Notes:
+    - POSIX only (`fork`). For development, keep `uvicorn --reload`.
+    - State kept in process (metrics, caches, rate-limit counters with the
+      memory backend) is per worker. The registered-email filter would refuse
+      logins of users registered on another worker, so it is turned off when
+      more than one worker runs (`check_per_process_settings`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+import uvicorn
+
+from app.config import settings
+from app.db_pool import dispose_after_fork
+from app.logger import setup_logger, shutdown_logging
+
+log = logging.getLogger(__name__)
+
+#: A worker exiting sooner than this after its start counts as a boot failure.
+_MIN_UPTIME_SECONDS = 5.0
+#: Consecutive boot failures after which the supervisor gives up.
+_MAX_BOOT_FAILURES = 5
+
+
+def available_cpus() -> int:
+    """Return the CPUs this process may run on (affinity-aware)."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:  # pragma: no cover - not available on macOS
+        return os.cpu_count() or 1
+
+
+def worker_count(requested: int = 0) -> int:
+    """
+    Resolve the number of worker processes.
+
+    Args:
+        requested: Explicit count (<= 0 means one per available CPU).
+
+    Returns:
+        int: Worker processes to run.
+    """
+    return requested if requested > 0 else available_cpus()
+
+
+def check_per_process_settings(workers: int) -> list[str]:
+    """
+    Turn off features that are wrong when state is split across workers.
+
+    `AUTH_EMAIL_FILTER_ENABLED`: each worker keeps its own filter, so a user
+    registered on one worker would be refused ("Credenciales inválidas") by
+    the others until their next sync. It is only an optimization, so it is
+    disabled (logins go to the database) instead of breaking logins.
+
+    Args:
+        workers: Worker processes about to be started.
+
+    Returns:
+        list[str]: Settings that were disabled.
+    """
+    disabled = []
+    if workers > 1 and settings.AUTH_EMAIL_FILTER_ENABLED:
+        log.error(
+            "AUTH_EMAIL_FILTER_ENABLED keeps a per-process filter and is not safe with %s workers; "
+            "disabling it (run a single worker to use it)",
+            workers,
+        )
+        settings.AUTH_EMAIL_FILTER_ENABLED = False
+        disabled.append("AUTH_EMAIL_FILTER_ENABLED")
+    return disabled
+
+
+def _event_loop() -> str:
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "auto"
+    return "uvloop"
+
+
+def _http_protocol() -> str:
+    try:
+        import httptools  # noqa: F401
+    except ImportError:
+        return "auto"
+    return "httptools"
+
+
+def build_config(app, host: str, port: int, max_requests: int) -> uvicorn.Config:
+    """
+    Build the uvicorn configuration shared by every worker.
+
+    Args:
+        app: Preloaded ASGI application.
+        host: Bind address.
+        port: Bind port.
+        max_requests: Requests per worker before recycling (0 = never).
+
+    Returns:
+        uvicorn.Config: Worker configuration.
+    """
+    return uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        loop=_event_loop(),
+        http=_http_protocol(),
+        lifespan="on",
+        log_config=None,
+        access_log=settings.SERVER_ACCESS_LOG,
+        limit_max_requests=max_requests or None,
+        limit_max_requests_jitter=settings.SERVER_MAX_REQUESTS_JITTER if max_requests else 0,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+    )
+
+
+class Supervisor:
+    """
+    Forks, watches and replaces uvicorn workers sharing one socket.
+
+    Args:
+        config: uvicorn configuration (its app already imported).
+        workers: Number of worker processes.
+        graceful_timeout: Seconds workers get to drain on shutdown.
+    """
+
+    def __init__(self, config: uvicorn.Config, workers: int, graceful_timeout: float) -> None:
+        self.config = config
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self._children: dict[int, float] = {}
+        self._socket: socket.socket | None = None
+        self._stopping = False
+        self._boot_failures = 0
+
+    def run(self) -> int:
+        """
+        Serve until SIGTERM/SIGINT, then drain the workers.
+
+        Returns:
+            int: Process exit status (1 if workers kept failing at startup).
+        """
+        self._socket = self.config.bind_socket()
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        log.info(
+            "Serving on %s:%s with %s workers (loop=%s, http=%s)",
+            self.config.host,
+            self.config.port,
+            self.workers,
+            self.config.loop,
+            self.config.http,
+        )
+
+        status = 0
+        while not self._stopping:
+            while len(self._children) < self.workers and not self._stopping:
+                self._spawn()
+            time.sleep(0.2)
+            if self._reap() and self._boot_failures >= _MAX_BOOT_FAILURES:
+                log.error("Workers keep failing at startup; stopping")
+                status = 1
+                break
+
+        self._shutdown()
+        self._socket.close()
+        return status
+
+    def _handle_stop(self, signum: int, _frame) -> None:
+        self._stopping = True
+
+    def _spawn(self) -> None:
+        # The log listener is a thread: stop it so no lock is held across the
+        # fork, and start a fresh one on both sides.
+        shutdown_logging()
+        pid = os.fork()
+        if pid == 0:
+            # Nothing may return from here into the supervisor loop: whatever
+            # fails, the child ends in `os._exit`.
+            status = 1
+            try:
+                setup_logger(announce=False)
+                status = self._serve_worker()
+            finally:
+                try:
+                    shutdown_logging()
+                finally:
+                    os._exit(status)
+        setup_logger(announce=False)
+        self._children[pid] = time.monotonic()
+
+    def _serve_worker(self) -> int:
+        # uvicorn installs its own handlers while serving and re-raises the
+        # captured signal afterwards; ignoring it then lets the worker exit
+        # through `os._exit` (flushing logs) instead of dying on the signal.
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        dispose_after_fork()
+        if settings.HASH_WORKERS <= 0:
+            # Split the cores between workers instead of one bcrypt thread per core in each.
+            settings.HASH_WORKERS = max(1, available_cpus() // self.workers)
+
+        server = uvicorn.Server(self.config)
+        server.run(sockets=[self._socket])
+        return 0 if server.started else 1
+
+    def _reap(self) -> bool:
+        """Collect exited workers; return True if any failed at startup."""
+        failed = False
+        while self._children:
+            try:
+                pid, raw_status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                break
+            if pid == 0:
+                break
+            started = self._children.pop(pid, None)
+            if started is None:
+                continue
+            code = os.waitstatus_to_exitcode(raw_status)
+            if code != 0 and time.monotonic() - started < _MIN_UPTIME_SECONDS:
+                self._boot_failures += 1
+                failed = True
+                log.warning("Worker %s failed at startup (exit %s)", pid, code)
+            else:
+                self._boot_failures = 0
+                if not self._stopping:
+                    log.info("Worker %s exited (exit %s); replacing it", pid, code)
+        return failed
+
+    def _shutdown(self) -> None:
+        log.info("Stopping %s workers (graceful timeout %ss)", len(self._children), self.graceful_timeout)
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        # Drain time, plus a margin for the lifespan shutdown.
+        deadline = time.monotonic() + self.graceful_timeout + 5.0
+        while self._children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+
+        for pid in list(self._children):
+            log.warning("Worker %s did not stop in time; killing it", pid)
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._children.clear()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the API with prefork uvicorn workers.")
+    parser.add_argument("--host", default=settings.SERVER_HOST, help="Bind address")
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT, help="Bind port")
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="Worker processes (0 = CPUs)")
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=settings.SERVER_MAX_REQUESTS,
+        help="Recycle a worker after this many requests (0 = never)",
+    )
+    args = parser.parse_args(argv)
+
+    # Preload: import and warm up once, before forking, so workers share it.
+    from app.main import app
+    from app.startup import warm_up
+
+    workers = worker_count(args.workers)
+    check_per_process_settings(workers)
+
+    if settings.STARTUP_WARMUP:
+        warm_up(app)
+    gc.collect()
+    gc.freeze()
+
+    config = build_config(app, args.host, args.port, args.max_requests)
+    supervisor = Supervisor(config, workers, settings.SERVER_GRACEFUL_TIMEOUT_SECONDS)
+    return supervisor.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
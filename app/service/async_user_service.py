@@ -0,0 +1,141 @@
+"""
+Async user service (business layer).
+
+Async counterpart of `UserService` backed by `AsyncUserRepository`. It exposes
+the same `*_async` use-cases as `UserService`, so route handlers can depend on
+either implementation (see `app.dependencies.services`).
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.emails import get_email_filter
+from app.config import settings
+from app.exceptions import BadRequestException
+from app.logger import logger
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.repositories.user_repository import DuplicateEmailError
+from app.service.auth_service import AuthService
+from app.service.password_rehash import rehash_if_needed
+
+
+class AsyncUserService:
+    """
+    Service responsible for user-related business operations (async DB).
+
+    Args:
+        db: Async SQLAlchemy session scoped to the current request.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.repo = AsyncUserRepository(db)
+        self.auth = AuthService()
+
+    async def list_users_async(self):
+        """
+        Return all users from the repository.
+
+        Returns:
+            list[DBUser]: ORM user objects.
+        """
+        return await self.repo.list_users()
+
+    async def list_user_rows_page_async(self, limit: int, after_id: int | None = None):
+        """
+        Return one keyset page of public user columns.
+
+        Args:
+            limit: Max number of rows to return.
+            after_id: Return only users after this ID.
+
+        Returns:
+            list[Row]: `(id, email, full_name, is_active)` rows.
+        """
+        return await self.repo.list_user_rows_page(limit, after_id)
+
+    async def list_user_versions_page_async(self, limit: int, after_id: int | None = None):
+        """
+        Return `(id, updated_at)` for one keyset page.
+
+        Args:
+            limit: Max number of rows to return.
+            after_id: Return only users after this ID.
+
+        Returns:
+            list[Row]: `(id, updated_at)` rows.
+        """
+        return await self.repo.list_user_versions_page(limit, after_id)
+
+    def iter_user_rows(self, after_id: int | None = None):
+        """
+        Stream public user columns in ascending ID order.
+
+        Args:
+            after_id: Start after this ID.
+
+        Returns:
+            AsyncIterator[Row]: `(id, email, full_name, is_active)` rows.
+        """
+        return self.repo.iter_user_rows(after_id, batch_size=settings.USERS_STREAM_BATCH_SIZE)
+
+    async def register_user_async(self, email: str, password: str, full_name: str | None = None):
+        """
+        Register a new user in the database.
+
+        The unique index on `email` rejects duplicates (no pre-check SELECT).
+
+        Raises:
+            BadRequestException: If the email is already registered.
+            ServiceUnavailableException: If the hashing queue is full.
+
+        Returns:
+            DBUser: Newly created ORM user.
+        """
+        hashed_password = await self.auth.hash_password_async(password)
+
+        try:
+            user = await self.repo.create_user(
+                email=email,
+                hashed_password=hashed_password,
+                full_name=full_name,
+            )
+        except DuplicateEmailError:
+            raise BadRequestException("El email ya está registrado") from None
+
+        logger.info("User registered successfully: user_id=%s email=%s", user.id, user.email)
+        return user
+
+    async def authenticate_user_async(self, email: str, password: str):
+        """
+        Authenticate a user by email and password.
+
+        Unknown emails cost a dummy verify (uniform timing) and, with the
+        email filter enabled, skip the database when never registered.
+
+        Raises:
+            BadRequestException: If the email is not found or the password is invalid.
+            ServiceUnavailableException: If the hashing queue is full.
+
+        Returns:
+            DBUser: Authenticated user.
+        """
+        email_filter = get_email_filter()
+        if email_filter is not None and not email_filter.might_exist(email):
+            await self.auth.verify_dummy_async(password)
+            raise BadRequestException("Credenciales inválidas")
+
+        user = await self.repo.get_by_email(email)
+        if user is None:
+            if email_filter is not None:
+                email_filter.record_miss()
+            await self.auth.verify_dummy_async(password)
+            raise BadRequestException("Credenciales inválidas")
+
+        if not await self.auth.verify_password_async(password, user.hashed_password):
+            raise BadRequestException("Credenciales inválidas")
+        rehash_if_needed(user.id, password, user.hashed_password)
+
+        # Track last login
+        await self.repo.update_last_login(user)
+        return user
@@ -2,8 +2,11 @@
 Authentication service (business layer).
 
 Provides:
-- JWT token generation
-- Password hashing and verification
+- JWT token generation and verification (pluggable backend, see `jwt_backends`)
+- HMAC-signed opaque refresh tokens (state lives in `refresh_token_families`)
+- A bounded cache of verified tokens, so reused bearer tokens skip signature checks
+- Password hashing and verification (sync, and async via the hashing pool)
+- bcrypt cost policy (`AUTH_BCRYPT_ROUNDS`) and its calibration for the current hardware
 
 This module does not perform database access directly; it is used by services
 that orchestrate repository calls.
@@ -11,14 +14,174 @@ that orchestrate repository calls.
 
 from __future__ import annotations
 
+import hashlib
+import hmac
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
 
-from jose import jwt
-from passlib.context import CryptContext
-
+from app.cache.lru import MISSING, TTLCache
 from app.config import settings
+from app.service.hashing import get_hashing_executor
+from app.service.jwt_backends import InvalidTokenError, create_jwt_backend
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+_pwd_context: CryptContext | None = None
+_dummy_hashed_password: str | None = None
+_refresh_key: bytes | None = None
+
+_jwt_backend = create_jwt_backend(settings.JWT_BACKEND)
+
+#: Verified tokens: sha256(token) -> claims. Entries expire with the token's `exp`.
+token_cache = TTLCache(
+    "jwt",
+    maxsize=settings.JWT_DECODE_CACHE_MAXSIZE,
+    ttl=settings.JWT_EXPIRE_MINUTES * 60,
+)
+
+
+def _check_password(password: str) -> None:
+    """
+    Validate a plaintext password before hashing.
+
+    Raises:
+        ValueError: If the password is empty or longer than 72 bytes.
+    """
+    if not password:
+        raise ValueError("Password is required")
+
+    # bcrypt only considers the first 72 bytes; longer inputs must be rejected to avoid ambiguity.
+    if len(password.encode("utf-8")) > 72:
+        raise ValueError("Password is too long")
+
+
+def _password_context() -> CryptContext:
+    """
+    Return the bcrypt context, importing passlib on first use.
+
+    passlib and the bcrypt backend are only needed once a password is hashed
+    or verified, so they are kept out of application startup.
+
+    New hashes use `AUTH_BCRYPT_ROUNDS`; stored hashes with any other cost
+    report `needs_update()`, so they are rehashed on the next login.
+    """
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+
+        rounds = settings.AUTH_BCRYPT_ROUNDS
+        _pwd_context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=rounds,
+            bcrypt__min_rounds=rounds,
+            bcrypt__max_rounds=rounds,
+        )
+    return _pwd_context
+
+
+def _hash(password: str) -> str:
+    """Module-level hash function (picklable for process pools)."""
+    return _password_context().hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    """Module-level verify function (picklable for process pools)."""
+    return _password_context().verify(password, hashed_password)
+
+
+def calibrate_bcrypt_rounds(
+    target_seconds: float,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+    samples: int = 3,
+) -> tuple[int, float]:
+    """
+    Find the highest bcrypt cost whose verify fits in `target_seconds` here.
+
+    Each extra round doubles the work, so costs are measured upwards from
+    `min_rounds` until the next one would exceed the target.
+
+    Args:
+        target_seconds: Time budget of one verify on this machine.
+        min_rounds: Lowest acceptable cost (returned even if it is slower
+            than the target).
+        max_rounds: Highest cost considered.
+        samples: Verifies timed per cost (the fastest one counts).
+
+    Returns:
+        tuple[int, float]: Chosen cost and its measured verify time in seconds.
+    """
+    from passlib.hash import bcrypt
+
+    password = secrets.token_urlsafe(16)
 
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def measure(rounds: int) -> float:
+        hashed = bcrypt.using(rounds=rounds).hash(password)
+        best = float("inf")
+        for _ in range(max(samples, 1)):
+            started = time.perf_counter()
+            bcrypt.verify(password, hashed)
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    rounds, elapsed = min_rounds, measure(min_rounds)
+    while rounds < max_rounds and elapsed * 2 <= target_seconds:
+        rounds, elapsed = rounds + 1, measure(rounds + 1)
+    return rounds, elapsed
+
+
+def _refresh_mac(payload: str) -> str:
+    """HMAC of a refresh-token payload, keyed separately from JWT signatures."""
+    global _refresh_key
+    if _refresh_key is None:
+        _refresh_key = hashlib.sha256(b"refresh-token:" + settings.JWT_SECRET_KEY.encode("utf-8")).digest()
+    return hmac.new(_refresh_key, payload.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _dummy_hash() -> str:
+    """
+    Return a bcrypt hash of a random password, with the current cost.
+
+    Verified against when the login email is unknown, so the response takes
+    as long as a wrong password for a registered user.
+    """
+    global _dummy_hashed_password
+    if _dummy_hashed_password is None:
+        _dummy_hashed_password = _hash(secrets.token_urlsafe(16))
+    return _dummy_hashed_password
+
+
+def _verify_dummy(password: str) -> bool:
+    """Module-level dummy verify (always False; picklable for process pools)."""
+    _verify(password, _dummy_hash())
+    return False
+
+
+def warm_up() -> None:
+    """
+    Load the password hashing and JWT libraries ahead of the first request.
+
+    Called off the event loop after startup (see `app.startup`), so the
+    deferred imports cost neither startup time nor first-request latency.
+    The first call also runs one bcrypt hash + verify and one JWT round trip,
+    so the first login and the first authenticated request take the same
+    code paths as every later one; later calls only repeat the (cheap) JWT
+    round trip.
+    """
+    _password_context().handler("bcrypt").get_backend()
+    if _dummy_hashed_password is None:
+        _verify_dummy(secrets.token_urlsafe(16))
+    _jwt_backend.load()
+    claims = {"sub": "warm-up", "exp": int(time.time()) + 60}
+    _jwt_backend.decode(
+        _jwt_backend.encode(claims, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM),
+        settings.JWT_SECRET_KEY,
+        [settings.JWT_ALGORITHM],
+    )
 
 
 class AuthService:
@@ -26,8 +189,12 @@ class AuthService:
     Service responsible for authentication-related utilities.
 
     Responsibilities:
-        - Create JWT access tokens
-        - Hash and verify passwords using bcrypt
+        - Create and verify JWT access tokens
+        - Hash and verify passwords using bcrypt (cost `AUTH_BCRYPT_ROUNDS`)
+
+    Notes:
+        - Prefer the `*_async` variants from async handlers: they run bcrypt on
+          the dedicated hashing pool instead of Starlette's threadpool.
     """
 
     def hash_password(self, password: str) -> str:
@@ -40,14 +207,8 @@ class AuthService:
         Returns:
             str: Secure bcrypt hash to be stored in the database.
         """
-
-        if not password:
-            raise ValueError("Password is required")
-
-        # bcrypt only considers the first 72 bytes; longer inputs must be rejected to avoid ambiguity.
-        if len(password.encode("utf-8")) > 72:
-            raise ValueError("Password is too long")
-        return _pwd_context.hash(password)
+        _check_password(password)
+        return _hash(password)
 
     def verify_password(self, password: str, hashed_password: str) -> bool:
         """
@@ -60,7 +221,86 @@ class AuthService:
         Returns:
             bool: True if password matches the hash; otherwise False.
         """
-        return _pwd_context.verify(password, hashed_password)
+        return _verify(password, hashed_password)
+
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a plaintext password on the hashing pool.
+
+        Args:
+            password: Plaintext password provided by the user.
+
+        Raises:
+            ValueError: If the password is empty or too long.
+            ServiceUnavailableException: If the hashing queue is full.
+
+        Returns:
+            str: Secure bcrypt hash to be stored in the database.
+        """
+        _check_password(password)
+        return await get_hashing_executor().run(_hash, password, operation="hash")
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """
+        Tell whether a stored hash was made with a cost other than `AUTH_BCRYPT_ROUNDS`.
+
+        Only parses the hash; no bcrypt work is done.
+
+        Args:
+            hashed_password: Stored bcrypt hash.
+
+        Returns:
+            bool: True if the hash should be replaced.
+        """
+        return _password_context().needs_update(hashed_password)
+
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify a plaintext password against a stored hash on the hashing pool.
+
+        Args:
+            password: Plaintext password.
+            hashed_password: Stored bcrypt hash.
+
+        Raises:
+            ServiceUnavailableException: If the hashing queue is full.
+
+        Returns:
+            bool: True if password matches the hash; otherwise False.
+        """
+        return await get_hashing_executor().run(
+            _verify, password, hashed_password, operation="verify"
+        )
+
+    def verify_dummy(self, password: str) -> bool:
+        """
+        Spend the time of a password verify for an unknown user.
+
+        No-op when `AUTH_DUMMY_VERIFY` is off.
+
+        Args:
+            password: Plaintext password from the login attempt.
+
+        Returns:
+            bool: Always False.
+        """
+        if settings.AUTH_DUMMY_VERIFY:
+            _verify_dummy(password)
+        return False
+
+    async def verify_dummy_async(self, password: str) -> bool:
+        """
+        Async variant of `verify_dummy` (runs on the hashing pool).
+
+        Raises:
+            ServiceUnavailableException: If the hashing queue is full.
+
+        Returns:
+            bool: Always False.
+        """
+        if settings.AUTH_DUMMY_VERIFY:
+            await get_hashing_executor().run(_verify_dummy, password, operation="verify")
+        return False
 
     def create_access_token(self, data: dict) -> str:
         """
@@ -77,8 +317,88 @@ class AuthService:
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
         to_encode.update({"exp": expire})
 
-        return jwt.encode(
+        return _jwt_backend.encode(
             to_encode,
             settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM,
+            settings.JWT_ALGORITHM,
+        )
+
+    def decode_access_token(self, token: str) -> dict[str, Any]:
+        """
+        Verify a JWT access token and return its claims.
+
+        Verified claims are cached by token hash until the token's `exp`, so a
+        bearer token reused across requests is only verified once.
+
+        Args:
+            token: Encoded JWT.
+
+        Raises:
+            InvalidTokenError: If the token is malformed, badly signed or expired.
+
+        Returns:
+            dict[str, Any]: Token claims.
+        """
+        use_cache = settings.JWT_DECODE_CACHE_ENABLED
+        if use_cache:
+            key = hashlib.sha256(token.encode("utf-8")).digest()
+            claims = token_cache.get(key)
+            if claims is not MISSING:
+                return dict(claims)
+
+        claims = _jwt_backend.decode(
+            token,
+            settings.JWT_SECRET_KEY,
+            [settings.JWT_ALGORITHM],
         )
+
+        if use_cache:
+            exp = claims.get("exp")
+            if isinstance(exp, (int, float)):
+                ttl = exp - time.time()
+                if ttl > 0:
+                    token_cache.set(key, claims, ttl=ttl)
+        return claims
+
+    def create_refresh_token(self, family_id: str, generation: int) -> str:
+        """
+        Create an opaque refresh token for a token family generation.
+
+        Format: `<family id>.<generation>.<HMAC-SHA256>`; the MAC makes tokens
+        unforgeable, so only well-signed tokens ever reach the database.
+
+        Args:
+            family_id: Token family ID (hex).
+            generation: Family generation the token is valid for.
+
+        Returns:
+            str: Refresh token.
+        """
+        payload = f"{family_id}.{generation}"
+        return f"{payload}.{_refresh_mac(payload)}"
+
+    def parse_refresh_token(self, token: str) -> tuple[str, int]:
+        """
+        Verify a refresh token's signature and return its family and generation.
+
+        Args:
+            token: Refresh token from `create_refresh_token`.
+
+        Raises:
+            InvalidTokenError: If the token is malformed or badly signed.
+
+        Returns:
+            tuple[str, int]: `(family_id, generation)`.
+        """
+        payload, _, mac = token.rpartition(".")
+        family_id, _, generation = payload.partition(".")
+        # Bytes: `compare_digest` raises TypeError on non-ASCII str input.
+        if not (
+            family_id
+            and generation.isascii()
+            and generation.isdigit()
+            and hmac.compare_digest(mac.encode("utf-8"), _refresh_mac(payload).encode("ascii"))
+        ):
+            raise InvalidTokenError("Invalid refresh token")
+        return family_id, int(generation)
+
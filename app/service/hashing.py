@@ -0,0 +1,203 @@
+"""
+Bounded worker pool for password hashing.
+
+bcrypt is deliberately slow (hundreds of milliseconds per call). Running it
+inline in sync route handlers holds one of Starlette's threadpool slots for the
+whole duration, so a burst of logins starves every other sync route.
+
+This module provides a dedicated executor for CPU-bound hashing work:
+- thread or process pool, selected via `settings.HASH_EXECUTOR`
+- admission control: at most `workers + HASH_QUEUE_LIMIT` jobs are accepted at
+  once; beyond that, callers get `ServiceUnavailableException` (HTTP 503)
+  instead of piling up behind the pool
+- metrics for time spent waiting in the queue vs. time spent hashing
+
+Notes:
+    - Functions submitted to a process pool must be picklable (module-level).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.config import settings
+from app.exceptions import ServiceUnavailableException
+from app.metrics import registry
+
+T = TypeVar("T")
+
+_queue_wait = registry.histogram(
+    "hashing_queue_wait_seconds",
+    "Time hashing jobs spend waiting for a free worker.",
+    labelnames=("operation",),
+)
+_hash_time = registry.histogram(
+    "hashing_duration_seconds",
+    "Time spent executing hashing jobs inside a worker.",
+    labelnames=("operation",),
+)
+_rejected = registry.counter(
+    "hashing_rejected_total",
+    "Hashing jobs rejected because the queue was full.",
+    labelnames=("operation",),
+)
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> tuple[float, float, T]:
+    """
+    Run `fn(*args)` and report when it started and finished.
+
+    `time.monotonic()` is system-wide on the platforms we deploy to, so the
+    timestamps are comparable across processes.
+    """
+    started = time.monotonic()
+    result = fn(*args)
+    return started, time.monotonic(), result
+
+
+class HashingExecutor:
+    """
+    Size-bounded executor for CPU-bound hashing jobs.
+
+    Args:
+        kind: "thread" or "process".
+        max_workers: Number of workers (<= 0 means number of CPUs).
+        queue_limit: Max jobs allowed to wait for a worker.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int = 0, queue_limit: int = 64) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unsupported hashing executor: {kind}")
+
+        self.kind = kind
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self.queue_limit = max(queue_limit, 0)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._pool: Executor | None = None
+
+    @property
+    def capacity(self) -> int:
+        """Max number of admitted jobs (running + queued)."""
+        return self.max_workers + self.queue_limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted jobs (running + queued)."""
+        return self._in_flight
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of capacity in use (0.0 - 1.0)."""
+        return self._in_flight / self.capacity
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    if self.kind == "process":
+                        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._pool = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix="hashing",
+                        )
+        return self._pool
+
+    def _try_acquire(self) -> bool:
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                return False
+            self._in_flight += 1
+            return True
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., T], *args: Any, operation: str = "hash") -> T:
+        """
+        Execute `fn(*args)` on the pool without blocking the event loop.
+
+        Args:
+            fn: Callable to execute (module-level for process pools).
+            *args: Positional arguments for `fn`.
+            operation: Label used for metrics (e.g. "hash", "verify").
+
+        Raises:
+            ServiceUnavailableException: If the pool queue is full.
+
+        Returns:
+            The value returned by `fn`.
+        """
+        if not self._try_acquire():
+            _rejected.inc(operation=operation)
+            raise ServiceUnavailableException("Servicio saturado, intenta nuevamente")
+
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        try:
+            started, finished, result = await loop.run_in_executor(
+                self._get_pool(), _timed_call, fn, *args
+            )
+        finally:
+            self._release()
+
+        _queue_wait.observe(max(started - submitted, 0.0), operation=operation)
+        _hash_time.observe(finished - started, operation=operation)
+        return result
+
+    def map(self, fn: Callable[[Any], T], items: list[Any]) -> list[T]:
+        """
+        Run `fn` over `items` on the pool and wait for every result (batch jobs).
+
+        Intended for offline work such as bulk imports: it blocks the caller
+        and bypasses admission control, so never call it from the event loop
+        or with the shared request-path executor.
+
+        Args:
+            fn: Single-argument callable (module-level for process pools).
+            items: Inputs, one job each.
+
+        Returns:
+            list: Results in input order.
+        """
+        if not items:
+            return []
+        chunksize = max(1, len(items) // (self.max_workers * 4)) if self.kind == "process" else 1
+        return list(self._get_pool().map(fn, items, chunksize=chunksize))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying pool (a new one is created on next use)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+_executor: HashingExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_hashing_executor() -> HashingExecutor:
+    """
+    Return the process-wide hashing executor configured from settings.
+
+    Returns:
+        HashingExecutor: Shared executor instance.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = HashingExecutor(
+                    kind=settings.HASH_EXECUTOR,
+                    max_workers=settings.HASH_WORKERS,
+                    queue_limit=settings.HASH_QUEUE_LIMIT,
+                )
+    return _executor
@@ -0,0 +1,104 @@
+"""
+JWT encode/decode backends.
+
+`AuthService` signs and verifies tokens through a small backend interface so
+the JWT library can be swapped via `settings.JWT_BACKEND`:
+
+- "jose": python-jose (default, historical behavior).
+- "pyjwt": PyJWT (actively maintained; benchmark before switching, see
+  `benchmarks/bench_jwt_decode.py`).
+
+Both backends validate the signature and the `exp` claim and raise
+`InvalidTokenError` on any failure. The JWT library is imported on first use
+(or by `load()`), keeping it out of application startup.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Protocol
+
+
+class InvalidTokenError(Exception):
+    """Raised when a token is malformed, badly signed or expired."""
+
+
+class JWTBackend(Protocol):
+    """Interface implemented by JWT backends."""
+
+    def encode(self, claims: dict[str, Any], key: str, algorithm: str) -> str:
+        """Sign `claims` and return the compact JWT."""
+
+    def decode(self, token: str, key: str, algorithms: list[str]) -> dict[str, Any]:
+        """Verify `token` and return its claims."""
+
+    def load(self) -> None:
+        """Import the underlying library now instead of on first use."""
+
+
+class JoseJWTBackend:
+    """python-jose backend."""
+
+    def __init__(self) -> None:
+        self._jwt: Any = None
+        self._error: type[Exception] = Exception
+
+    def load(self) -> None:
+        if self._jwt is None:
+            from jose import JWTError, jwt
+
+            self._error = JWTError
+            self._jwt = jwt
+
+    def encode(self, claims: dict[str, Any], key: str, algorithm: str) -> str:
+        self.load()
+        return self._jwt.encode(claims, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithms: list[str]) -> dict[str, Any]:
+        self.load()
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._error as exc:
+            raise InvalidTokenError(str(exc)) from exc
+
+
+class PyJWTBackend:
+    """PyJWT backend."""
+
+    def __init__(self) -> None:
+        self._jwt: Any = None
+
+    def load(self) -> None:
+        if self._jwt is None:
+            import jwt
+
+            self._jwt = jwt
+
+    def encode(self, claims: dict[str, Any], key: str, algorithm: str) -> str:
+        self.load()
+        return self._jwt.encode(claims, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithms: list[str]) -> dict[str, Any]:
+        self.load()
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._jwt.PyJWTError as exc:
+            raise InvalidTokenError(str(exc)) from exc
+
+
+_BACKENDS: dict[str, type] = {
+    "jose": JoseJWTBackend,
+    "pyjwt": PyJWTBackend,
+}
+
+
+def create_jwt_backend(name: str) -> JWTBackend:
+    """
+    Build the JWT backend called `name`.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unsupported JWT backend: {name}") from None
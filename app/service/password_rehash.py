@@ -0,0 +1,154 @@
+"""
+Background rehash of passwords stored with an outdated bcrypt cost.
+
+Changing `AUTH_BCRYPT_ROUNDS` only affects new hashes. Existing ones are
+migrated lazily: after a successful login (the only time the plaintext is
+known) the service hands the password to `PasswordRehasher`, which hashes it
+with the current cost on its own worker thread and swaps the stored hash with
+a compare-and-swap UPDATE. The login response never waits for it.
+
+Notes:
+    - One worker and a small bound on pending jobs: rehashing competes with
+      logins for CPU, so it is throttled and deduplicated per user. Jobs that
+      don't fit are dropped; the user is rehashed on a later login.
+    - Plaintext passwords stay in memory only until their job runs.
+    - Per process; a user that logs in on two workers may be rehashed twice
+      (the compare-and-swap makes the second write a no-op).
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.dependencies.db import SessionLocal
+from app.logger import logger
+from app.metrics import registry
+from app.repositories.user_repository import UserRepository
+from app.service.auth_service import AuthService, _hash
+
+_rehashes = registry.counter(
+    "password_rehash_total", "Background password rehashes by outcome.", labelnames=("result",)
+)
+
+
+class PasswordRehasher:
+    """
+    Single-worker queue of password rehash jobs.
+
+    Args:
+        session_factory: Callable returning a new SQLAlchemy `Session`.
+        max_pending: Max jobs queued or running; extra jobs are dropped.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal, max_pending: int = 64) -> None:
+        self.session_factory = session_factory
+        self.max_pending = max_pending
+        self._pending: set[int] = set()
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def schedule(self, user_id: int, password: str, hashed_password: str) -> bool:
+        """
+        Queue a rehash of `user_id`'s password.
+
+        Args:
+            user_id: User primary key.
+            password: Plaintext password that just verified against `hashed_password`.
+            hashed_password: Currently stored hash.
+
+        Returns:
+            bool: True if queued; False if already pending or the queue is full.
+        """
+        with self._lock:
+            if user_id in self._pending or len(self._pending) >= self.max_pending:
+                _rehashes.inc(result="dropped")
+                return False
+            self._pending.add(user_id)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rehash")
+            pool = self._pool
+        pool.submit(self._run, user_id, password, hashed_password)
+        return True
+
+    def _run(self, user_id: int, password: str, hashed_password: str) -> None:
+        try:
+            new_hash = _hash(password)
+            with self.session_factory() as db:
+                replaced = UserRepository(db).replace_password_hash(user_id, hashed_password, new_hash)
+        except Exception:  # noqa: BLE001 - retried on the user's next login
+            _rehashes.inc(result="error")
+            logger.exception("Password rehash failed: user_id=%s", user_id)
+            return
+        finally:
+            with self._lock:
+                self._pending.discard(user_id)
+
+        _rehashes.inc(result="rehashed" if replaced else "stale")
+        logger.debug("Password rehashed: user_id=%s replaced=%s", user_id, replaced)
+
+    def stop(self) -> None:
+        """Wait for queued rehashes and release the worker thread."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+_rehasher: PasswordRehasher | None = None
+_rehasher_lock = threading.Lock()
+
+
+def get_password_rehasher() -> PasswordRehasher:
+    """
+    Return the process-wide rehasher, writing through `SessionLocal`.
+
+    Returns:
+        PasswordRehasher: Shared rehasher (its worker starts on first use).
+    """
+    global _rehasher
+    if _rehasher is None:
+        with _rehasher_lock:
+            if _rehasher is None:
+                _rehasher = PasswordRehasher(SessionLocal)
+    return _rehasher
+
+
+def set_password_rehasher(rehasher: PasswordRehasher | None) -> None:
+    """Replace the process-wide rehasher (e.g. in tests); None rebuilds it from settings."""
+    global _rehasher
+    _rehasher = rehasher
+
+
+def shutdown_password_rehasher() -> None:
+    """Finish pending rehashes and stop the process-wide rehasher, if it was ever used."""
+    global _rehasher
+    if _rehasher is not None:
+        _rehasher.stop()
+        _rehasher = None
+
+
+def rehash_if_needed(user_id: int, password: str, hashed_password: str) -> bool:
+    """
+    Queue a rehash when `hashed_password` doesn't use the configured cost.
+
+    Called after a successful login; a no-op when `AUTH_REHASH_ON_LOGIN` is off.
+
+    Args:
+        user_id: Authenticated user ID.
+        password: Plaintext password that was just verified.
+        hashed_password: Stored hash it was verified against.
+
+    Returns:
+        bool: True if a rehash was queued.
+    """
+    if not settings.AUTH_REHASH_ON_LOGIN or not AuthService().needs_rehash(hashed_password):
+        return False
+    return get_password_rehasher().schedule(user_id, password, hashed_password)
@@ -0,0 +1,160 @@
+"""
+Refresh-token service (business layer).
+
+Issues a refresh token at login and exchanges it for a new access token
+without the user's password, so renewing a session costs an HMAC check and
+one indexed UPDATE instead of a bcrypt verify and a `last_login_at` write.
+
+Rotation:
+    Every refresh returns a new refresh token (the family's next generation)
+    and invalidates the presented one. Presenting an already-rotated token
+    means two parties hold the family (e.g. a stolen token), so the whole
+    family is revoked and its owner must log in again.
+"""
+
+from __future__ import annotations
+
+import logging
+import secrets
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.cache.revocations import revoked_families
+from app.config import settings
+from app.exceptions import UnauthorizedException
+from app.metrics import registry
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.repositories.user_repository import UserRepository
+from app.service.auth_service import AuthService
+from app.service.jwt_backends import InvalidTokenError
+
+log = logging.getLogger(__name__)
+
+_operations = registry.counter(
+    "refresh_tokens_total", "Refresh-token operations by outcome.", labelnames=("result",)
+)
+
+
+def _expired(expires_at: datetime, now: datetime) -> bool:
+    # SQLite returns naive datetimes; every stored value is UTC.
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at <= now
+
+
+def _invalid(result: str) -> UnauthorizedException:
+    _operations.inc(result=result)
+    return UnauthorizedException("Refresh token inválido")
+
+
+class RefreshTokenService:
+    """
+    Service responsible for issuing, rotating and revoking refresh tokens.
+
+    Args:
+        db: SQLAlchemy session scoped to the current request.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.repo = RefreshTokenRepository(db)
+        self.users = UserRepository(db)
+        self.auth = AuthService()
+
+    def issue(self, user_id: int) -> str:
+        """
+        Start a new token family for a freshly authenticated user.
+
+        Args:
+            user_id: Authenticated user ID.
+
+        Returns:
+            str: Refresh token (generation 0).
+        """
+        family_id = secrets.token_hex(16)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        self.repo.create(family_id, user_id, expires_at)
+        _operations.inc(result="issued")
+        return self.auth.create_refresh_token(family_id, 0)
+
+    async def issue_async(self, user_id: int) -> str:
+        """Async variant of `issue` (runs the INSERT in the threadpool)."""
+        return await run_in_threadpool(self.issue, user_id)
+
+    def _parse(self, token: str) -> tuple[str, int]:
+        try:
+            return self.auth.parse_refresh_token(token)
+        except InvalidTokenError:
+            raise _invalid("invalid") from None
+
+    def _rotate(self, family_id: str, generation: int) -> tuple[int, str]:
+        now = datetime.now(timezone.utc)
+        user_id = self.repo.rotate(family_id, generation, now)
+        if user_id is None:
+            raise self._rejection(family_id, generation, now)
+
+        user = self.users.get_by_id(user_id)
+        if user is None or not user.is_active:
+            raise _invalid("inactive")
+
+        _operations.inc(result="rotated")
+        return user_id, self.auth.create_refresh_token(family_id, generation + 1)
+
+    def _rejection(self, family_id: str, generation: int, now: datetime) -> UnauthorizedException:
+        # Only reached for well-signed tokens that failed the compare-and-swap.
+        family = self.repo.get(family_id)
+        if family is None:
+            return _invalid("invalid")
+        if family.revoked_at is not None:
+            revoked_families.add(family_id, family.expires_at)
+            return _invalid("revoked")
+        if _expired(family.expires_at, now):
+            return _invalid("expired")
+        if generation < family.generation:
+            expires_at = self.repo.revoke(family_id, now)
+            if expires_at is not None:
+                revoked_families.add(family_id, expires_at)
+            log.warning(
+                "Refresh token reuse detected; family revoked: user_id=%s family=%s",
+                family.user_id,
+                family_id,
+            )
+            return _invalid("reused")
+        return _invalid("invalid")
+
+    async def rotate_async(self, token: str) -> tuple[int, str]:
+        """
+        Exchange a refresh token for the next one in its family.
+
+        Args:
+            token: Refresh token presented by the client.
+
+        Raises:
+            UnauthorizedException: If the token is malformed, forged, expired,
+                revoked, already used, or its user is inactive.
+
+        Returns:
+            tuple[int, str]: Owner user ID and the new refresh token.
+        """
+        family_id, generation = self._parse(token)
+        if family_id in revoked_families:
+            raise _invalid("revoked")
+        return await run_in_threadpool(self._rotate, family_id, generation)
+
+    def _revoke(self, family_id: str) -> None:
+        expires_at = self.repo.revoke(family_id, datetime.now(timezone.utc))
+        if expires_at is not None:
+            revoked_families.add(family_id, expires_at)
+        _operations.inc(result="logout")
+
+    async def revoke_async(self, token: str) -> None:
+        """
+        Revoke the family of a refresh token (logout; idempotent).
+
+        Raises:
+            UnauthorizedException: If the token is malformed or forged.
+        """
+        family_id, _ = self._parse(token)
+        await run_in_threadpool(self._revoke, family_id)
+
@@ -11,12 +11,15 @@ The service should not implement raw SQL or DB session lifecycle management.
 from __future__ import annotations
 
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.cache.emails import get_email_filter
+from app.config import settings
 from app.exceptions import BadRequestException
 from app.logger import logger
-from app.repositories.user_repository import UserRepository
+from app.repositories.user_repository import DuplicateEmailError, UserRepository
 from app.service.auth_service import AuthService
-from app.exceptions import BadRequestException
+from app.service.password_rehash import rehash_if_needed
 
 class UserService:
     """
@@ -29,7 +32,7 @@ class UserService:
     def __init__(self, db: Session) -> None:
         self.repo = UserRepository(db)
         self.auth = AuthService()
-        logger.info("UserService initialized (db-backed)")
+        logger.debug("UserService initialized (db-backed)")
 
     def list_users(self):
         """
@@ -38,15 +41,63 @@ class UserService:
         Returns:
             list[DBUser]: ORM user objects.
         """
-        logger.info("UserService.list_users() called")
+        logger.debug("UserService.list_users() called")
         return self.repo.list_users()
 
+    async def list_users_async(self):
+        """
+        Async variant of `list_users` (runs the query in the threadpool).
+
+        Returns:
+            list[DBUser]: ORM user objects.
+        """
+        return await run_in_threadpool(self.list_users)
+
+    async def list_user_rows_page_async(self, limit: int, after_id: int | None = None):
+        """
+        Return one keyset page of public user columns (runs the query in the threadpool).
+
+        Args:
+            limit: Max number of rows to return.
+            after_id: Return only users after this ID.
+
+        Returns:
+            list[Row]: `(id, email, full_name, is_active)` rows.
+        """
+        return await run_in_threadpool(self.repo.list_user_rows_page, limit, after_id)
+
+    async def list_user_versions_page_async(self, limit: int, after_id: int | None = None):
+        """
+        Return `(id, updated_at)` for one keyset page (runs the query in the threadpool).
+
+        Args:
+            limit: Max number of rows to return.
+            after_id: Return only users after this ID.
+
+        Returns:
+            list[Row]: `(id, updated_at)` rows.
+        """
+        return await run_in_threadpool(self.repo.list_user_versions_page, limit, after_id)
+
+    def iter_user_rows(self, after_id: int | None = None):
+        """
+        Stream public user columns in ascending ID order.
+
+        Args:
+            after_id: Start after this ID.
+
+        Returns:
+            Iterator[Row]: `(id, email, full_name, is_active)` rows.
+        """
+        return self.repo.iter_user_rows(after_id, batch_size=settings.USERS_STREAM_BATCH_SIZE)
+
     def register_user(self, email: str, password: str, full_name: str | None = None):
         """
         Register a new user in the database.
 
         Business rules:
-            - Email must be unique.
+            - Email must be unique (enforced by the unique index on insert,
+              so concurrent registrations of one email cannot both succeed).
             - Password is stored as a bcrypt hash (never store plaintext).
 
         Args:
@@ -60,17 +111,16 @@ class UserService:
         Returns:
             DBUser: Newly created ORM user.
         """
-        existing = self.repo.get_by_email(email)
-        if existing is not None:
-            raise BadRequestException("El email ya está registrado")
-
         hashed_password = self.auth.hash_password(password)
 
-        user = self.repo.create_user(
-            email=email,
-            hashed_password=hashed_password,
-            full_name=full_name,
-        )
+        try:
+            user = self.repo.create_user(
+                email=email,
+                hashed_password=hashed_password,
+                full_name=full_name,
+            )
+        except DuplicateEmailError:
+            raise BadRequestException("El email ya está registrado") from None
 
         logger.info("User registered successfully: user_id=%s email=%s", user.id, user.email)
         return user
@@ -79,6 +129,10 @@ class UserService:
         """
         Authenticate a user by and password.
 
+        Unknown emails get the same treatment as wrong passwords: a dummy
+        verify keeps the timing uniform, and with the email filter enabled
+        emails that were never registered skip the database.
+
         Args:
             email: User email.
             password: User password.
@@ -90,13 +144,82 @@ class UserService:
             DBUser | None: Authenticated user if found; otherwise None.
         """
 
+        email_filter = get_email_filter()
+        if email_filter is not None and not email_filter.might_exist(email):
+            self.auth.verify_dummy(password)
+            raise BadRequestException("Credenciales inválidas")
+
         user = self.repo.get_by_email(email)
         if user is None:
+            if email_filter is not None:
+                email_filter.record_miss()
+            self.auth.verify_dummy(password)
             raise BadRequestException("Credenciales inválidas")
         
         if not self.auth.verify_password(password, user.hashed_password):
             raise BadRequestException("Credenciales inválidas")
+        rehash_if_needed(user.id, password, user.hashed_password)
         
         # Track last login
         self.repo.update_last_login(user)
         return user
+
+    async def register_user_async(self, email: str, password: str, full_name: str | None = None):
+        """
+        Async variant of `register_user` for async route handlers.
+
+        bcrypt runs on the hashing pool and the INSERT runs in the
+        threadpool, so no threadpool slot is held for the duration of the hash.
+
+        Raises:
+            BadRequestException: If the email is already registered.
+            ServiceUnavailableException: If the hashing queue is full.
+
+        Returns:
+            DBUser: Newly created ORM user.
+        """
+        hashed_password = await self.auth.hash_password_async(password)
+
+        try:
+            user = await run_in_threadpool(
+                self.repo.create_user,
+                email=email,
+                hashed_password=hashed_password,
+                full_name=full_name,
+            )
+        except DuplicateEmailError:
+            raise BadRequestException("El email ya está registrado") from None
+
+        logger.info("User registered successfully: user_id=%s email=%s", user.id, user.email)
+        return user
+
+    async def authenticate_user_async(self, email: str, password: str):
+        """
+        Async variant of `authenticate_user` for async route handlers.
+
+        Raises:
+            BadRequestException: If the email is not found or the password is invalid.
+            ServiceUnavailableException: If the hashing queue is full.
+
+        Returns:
+            DBUser: Authenticated user.
+        """
+        email_filter = get_email_filter()
+        if email_filter is not None and not email_filter.might_exist(email):
+            await self.auth.verify_dummy_async(password)
+            raise BadRequestException("Credenciales inválidas")
+
+        user = await run_in_threadpool(self.repo.get_by_email, email)
+        if user is None:
+            if email_filter is not None:
+                email_filter.record_miss()
+            await self.auth.verify_dummy_async(password)
+            raise BadRequestException("Credenciales inválidas")
+
+        if not await self.auth.verify_password_async(password, user.hashed_password):
+            raise BadRequestException("Credenciales inválidas")
+        rehash_if_needed(user.id, password, user.hashed_password)
+
+        # Track last login
+        await run_in_threadpool(self.repo.update_last_login, user)
+        return user
@@ -7,7 +7,7 @@ los datos expuestos por la API.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, model_validator
 
 
 class UserResponse(BaseModel):
@@ -35,6 +35,18 @@ class TokenResponse(BaseModel):
 
     access_token: str = Field(..., description="JWT de acceso")
     token_type: str = Field("bearer", description="Tipo de token (Bearer)")
+    refresh_token: str | None = Field(
+        default=None,
+        description="Token opaco para renovar el acceso en `/token/refresh` (rota en cada uso)",
+    )
+
+
+class RefreshTokenRequest(BaseModel):
+    """
+    Esquema de entrada para renovar o revocar un refresh token.
+    """
+
+    refresh_token: str = Field(..., max_length=256, description="Refresh token recibido en login o en la última renovación")
 
 
 class UserCreate(BaseModel):
@@ -44,3 +56,50 @@ class UserCreate(BaseModel):
     email: EmailStr = Field(..., description="Correo electrónico del usuario")
     password: str = Field(..., min_length=6, max_length=72, description="Contraseña (máx 72 bytes para bcrypt)")
     full_name: str | None = Field(default=None, description="Nombre completo del usuario")
+
+
+class UserImportRow(BaseModel):
+    """
+    Fila de importación masiva de usuarios (NDJSON o CSV).
+
+    Debe incluir exactamente uno de `password` (texto plano, se hashea) o
+    `hashed_password` (hash bcrypt ya calculado).
+    """
+
+    email: EmailStr
+    password: str | None = Field(default=None, min_length=6, max_length=72)
+    hashed_password: str | None = None
+    full_name: str | None = None
+
+    @model_validator(mode="after")
+    def _one_password(self) -> "UserImportRow":
+        if (self.password is None) == (self.hashed_password is None):
+            raise ValueError("se requiere exactamente uno de password o hashed_password")
+        if self.password is not None and len(self.password.encode("utf-8")) > 72:
+            raise ValueError("password supera 72 bytes (límite de bcrypt)")
+        if self.hashed_password is not None and not self.hashed_password.startswith("$2"):
+            raise ValueError("hashed_password debe ser un hash bcrypt")
+        return self
+
+
+class UserImportError(BaseModel):
+    """
+    Error de una fila de la importación masiva.
+    """
+
+    line: int = Field(..., description="Número de línea en el archivo (1 = primera línea)")
+    email: str | None = Field(default=None, description="Email de la fila, si se pudo leer")
+    error: str = Field(..., description="Motivo del rechazo")
+
+
+class UserImportReport(BaseModel):
+    """
+    Resultado de una importación masiva de usuarios.
+    """
+
+    total: int = Field(0, description="Filas procesadas")
+    created: int = Field(0, description="Usuarios creados")
+    duplicates: int = Field(0, description="Filas omitidas por email repetido o ya registrado")
+    invalid: int = Field(0, description="Filas rechazadas por datos inválidos")
+    errors: list[UserImportError] = Field(default_factory=list, description="Detalle por fila")
+    errors_truncated: bool = Field(False, description="True si se omitieron errores del detalle")
@@ -0,0 +1,127 @@
+"""
+Opt-in SQLite production profile (`SQLITE_TUNING=true`).
+
+With the stock configuration every connection may write, and SQLite's
+rollback journal blocks readers while a writer commits, so concurrent
+registrations and last-login updates end in `database is locked`. This
+profile:
+
+- applies WAL and performance pragmas on every new connection
+  (`journal_mode=WAL`, `synchronous=NORMAL`, `mmap_size`, `cache_size`,
+  `busy_timeout`), so readers never block the writer and vice versa
+- routes all writes through a dedicated writer engine whose pool holds a
+  single connection: concurrent writers queue on the pool (FIFO, bounded by
+  `DB_POOL_TIMEOUT`) instead of racing for SQLite's file lock
+- starts writer transactions with `BEGIN IMMEDIATE`, so the write lock is
+  taken up front rather than upgraded mid-transaction (the classic source
+  of unrecoverable SQLITE_BUSY errors)
+- keeps reads on the regular pool, which fans out across connections
+
+Routing (see `routing_session_class`): a session uses the reader engine until
+it flushes or executes an INSERT/UPDATE/DELETE; from then on, until the
+transaction ends, every statement goes to the writer so the session reads its
+own uncommitted changes.
+
+Only file-backed SQLite URLs are affected; in-memory databases and other
+dialects ignore the profile.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.config import settings
+from app.db_pool import is_sqlite_memory
+
+_WRITER_FLAG = "sqlite_writer"
+
+
+def sqlite_tuning_enabled(database_url: str) -> bool:
+    """Return True if the tuned profile applies to `database_url`."""
+    return (
+        settings.SQLITE_TUNING
+        and make_url(database_url).get_backend_name() == "sqlite"
+        and not is_sqlite_memory(database_url)
+    )
+
+
+def _pragmas() -> list[str]:
+    return [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        # Negative values are KiB rather than pages.
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KIB}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        "PRAGMA foreign_keys=ON",
+    ]
+
+
+def configure_sqlite_engine(engine: Any, writer: bool = False) -> None:
+    """
+    Install the profile's connection events on an engine.
+
+    Args:
+        engine: `Engine` or `AsyncEngine` for a file-backed SQLite database.
+        writer: If True, transactions start with `BEGIN IMMEDIATE`.
+    """
+    sync_engine: Engine = getattr(engine, "sync_engine", engine)
+    pragmas = _pragmas()
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, _record) -> None:
+        if writer:
+            # Disable the driver's implicit BEGIN; `_on_begin` emits our own.
+            dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    if writer:
+
+        @event.listens_for(sync_engine, "begin")
+        def _on_begin(connection) -> None:
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def writer_pool_options(options: dict[str, Any]) -> dict[str, Any]:
+    """Restrict pool options to a single connection (the writer queue)."""
+    return {**options, "pool_size": 1, "max_overflow": 0}
+
+
+def routing_session_class(reader: Any, writer: Any, base: type[Session] = Session) -> type[Session]:
+    """
+    Build a `Session` subclass routing reads to `reader` and writes to `writer`.
+
+    Args:
+        reader: Engine (or `AsyncEngine`) used for reads.
+        writer: Single-connection engine (or `AsyncEngine`) used for writes.
+        base: Session class to extend.
+
+    Returns:
+        type[Session]: Session class; use it as `class_` for `sessionmaker` or
+            as `sync_session_class` for `async_sessionmaker`.
+    """
+    reader_engine: Engine = getattr(reader, "sync_engine", reader)
+    writer_engine: Engine = getattr(writer, "sync_engine", writer)
+
+    class SQLiteRoutingSession(base):
+        def get_bind(self, mapper=None, *, clause=None, **kw):
+            if self._flushing or isinstance(clause, UpdateBase):
+                self.info[_WRITER_FLAG] = True
+            return writer_engine if self.info.get(_WRITER_FLAG) else reader_engine
+
+    @event.listens_for(SQLiteRoutingSession, "after_transaction_end")
+    def _reset_route(session: Session, transaction: SessionTransaction) -> None:
+        if transaction.parent is None:
+            session.info.pop(_WRITER_FLAG, None)
+
+    return SQLiteRoutingSession
@@ -0,0 +1,46 @@
+"""
+Post-startup warm-up.
+
+Several costs are deferred out of application import to keep cold starts
+short: passlib/bcrypt, the JWT library, and the OpenAPI schema (normally
+built on the first `/openapi.json` or `/docs` request).
+`warm_up()` pays them on a worker thread right after startup, so the
+service accepts traffic sooner and the first real requests don't pay them
+either. It is idempotent: `app.server` runs it once before forking, so the
+workers' lifespan call is then nearly free.
+
+Enabled by `STARTUP_WARMUP` (default on); scheduled by `app.lifespan`,
+together with pool pre-warming.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from fastapi import FastAPI
+
+from app.service import auth_service
+
+log = logging.getLogger(__name__)
+
+
+def warm_up(app: FastAPI) -> None:
+    """
+    Build lazily initialized state ahead of the first requests.
+
+    Args:
+        app: Application whose OpenAPI schema is pre-built (and cached on
+            `app.openapi_schema`).
+
+    Notes:
+        - Runs in a worker thread; failures are logged and never affect startup.
+    """
+    started = time.perf_counter()
+    try:
+        app.openapi()
+        auth_service.warm_up()
+    except Exception:  # noqa: BLE001 - warm-up is best effort
+        log.exception("Startup warm-up failed")
+        return
+    log.info("Startup warm-up finished in %.0f ms", (time.perf_counter() - started) * 1000)
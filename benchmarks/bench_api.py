@@ -0,0 +1,494 @@
+"""
+Benchmark: throughput, latency and allocations of the v1 API endpoints.
+
+Seeds `--users` accounts, then drives each endpoint with `--concurrency`
+concurrent requests and reports, per endpoint: requests/s, p50/p95/p99
+latency, error count and (in-process only) allocations per request.
+
+Endpoints:
+    login      POST /api/v1/login (bcrypt verify)
+    register   POST /api/v1/register (bcrypt hash, unique emails)
+    get_users  GET  /api/v1/users
+    secure     GET  /api/v1/secure (JWT + user lookup)
+
+Targets:
+    - in-process (default): the ASGI app is called through `httpx.ASGITransport`
+      against a temporary SQLite file; no sockets, fully offline
+    - `--uvicorn`: spawns a local uvicorn (`--workers`) on a free port against a
+      temporary SQLite file
+    - `--url`: an already running server; users are seeded through
+      `/api/v1/register` (existing accounts are reused)
+
+Allocations are measured with `tracemalloc` on a separate sequential pass
+(`--alloc-samples` requests per endpoint) so tracing does not distort the
+throughput numbers: `alloc_peak_kib` is the median peak of traced memory
+during one request, `alloc_net_kib` the mean memory still held afterwards.
+
+Results can be written as JSON (`--output`) and diffed between commits;
+`--baseline` compares against a previous result and exits with status 1 if
+any endpoint regressed by more than `--threshold`. Comparing two saved files
+without running anything:
+
+    python -m benchmarks.bench_api compare baseline.json current.json
+
+Usage:
+    JWT_SECRET_KEY=test python -m benchmarks.bench_api run --requests 500 --concurrency 32
+    JWT_SECRET_KEY=test python -m benchmarks.bench_api run --uvicorn --workers 2 --output current.json
+    JWT_SECRET_KEY=test python -m benchmarks.bench_api run --baseline baseline.json --threshold 0.15
+
+Notes:
+    - login and register are bound by bcrypt, so they report far fewer
+      requests/s than the other endpoints and get their own request count
+      (`--bcrypt-requests`); use `--endpoints` to run a subset.
+    - `DEBUG=false`, `APP_ENV=production` and `RATE_LIMIT_ENABLED=false` are
+      used unless set in the environment.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+
+# The client's own per-request INFO lines would go through the app's log pipeline.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+ENDPOINTS = ("login", "register", "get_users", "secure")
+#: Endpoints dominated by bcrypt; measured with `--bcrypt-requests`.
+BCRYPT_ENDPOINTS = ("login", "register")
+PASSWORD = "bench-password"
+API = "/api/v1"
+
+#: metric -> True if higher is better. Checked by `compare()` unless overridden.
+METRICS = {
+    "rps": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "alloc_peak_kib": False,
+}
+DEFAULT_CHECKED = ("rps", "p95_ms", "alloc_peak_kib")
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+def _email(n: int) -> str:
+    return f"user-{n}@example.com"
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    """
+    Build the result row of one endpoint.
+
+    Args:
+        latencies: Per-request latency in seconds.
+        errors: Responses that were not 2xx (or failed to complete).
+        elapsed: Wall time of the measured pass in seconds.
+    """
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+    }
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float,
+    metrics: tuple[str, ...] = DEFAULT_CHECKED,
+) -> list[str]:
+    """
+    Compare two benchmark results.
+
+    Args:
+        baseline: Previous `run` output.
+        current: New `run` output.
+        threshold: Allowed relative degradation (0.15 = 15%).
+        metrics: Metrics checked (see `METRICS`).
+
+    Returns:
+        list[str]: One message per regression (empty if none).
+
+    Notes:
+        - Endpoints or metrics missing on either side (e.g. allocations of a
+          remote run) are skipped.
+        - An endpoint that had no errors in the baseline regresses on any error.
+    """
+    regressions: list[str] = []
+    for endpoint, new in current.get("results", {}).items():
+        old = baseline.get("results", {}).get(endpoint)
+        if old is None:
+            continue
+        if new.get("errors", 0) and not old.get("errors", 0):
+            regressions.append(f"{endpoint}: {new['errors']} errors (baseline had none)")
+        for metric in metrics:
+            before, after = old.get(metric), new.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            worse = -change if METRICS[metric] else change
+            if worse > threshold:
+                regressions.append(
+                    f"{endpoint}: {metric} {before:g} -> {after:g} ({change:+.1%}, limit {threshold:.0%})"
+                )
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# Targets
+# ---------------------------------------------------------------------------
+
+
+def _prepare_database(path: Path, users: int) -> str:
+    """
+    Point the app at a fresh SQLite file and seed `users` accounts.
+
+    Must run before `app.main` is imported: settings and engines are built at
+    import time from `DATABASE_URL`.
+    """
+    url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = url
+
+    from sqlalchemy import create_engine, insert
+
+    from app.dependencies.db import Base
+    from app.models import db_refresh_token  # noqa: F401 (registers its tables on Base)
+    from app.models.db_user import DBUser
+    from app.service.auth_service import _hash
+
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    hashed = _hash(PASSWORD)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(DBUser),
+            [{"email": _email(n), "hashed_password": hashed, "full_name": f"User {n}"} for n in range(users)],
+        )
+    engine.dispose()
+    return url
+
+
+@asynccontextmanager
+async def inprocess_client(workdir: Path, users: int) -> AsyncIterator[httpx.AsyncClient]:
+    """Client calling the ASGI app directly (lifespan included)."""
+    _prepare_database(workdir / "bench.db", users)
+
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_ready(client: httpx.AsyncClient, process: subprocess.Popen | None, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+        try:
+            if (await client.get(f"{API}/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+@asynccontextmanager
+async def uvicorn_client(
+    workdir: Path, users: int, concurrency: int, workers: int
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Spawn a local uvicorn against a seeded temporary database."""
+    _prepare_database(workdir / "bench.db", users)
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+        ],
+    )
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as client:
+            await _wait_ready(client, process)
+            yield client
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+@asynccontextmanager
+async def remote_client(url: str, users: int, concurrency: int) -> AsyncIterator[httpx.AsyncClient]:
+    """Client for an already running server; seeds users via `/register`."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url.rstrip("/"), limits=limits, timeout=60) as client:
+        await _wait_ready(client, None)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def register(n: int) -> None:
+            async with semaphore:
+                await client.post(
+                    f"{API}/register",
+                    json={"email": _email(n), "password": PASSWORD, "full_name": f"User {n}"},
+                )
+
+        await asyncio.gather(*(register(n) for n in range(users)))
+        yield client
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+
+async def _login(client: httpx.AsyncClient, n: int, users: int) -> httpx.Response:
+    return await client.post(f"{API}/login", data={"username": _email(n % users), "password": PASSWORD})
+
+
+async def build_requests(client: httpx.AsyncClient, users: int) -> dict[str, Request]:
+    """Return one request factory per endpoint (logs in once for `secure`)."""
+    response = await _login(client, 0, users)
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    run_id = uuid.uuid4().hex[:8]
+
+    async def login(c: httpx.AsyncClient, n: int) -> httpx.Response:
+        return await _login(c, n, users)
+
+    async def register(c: httpx.AsyncClient, n: int) -> httpx.Response:
+        return await c.post(
+            f"{API}/register",
+            json={"email": f"new-{run_id}-{n}@example.com", "password": PASSWORD},
+        )
+
+    async def get_users(c: httpx.AsyncClient, n: int) -> httpx.Response:
+        return await c.get(f"{API}/users")
+
+    async def secure(c: httpx.AsyncClient, n: int) -> httpx.Response:
+        return await c.get(f"{API}/secure", headers=headers)
+
+    return {"login": login, "register": register, "get_users": get_users, "secure": secure}
+
+
+async def drive(client: httpx.AsyncClient, request: Request, total: int, concurrency: int, offset: int = 0) -> dict:
+    """Send `total` requests with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one(n: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await request(client, n)
+                ok = response.is_success
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(offset + n) for n in range(total)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def measure_allocations(client: httpx.AsyncClient, request: Request, samples: int, offset: int) -> dict:
+    """Sequential `tracemalloc` pass: peak and retained memory per request."""
+    peaks: list[float] = []
+    retained: list[float] = []
+    tracemalloc.start()
+    try:
+        for n in range(samples):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await request(client, offset + n)
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_peak_kib": round(statistics.median(peaks) / 1024, 2),
+        "alloc_net_kib": round(statistics.fmean(retained) / 1024, 2),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Run the selected endpoints against the selected target."""
+    async with AsyncExitStack() as stack:
+        workdir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        if args.url:
+            target = args.url
+            client = await stack.enter_async_context(remote_client(args.url, args.users, args.concurrency))
+        elif args.uvicorn:
+            target = f"uvicorn (workers={args.workers})"
+            client = await stack.enter_async_context(
+                uvicorn_client(workdir, args.users, args.concurrency, args.workers)
+            )
+        else:
+            target = "in-process"
+            client = await stack.enter_async_context(inprocess_client(workdir, args.users))
+
+        requests = await build_requests(client, args.users)
+        results: dict[str, dict] = {}
+        for endpoint in args.endpoints:
+            request = requests[endpoint]
+            total = args.bcrypt_requests if endpoint in BCRYPT_ENDPOINTS else args.requests
+            warmup = min(args.warmup, total)
+            # Offsets keep register emails unique across warmup / measured / alloc passes.
+            await drive(client, request, warmup, args.concurrency, offset=0)
+            result = await drive(client, request, total, args.concurrency, offset=warmup)
+            if target == "in-process" and args.alloc_samples:
+                samples = min(args.alloc_samples, total)
+                result.update(await measure_allocations(client, request, samples, offset=warmup + total))
+            results[endpoint] = result
+            print(_format_row(endpoint, result), file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "target": target,
+            "users": args.users,
+            "requests": args.requests,
+            "bcrypt_requests": args.bcrypt_requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _format_row(endpoint: str, result: dict) -> str:
+    alloc = f"  alloc {result['alloc_peak_kib']:8.1f} KiB" if "alloc_peak_kib" in result else ""
+    return (
+        f"{endpoint:>10}: {result['rps']:8.1f} req/s  p50 {result['p50_ms']:8.2f} ms  "
+        f"p95 {result['p95_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  errors {result['errors']}{alloc}"
+    )
+
+
+def _check(baseline_path: str, current: dict, threshold: float, metrics: tuple[str, ...]) -> int:
+    baseline = json.loads(Path(baseline_path).read_text())
+    targets = (baseline.get("meta", {}).get("target"), current.get("meta", {}).get("target"))
+    if targets[0] != targets[1]:
+        print(f"warning: comparing different targets ({targets[0]} vs {targets[1]})", file=sys.stderr)
+    regressions = compare(baseline, current, threshold, metrics)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions against {baseline_path} (threshold {threshold:.0%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def _csv(choices: tuple[str, ...] | dict) -> Callable[[str], tuple[str, ...]]:
+    def parse(raw: str) -> tuple[str, ...]:
+        values = tuple(item.strip() for item in raw.split(",") if item.strip())
+        unknown = [value for value in values if value not in choices]
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown: {', '.join(unknown)} (choose from {', '.join(choices)})")
+        return values
+
+    return parse
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark")
+    target = run_parser.add_mutually_exclusive_group()
+    target.add_argument("--uvicorn", action="store_true", help="Spawn a local uvicorn")
+    target.add_argument("--url", help="Benchmark an already running server")
+    run_parser.add_argument("--workers", type=int, default=1, help="uvicorn workers (with --uvicorn)")
+    run_parser.add_argument("--endpoints", type=_csv(ENDPOINTS), default=ENDPOINTS)
+    run_parser.add_argument("--users", type=int, default=1000, help="Seeded accounts")
+    run_parser.add_argument("--requests", type=int, default=500, help="Measured requests per endpoint")
+    run_parser.add_argument("--bcrypt-requests", type=int, default=50, help="Measured requests for login/register")
+    run_parser.add_argument("--warmup", type=int, default=50, help="Unmeasured requests per endpoint")
+    run_parser.add_argument("--concurrency", type=int, default=32)
+    run_parser.add_argument("--alloc-samples", type=int, default=50, help="0 disables allocation tracing")
+    run_parser.add_argument("--output", help="Write the JSON result to this file")
+    run_parser.add_argument("--baseline", help="Previous JSON result to check against")
+
+    compare_parser = commands.add_parser("compare", help="Compare two JSON results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--threshold", type=float, default=0.15, help="Allowed relative regression")
+        sub.add_argument("--metrics", type=_csv(METRICS), default=DEFAULT_CHECKED, help="Metrics checked")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        current = json.loads(Path(args.current).read_text())
+        return _check(args.baseline, current, args.threshold, args.metrics)
+
+    # Benchmark the production configuration unless told otherwise (DEBUG logs every pool checkout).
+    os.environ.setdefault("DEBUG", "false")
+    os.environ.setdefault("APP_ENV", "production")
+    # Every request comes from one client IP; the login limiter would turn the run into 429s.
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    result = asyncio.run(run(args))
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return _check(args.baseline, result, args.threshold, args.metrics) if args.baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Benchmark: per-request JWT verification cost.
+
+Measures `AuthService.decode_access_token` for a bearer token reused across
+requests, with and without the verified-token cache, for each JWT backend.
+
+Usage:
+    JWT_SECRET_KEY=<32+ chars> python -m benchmarks.bench_jwt_decode --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.config import settings
+from app.service import auth_service
+from app.service.jwt_backends import create_jwt_backend
+
+
+def _per_call_us(iterations: int, cached: bool, backend: str) -> float:
+    settings.JWT_DECODE_CACHE_ENABLED = cached
+    auth_service._jwt_backend = create_jwt_backend(backend)
+    auth_service.token_cache.clear()
+
+    auth = auth_service.AuthService()
+    token = auth.create_access_token({"sub": "1"})
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        auth.decode_access_token(token)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--backends", nargs="+", default=["jose", "pyjwt"])
+    args = parser.parse_args()
+
+    print(f"{'backend':>8} | {'uncached us/req':>15} | {'cached us/req':>13} | speedup")
+    for backend in args.backends:
+        uncached = _per_call_us(args.iterations, cached=False, backend=backend)
+        cached = _per_call_us(args.iterations, cached=True, backend=backend)
+        print(f"{backend:>8} | {uncached:>15.2f} | {cached:>13.2f} | {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: database cost of a successful login, with and without write-behind.
+
+Each thread repeatedly runs the login persistence path (`get_by_email` +
+`update_last_login`) against a SQLite file and records per-login latency.
+bcrypt is excluded so the numbers isolate the last-login write.
+
+Usage:
+    JWT_SECRET_KEY=test python -m benchmarks.bench_last_login --threads 16 --logins 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.db_pool import pool_options
+from app.dependencies.db import Base
+from app.models.db_user import DBUser
+from app.repositories import last_login_buffer
+from app.repositories.user_repository import UserRepository
+
+_USERS = 500
+
+
+def _worker(factory: sessionmaker, worker_id: int, logins: int, latencies: list[float]) -> None:
+    for i in range(logins):
+        started = time.perf_counter()
+        with factory() as db:
+            repo = UserRepository(db)
+            user = repo.get_by_email(f"user-{(worker_id * logins + i) % _USERS}@bench.local")
+            repo.update_last_login(user)
+        latencies.append(time.perf_counter() - started)
+
+
+def _run(write_behind: bool, threads: int, logins: int) -> list[float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(
+            url, connect_args={"check_same_thread": False}, **pool_options(url, "bench")
+        )
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine, autoflush=False)
+        with factory() as db:
+            db.add_all(
+                DBUser(email=f"user-{n}@bench.local", hashed_password="x") for n in range(_USERS)
+            )
+            db.commit()
+
+        settings.LAST_LOGIN_WRITE_BEHIND = write_behind
+        last_login_buffer._buffer = last_login_buffer.LastLoginBuffer(
+            factory,
+            flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL_MS / 1000,
+            max_pending=settings.LAST_LOGIN_FLUSH_MAX_PENDING,
+        )
+
+        latencies: list[float] = []
+        workers = [
+            threading.Thread(target=_worker, args=(factory, n, logins, latencies))
+            for n in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        last_login_buffer.shutdown_last_login_buffer()
+        engine.dispose()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--logins", type=int, default=300, help="Logins per thread")
+    args = parser.parse_args()
+
+    for write_behind in (False, True):
+        latencies = sorted(_run(write_behind, args.threads, args.logins))
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+        label = "write-behind" if write_behind else "synchronous"
+        print(f"{label:>12}: p50 {p50:7.2f} ms  p99 {p99:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
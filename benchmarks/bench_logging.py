@@ -0,0 +1,114 @@
+"""
+Benchmark: request throughput with INFO logging, synchronous vs. queued.
+
+Serves a sync endpoint (run in Starlette's threadpool, like the app's DB
+routes) that emits three INFO records per request, and drives it with
+concurrent in-process requests. Compares:
+
+- sync: the previous setup (`basicConfig` + `StreamHandler`), where every
+  request thread formats and writes under the handler lock
+- queued: `app.logger.setup_logger()` (QueueHandler + JSON formatting on the
+  listener thread)
+
+Logs are written to a temporary file so real I/O is included.
+`--sink-latency-us` makes every write block for that long, emulating a
+backpressured stdout pipe (container log drivers, slow terminals).
+
+Usage:
+    JWT_SECRET_KEY=test python -m benchmarks.bench_logging --requests 5000 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.config import settings
+from app.logger import setup_logger, shutdown_logging
+
+log = logging.getLogger("bench")
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/work")
+    def work() -> dict:
+        log.info("Request started: path=%s", "/work")
+        log.info("Loaded %s rows for user_id=%s", 10, 42)
+        log.info("Request finished: status=%s", 200)
+        return {"ok": True}
+
+    return app
+
+
+class _SlowStream:
+    """File wrapper whose writes block like a backpressured pipe."""
+
+    def __init__(self, stream, latency: float) -> None:
+        self.stream = stream
+        self.latency = latency
+
+    def write(self, data: str) -> int:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.stream.write(data)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def _configure(mode: str, stream) -> None:
+    if mode == "queued":
+        setup_logger(stream=stream)
+    else:
+        shutdown_logging()
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s | %(levelname)s | %(message)s",
+            handlers=[logging.StreamHandler(stream)],
+            force=True,
+        )
+
+
+async def _drive(app: FastAPI, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one() -> None:
+            async with semaphore:
+                await client.get("/work")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--sink-latency-us", type=float, default=0.0, help="Blocking time per write")
+    args = parser.parse_args()
+
+    settings.DEBUG = False
+    settings.LOG_LEVEL = "info"
+    app = _build_app()
+
+    for mode in ("sync", "queued"):
+        with tempfile.TemporaryFile("w+") as file:
+            _configure(mode, _SlowStream(file, args.sink_latency_us / 1e6))
+            elapsed = asyncio.run(_drive(app, args.requests, args.concurrency))
+            shutdown_logging()
+        print(f"{mode:>6}: {args.requests / elapsed:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
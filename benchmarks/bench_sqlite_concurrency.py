@@ -0,0 +1,120 @@
+"""
+Benchmark: concurrent logins and registrations on a SQLite file.
+
+Runs N threads that each mix registrations (INSERT) and logins (SELECT +
+last-login UPDATE) against a fresh database file, once with the stock engine
+configuration and once with the SQLite production profile
+(`app.sqlite_profile`), and reports throughput and `database is locked`
+errors.
+
+Usage:
+    JWT_SECRET_KEY=test python -m benchmarks.bench_sqlite_concurrency --threads 32 --ops 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.db_pool import pool_options
+from app.dependencies.db import Base
+from app.models.db_user import DBUser
+from app.sqlite_profile import configure_sqlite_engine, routing_session_class, writer_pool_options
+
+_SEED_USERS = 200
+# Pre-computed so the benchmark measures the database, not bcrypt.
+_HASH = "$2b$12$" + "x" * 53
+
+
+def _session_factory(url: str, tuned: bool, busy_timeout: float) -> sessionmaker:
+    connect_args = {"check_same_thread": False, "timeout": busy_timeout}
+    engine = create_engine(url, connect_args=connect_args, **pool_options(url, "bench"))
+    if not tuned:
+        return sessionmaker(bind=engine, autoflush=False)
+
+    writer = create_engine(
+        url,
+        connect_args=connect_args,
+        **writer_pool_options(pool_options(url, "bench-writer")),
+    )
+    configure_sqlite_engine(engine)
+    configure_sqlite_engine(writer, writer=True)
+    return sessionmaker(class_=routing_session_class(engine, writer), autoflush=False)
+
+
+def _worker(factory: sessionmaker, worker_id: int, ops: int, errors: list[int]) -> None:
+    for i in range(ops):
+        db = factory()
+        try:
+            if i % 4 == 0:
+                db.add(DBUser(email=f"new-{worker_id}-{i}@bench.local", hashed_password=_HASH))
+            else:
+                email = f"seed-{(worker_id * ops + i) % _SEED_USERS}@bench.local"
+                user = db.execute(select(DBUser).where(DBUser.email == email)).scalar_one()
+                user.last_login_at = datetime.now(timezone.utc)
+            db.commit()
+        except OperationalError:
+            db.rollback()
+            errors[worker_id] += 1
+        finally:
+            db.close()
+
+
+def _run(tuned: bool, threads: int, ops: int, busy_timeout: float) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        factory = _session_factory(url, tuned, busy_timeout)
+
+        setup = create_engine(url)
+        Base.metadata.create_all(setup)
+        with sessionmaker(bind=setup)() as db:
+            db.add_all(
+                DBUser(email=f"seed-{n}@bench.local", hashed_password=_HASH)
+                for n in range(_SEED_USERS)
+            )
+            db.commit()
+        setup.dispose()
+
+        errors = [0] * threads
+        workers = [
+            threading.Thread(target=_worker, args=(factory, n, ops, errors))
+            for n in range(threads)
+        ]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+    return threads * ops / elapsed, sum(errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--ops", type=int, default=200, help="Operations per thread")
+    parser.add_argument(
+        "--busy-timeout",
+        type=float,
+        default=5.0,
+        help="Driver lock timeout in seconds (stock profile)",
+    )
+    args = parser.parse_args()
+
+    for tuned in (False, True):
+        throughput, errors = _run(tuned, args.threads, args.ops, args.busy_timeout)
+        label = "tuned" if tuned else "stock"
+        print(f"{label:>5}: {throughput:>8.0f} ops/s  locked errors: {errors}")
+
+
+if __name__ == "__main__":
+    main()
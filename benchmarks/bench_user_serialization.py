@@ -0,0 +1,87 @@
+"""
+Benchmark: serializing user listings (ORM + Pydantic vs. projected rows).
+
+Compares the previous `GET /users` path (load full `DBUser` entities, validate
+each through `UserResponse` with `from_attributes=True`, dump JSON) against the
+column-projected path (`UserRepository.list_user_rows_page` + `rows_to_json`).
+
+Usage:
+    JWT_SECRET_KEY=x python -m benchmarks.bench_user_serialization --sizes 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.dependencies.db import Base
+from app.models.db_user import DBUser
+from app.repositories.user_repository import UserRepository
+from app.serialization import rows_to_json
+from app.shemas.user_shema import UserResponse
+
+_FAKE_HASH = "$2b$12$" + "x" * 53
+
+
+def _seed(size: int):
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(DBUser),
+            [
+                {"email": f"user{i}@bench.com", "hashed_password": _FAKE_HASH, "full_name": f"User {i}"}
+                for i in range(size)
+            ],
+        )
+    return engine
+
+
+def _orm_pydantic(engine, size: int) -> bytes:
+    adapter = TypeAdapter(list[UserResponse])
+    with Session(engine) as db:
+        # Full entities, as the listing loaded them before the column projection.
+        users = db.scalars(select(DBUser).order_by(DBUser.id).limit(size)).all()
+        return adapter.dump_json(adapter.validate_python(users, from_attributes=True))
+
+
+def _projected_rows(engine, size: int) -> bytes:
+    with Session(engine) as db:
+        return rows_to_json(UserRepository(db).list_user_rows_page(size))
+
+
+def _measure(fn, engine, size: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(engine, size)
+        best = min(best, time.perf_counter() - started)
+    return size / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} | {'orm+pydantic rows/s':>20} | {'projected rows/s':>17} | speedup")
+    for size in args.sizes:
+        engine = _seed(size)
+        before = _measure(_orm_pydantic, engine, size, args.repeat)
+        after = _measure(_projected_rows, engine, size, args.repeat)
+        print(f"{size:>8} | {before:>20,.0f} | {after:>17,.0f} | {after / before:.1f}x")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
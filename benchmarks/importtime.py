@@ -0,0 +1,117 @@
+"""
+Import-time profile of the application (cold start).
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter and
+reports the slowest modules by cumulative and self time, plus the total
+time spent importing the application.
+
+Usage:
+    JWT_SECRET_KEY=test python -m benchmarks.importtime --top 25
+    JWT_SECRET_KEY=test python -m benchmarks.importtime --module app.main --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class ImportRecord:
+    """One `-X importtime` line: times are in microseconds."""
+
+    __slots__ = ("module", "self_us", "cumulative_us", "depth")
+
+    def __init__(self, module: str, self_us: int, cumulative_us: int, depth: int) -> None:
+        self.module = module
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+    def to_dict(self) -> dict:
+        return {
+            "module": self.module,
+            "self_ms": round(self.self_us / 1000, 2),
+            "cumulative_ms": round(self.cumulative_us / 1000, 2),
+        }
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """
+    Parse the stderr of `python -X importtime`.
+
+    Lines look like `import time:       419 |     555917 |   fastapi`; the
+    indentation of the module name encodes the nesting depth.
+    """
+    records: list[ImportRecord] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_part, cumulative_part, name = line[len("import time:") :].split("|", 2)
+        if not self_part.strip().isdigit():  # header line
+            continue
+        module = name.strip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append(ImportRecord(module, int(self_part), int(cumulative_part), depth))
+    return records
+
+
+def profile_import(module: str = "app.main", env: dict[str, str] | None = None) -> list[ImportRecord]:
+    """
+    Import `module` in a fresh interpreter and return its import-time records.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def report(records: list[ImportRecord], top: int = 20) -> str:
+    """Render the slowest modules by cumulative and by self time."""
+    lines = []
+    for title, key in (("cumulative", "cumulative_us"), ("self", "self_us")):
+        lines.append(f"Top {top} modules by {title} import time:")
+        for record in sorted(records, key=lambda r: getattr(r, key), reverse=True)[:top]:
+            lines.append(
+                f"  {record.cumulative_us / 1000:8.1f} ms cum  {record.self_us / 1000:8.1f} ms self  {record.module}"
+            )
+    return "\n".join(lines)
+
+
+def total_ms(records: list[ImportRecord], module: str) -> float:
+    """Cumulative import time of `module` in milliseconds (0 if not imported)."""
+    return next((r.cumulative_us / 1000 for r in records if r.module == module), 0.0)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print every record as JSON")
+    args = parser.parse_args(argv)
+
+    records = profile_import(args.module)
+    if args.json:
+        print(json.dumps([record.to_dict() for record in records], indent=2))
+    else:
+        print(report(records, args.top))
+        print(f"Total import time of {args.module}: {total_ms(records, args.module):.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
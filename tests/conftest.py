@@ -5,11 +5,16 @@ Key goals:
 - Ensure debug routes are mounted during tests by forcing DEV env vars BEFORE app import.
 - Provide an isolated SQLite in-memory database for repeatable test runs.
 - Override the application's get_db dependency to use the test session.
+- Provide a fake Redis server (RESP over loopback) so the Redis cache backend
+  can be tested without any external service.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
+import time
 from typing import Generator
 
 import pytest
@@ -32,6 +37,8 @@ def engine():
     """
     # Lazy import here so env vars above are already applied before settings load.
     from app.dependencies.db import Base  # noqa: WPS433
+    from app.models import db_user  # noqa: F401,WPS433 (registers tables on Base)
+    from app.models import db_refresh_token  # noqa: F401,WPS433
 
     engine = create_engine(
         "sqlite+pysqlite:///:memory:",
@@ -69,6 +76,7 @@ def client(db_session) -> Generator[TestClient, None, None]:
     # Lazy imports so settings/app are evaluated AFTER env vars are set.
     from app.main import app  # noqa: WPS433
     from app.dependencies.db import get_db  # noqa: WPS433
+    from app.rate_limit import set_login_rate_limiter  # noqa: WPS433
 
     def _override_get_db():
         try:
@@ -77,8 +85,133 @@ def client(db_session) -> Generator[TestClient, None, None]:
             pass
 
     app.dependency_overrides[get_db] = _override_get_db
+    # Fresh login rate-limit counters per test (all requests share one client IP).
+    set_login_rate_limiter(None)
 
     with TestClient(app, raise_server_exceptions=False) as c:
         yield c
 
     app.dependency_overrides.clear()
+
+
+class _FakeRedisProtocol(asyncio.Protocol):
+    """
+    Minimal RESP2 server implementing the commands used by the cache backends.
+
+    Supported: PING, GET, SET [EX|PX], MGET, DEL, INCR, PEXPIRE, AUTH, SELECT.
+    """
+
+    def __init__(self, store: dict) -> None:
+        self.store = store
+        self.buffer = b""
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        while True:
+            parsed = self._parse()
+            if parsed is None:
+                return
+            self.transport.write(self._execute(parsed))
+
+    def _parse(self) -> list[bytes] | None:
+        if not self.buffer.startswith(b"*") or b"\r\n" not in self.buffer:
+            return None
+        header, rest = self.buffer.split(b"\r\n", 1)
+        args = []
+        for _ in range(int(header[1:])):
+            if b"\r\n" not in rest:
+                return None
+            length_line, rest = rest.split(b"\r\n", 1)
+            length = int(length_line[1:])
+            if len(rest) < length + 2:
+                return None
+            args.append(rest[:length])
+            rest = rest[length + 2 :]
+        self.buffer = rest
+        return args
+
+    def _live(self, key: bytes):
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.store[key]
+            return None
+        return value
+
+    @staticmethod
+    def _bulk(value: bytes | None) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _execute(self, args: list[bytes]) -> bytes:
+        command = args[0].upper()
+        if command in (b"PING",):
+            return b"+PONG\r\n"
+        if command in (b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        if command == b"GET":
+            return self._bulk(self._live(args[1]))
+        if command == b"MGET":
+            return b"*%d\r\n" % (len(args) - 1) + b"".join(self._bulk(self._live(k)) for k in args[1:])
+        if command == b"SET":
+            expires_at = None
+            if len(args) >= 5:
+                factor = 1.0 if args[3].upper() == b"EX" else 0.001
+                expires_at = time.monotonic() + int(args[4]) * factor
+            self.store[args[1]] = (args[2], expires_at)
+            return b"+OK\r\n"
+        if command == b"DEL":
+            removed = sum(1 for k in args[1:] if self.store.pop(k, None) is not None)
+            return b":%d\r\n" % removed
+        if command == b"INCR":
+            current = self._live(args[1])
+            value = int(current or 0) + 1
+            expires_at = self.store.get(args[1], (None, None))[1]
+            self.store[args[1]] = (str(value).encode(), expires_at)
+            return b":%d\r\n" % value
+        if command == b"PEXPIRE":
+            if self._live(args[1]) is None:
+                return b":0\r\n"
+            self.store[args[1]] = (self.store[args[1]][0], time.monotonic() + int(args[2]) / 1000)
+            return b":1\r\n"
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture()
+def fake_redis() -> Generator[str, None, None]:
+    """
+    Run a fake Redis server on 127.0.0.1 (random port) in a background thread.
+
+    Yields:
+        str: Redis URL pointing at the fake server.
+    """
+    store: dict = {}
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    holder: dict = {}
+
+    async def _start():
+        holder["server"] = await loop.create_server(
+            lambda: _FakeRedisProtocol(store), "127.0.0.1", 0
+        )
+        started.set()
+
+    thread = threading.Thread(
+        target=lambda: (loop.run_until_complete(_start()), loop.run_forever()),
+        daemon=True,
+    )
+    thread.start()
+    started.wait(5)
+
+    port = holder["server"].sockets[0].getsockname()[1]
+    yield f"redis://127.0.0.1:{port}/0"
+
+    loop.call_soon_threadsafe(holder["server"].close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
@@ -0,0 +1,73 @@
+"""
+Tests for the async database stack.
+
+Covers:
+- sync -> async driver URL translation
+- per-route selection via DB_ASYNC_ROUTES
+- AsyncUserService use-cases over an in-memory aiosqlite database
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.config import settings
+from app.dependencies.db import Base, to_async_url, uses_async_db
+from app.exceptions import BadRequestException
+from app.service.async_user_service import AsyncUserService
+
+
+def test_to_async_url_picks_async_drivers():
+    assert to_async_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert to_async_url("sqlite+pysqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+    assert (
+        to_async_url("postgresql://u:p@db:5432/app")
+        == "postgresql+asyncpg://u:p@db:5432/app"
+    )
+
+
+def test_uses_async_db_reads_csv_setting(monkeypatch):
+    monkeypatch.setattr(settings, "DB_ASYNC_ROUTES", "users, login")
+    assert uses_async_db("users") is True
+    assert uses_async_db("login") is True
+    assert uses_async_db("register") is False
+
+    monkeypatch.setattr(settings, "DB_ASYNC_ROUTES", "*")
+    assert uses_async_db("register") is True
+
+
+def test_async_user_service_register_login_and_list():
+    email = f"async-{uuid.uuid4().hex[:8]}@test.com"
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            async with sessions() as db:
+                service = AsyncUserService(db)
+                user = await service.register_user_async(email, "12345678", "Async User")
+                assert user.id is not None
+
+                with pytest.raises(BadRequestException):
+                    await service.register_user_async(email, "12345678")
+
+                logged_in = await service.authenticate_user_async(email, "12345678")
+                assert logged_in.last_login_at is not None
+
+                with pytest.raises(BadRequestException):
+                    await service.authenticate_user_async(email, "wrong-password")
+
+                rows = await service.list_user_rows_page_async(10)
+                assert [row.email for row in rows] == [email]
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
@@ -19,3 +19,103 @@ def test_hash_password_rejects_over_72_bytes():
     import pytest
     with pytest.raises(ValueError):
         auth.hash_password(long_pwd)
+
+
+def test_async_hash_and_verify_password():
+    import asyncio
+
+    auth = AuthService()
+
+    async def scenario():
+        hashed = await auth.hash_password_async("123456")
+        assert await auth.verify_password_async("123456", hashed) is True
+        assert await auth.verify_password_async("wrong", hashed) is False
+
+    asyncio.run(scenario())
+
+
+def test_hashing_executor_sheds_load_when_queue_is_full():
+    import asyncio
+    import threading
+
+    import pytest
+
+    from app.exceptions import ServiceUnavailableException
+    from app.service.hashing import HashingExecutor
+
+    executor = HashingExecutor("thread", max_workers=1, queue_limit=0)
+    gate = threading.Event()
+
+    async def scenario():
+        first = asyncio.ensure_future(executor.run(gate.wait, 5, operation="test"))
+        await asyncio.sleep(0)
+        assert executor.in_flight == 1
+
+        with pytest.raises(ServiceUnavailableException):
+            await executor.run(gate.wait, 5, operation="test")
+
+        gate.set()
+        assert await first is True
+        assert executor.in_flight == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+
+def test_decode_access_token_caches_verified_tokens(monkeypatch):
+    from app.service import auth_service as module
+
+    auth = AuthService()
+    token = auth.create_access_token({"sub": "42"})
+    assert auth.decode_access_token(token)["sub"] == "42"
+
+    calls = 0
+    real_decode = module._jwt_backend.decode
+
+    def counting_decode(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(module._jwt_backend, "decode", counting_decode)
+    assert auth.decode_access_token(token)["sub"] == "42"
+    assert calls == 0
+
+
+def test_decode_access_token_rejects_expired_and_tampered_tokens():
+    from datetime import datetime, timedelta, timezone
+
+    import pytest
+
+    from app.config import settings
+    from app.service.jwt_backends import InvalidTokenError, create_jwt_backend
+
+    auth = AuthService()
+    expired = create_jwt_backend("jose").encode(
+        {"sub": "1", "exp": datetime.now(timezone.utc) - timedelta(minutes=1)},
+        settings.JWT_SECRET_KEY,
+        settings.JWT_ALGORITHM,
+    )
+    with pytest.raises(InvalidTokenError):
+        auth.decode_access_token(expired)
+
+    token = auth.create_access_token({"sub": "1"})
+    with pytest.raises(InvalidTokenError):
+        auth.decode_access_token(token[:-2] + ("AA" if token[-2:] != "AA" else "BB"))
+
+
+def test_jwt_backends_are_interchangeable():
+    from app.service.jwt_backends import create_jwt_backend
+
+    jose_backend = create_jwt_backend("jose")
+    pyjwt_backend = create_jwt_backend("pyjwt")
+    claims = {"sub": "7", "exp": 4102444800}
+    key = "k" * 32
+
+    token = jose_backend.encode(claims, key, "HS256")
+    assert pyjwt_backend.decode(token, key, ["HS256"]) == claims
+
+    token = pyjwt_backend.encode(claims, key, "HS256")
+    assert jose_backend.decode(token, key, ["HS256"]) == claims
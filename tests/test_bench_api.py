@@ -0,0 +1,97 @@
+"""
+Tests for the API benchmark suite's reporting and regression check.
+
+Covers:
+- nearest-rank percentiles and per-endpoint summaries
+- threshold comparison (direction per metric, errors, missing metrics)
+- the `compare` command exit status
+- an end-to-end in-process run (every endpoint answers without errors)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.bench_api import ENDPOINTS, compare, main, percentile, summarize
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _result(**endpoints) -> dict:
+    return {"meta": {}, "results": endpoints}
+
+
+def test_percentile_and_summary():
+    latencies = [n / 1000 for n in range(1, 101)]  # 1..100 ms
+
+    assert percentile(sorted(latencies), 50) == 0.05
+    assert percentile(sorted(latencies), 99) == 0.099
+    assert percentile([], 95) == 0.0
+
+    row = summarize(latencies, errors=2, elapsed=0.5)
+    assert row["requests"] == 100
+    assert row["errors"] == 2
+    assert row["rps"] == 200.0
+    assert row["p95_ms"] == 95.0
+
+
+def test_compare_flags_regressions_by_direction():
+    baseline = _result(users={"rps": 1000, "p95_ms": 10.0, "alloc_peak_kib": 40.0, "errors": 0})
+
+    faster = _result(users={"rps": 1500, "p95_ms": 5.0, "alloc_peak_kib": 30.0, "errors": 0})
+    assert compare(baseline, faster, 0.15) == []
+
+    within = _result(users={"rps": 900, "p95_ms": 11.0, "alloc_peak_kib": 44.0, "errors": 0})
+    assert compare(baseline, within, 0.15) == []
+
+    slower = _result(users={"rps": 700, "p95_ms": 20.0, "alloc_peak_kib": 40.0, "errors": 3})
+    messages = compare(baseline, slower, 0.15)
+    assert len(messages) == 3
+    assert any("rps" in m for m in messages)
+    assert any("p95_ms" in m for m in messages)
+    assert any("errors" in m for m in messages)
+
+
+def test_compare_skips_missing_endpoints_and_metrics():
+    baseline = _result(users={"rps": 1000, "alloc_peak_kib": 40.0})
+    # A remote run has no allocation data; a new endpoint has no baseline.
+    current = _result(users={"rps": 990}, secure={"rps": 1.0})
+
+    assert compare(baseline, current, 0.15) == []
+
+
+def test_compare_command_exit_status(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_result(users={"rps": 1000, "p95_ms": 10.0})))
+
+    current.write_text(json.dumps(_result(users={"rps": 990, "p95_ms": 10.5})))
+    assert main(["compare", str(baseline), str(current)]) == 0
+
+    current.write_text(json.dumps(_result(users={"rps": 500, "p95_ms": 10.0})))
+    assert main(["compare", str(baseline), str(current), "--threshold", "0.2"]) == 1
+
+
+def test_inprocess_run_smoke(tmp_path):
+    # A fresh process: the bench must build the app against its own database.
+    output = tmp_path / "result.json"
+    env = dict(os.environ, JWT_SECRET_KEY="test", AUTH_BCRYPT_ROUNDS="4", LOG_LEVEL="warning")
+    subprocess.run(
+        [
+            sys.executable, "-m", "benchmarks.bench_api", "run",
+            "--users", "5", "--requests", "5", "--bcrypt-requests", "2", "--warmup", "1",
+            "--concurrency", "2", "--alloc-samples", "0", "--output", str(output),
+        ],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        timeout=120,
+    )
+
+    results = json.loads(output.read_text())["results"]
+    assert set(results) == set(ENDPOINTS)
+    assert all(row["errors"] == 0 for row in results.values()), results
@@ -0,0 +1,159 @@
+"""
+Tests for bulk user import.
+
+Covers:
+- admin-only access to the import endpoint
+- NDJSON and CSV imports with a per-row error report
+- lines that are not valid UTF-8 rejected per row (not a 500)
+- imported plaintext passwords are hashed (users can log in)
+- the CLI entry point (and its email-filter warning)
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+from passlib.context import CryptContext
+
+from app.config import settings
+
+
+def _email(tag: str) -> str:
+    return f"{tag}-{uuid.uuid4().hex[:8]}@test.com"
+
+
+@pytest.fixture()
+def admin_headers(client, monkeypatch) -> dict[str, str]:
+    email = _email("admin")
+    client.post("/api/v1/register", json={"email": email, "password": "secret123"})
+    token = client.post(
+        "/api/v1/login", data={"username": email, "password": "secret123"}
+    ).json()["access_token"]
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", f"other@test.com, {email.upper()}")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_import_requires_admin(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", "")
+    r = client.post("/api/v1/admin/users/import", content=b"", headers=admin_headers)
+    assert r.status_code == 403
+
+    r = client.post("/api/v1/admin/users/import", content=b"")
+    assert r.status_code == 401
+
+
+def test_import_ndjson_reports_rejected_rows(client, admin_headers):
+    existing = _email("existing")
+    client.post("/api/v1/register", json={"email": existing, "password": "secret123"})
+
+    plain, hashed = _email("plain"), _email("hashed")
+    prehashed = CryptContext(schemes=["bcrypt"]).hash("prehashed1")
+    lines = [
+        {"email": plain, "password": "secret123", "full_name": "Plain"},
+        {"email": hashed, "hashed_password": prehashed},
+        {"email": plain, "password": "secret123"},
+        {"email": existing, "password": "secret123"},
+        {"email": "not-an-email", "password": "secret123"},
+        {"email": _email("nopass")},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n{broken\n"
+
+    r = client.post(
+        "/api/v1/admin/users/import",
+        content=body.encode(),
+        headers={**admin_headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 200, r.text
+    report = r.json()
+    assert (report["total"], report["created"], report["duplicates"], report["invalid"]) == (7, 2, 2, 3)
+    assert [e["line"] for e in report["errors"]] == [3, 5, 6, 7, 4]
+    assert report["errors"][0]["error"] == "Email duplicado en el archivo"
+
+    for email, password in ((plain, "secret123"), (hashed, "prehashed1")):
+        r = client.post("/api/v1/login", data={"username": email, "password": password})
+        assert r.status_code == 200, r.text
+
+
+def test_import_csv(client, admin_headers):
+    first, second = _email("csv1"), _email("csv2")
+    body = f'email,password,full_name\n{first},secret123,"Doe, Jane"\n{second},secret123,\n'
+
+    r = client.post(
+        "/api/v1/admin/users/import",
+        content=body.encode(),
+        headers={**admin_headers, "Content-Type": "text/csv"},
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["created"] == 2
+
+    users = {u["email"]: u for u in client.get("/api/v1/users?limit=1000").json()}
+    assert users[first]["full_name"] == "Doe, Jane"
+    assert users[second]["full_name"] is None
+
+
+def test_import_rejects_invalid_utf8_lines(client, admin_headers):
+    good, after = _email("utf8"), _email("utf8-after")
+    body = (
+        b"\xef\xbb\xbf" + json.dumps({"email": good, "password": "secret123"}).encode() + b"\n"
+        b'{"email": "\xff\xfe@test.com", "password": "secret123"}\n'
+        + json.dumps({"email": after, "password": "secret123", "full_name": "Müller"}).encode("utf-8")
+        + b"\n"
+    )
+
+    r = client.post(
+        "/api/v1/admin/users/import",
+        content=body,
+        headers={**admin_headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 200, r.text
+    report = r.json()
+    assert (report["total"], report["created"], report["invalid"]) == (3, 2, 1)
+    assert report["errors"] == [{"line": 2, "email": None, "error": "Texto no válido en UTF-8"}]
+
+
+def test_parse_csv_rejects_only_the_row_with_invalid_utf8():
+    from app.service.bulk_import_service import parse_csv
+
+    lines = [
+        b"email,password,full_name\r\n",
+        b"a@test.com,secret123,\"multi\r\n",
+        b"line \xff\"\r\n",
+        b"b@test.com,secret123,Jos\xc3\xa9\r\n",
+    ]
+    rows = list(parse_csv(lines))
+
+    assert rows[0] == (3, "Texto no válido en UTF-8")
+    assert rows[1] == (4, {"email": "b@test.com", "password": "secret123", "full_name": "José"})
+
+
+def test_cli_import(engine, tmp_path, monkeypatch, capsys):
+    from sqlalchemy.orm import sessionmaker
+
+    from app.cli import import_users
+
+    monkeypatch.setattr(import_users, "SessionLocal", sessionmaker(bind=engine))
+    prehashed = CryptContext(schemes=["bcrypt"]).hash("secret123")
+    path = tmp_path / "users.csv"
+    path.write_text(f"email,hashed_password\n{_email('cli')},{prehashed}\nbad,{prehashed}\n")
+
+    assert import_users.main([str(path), "--batch-size", "1"]) == 1
+    captured = capsys.readouterr()
+    report = json.loads(captured.out)
+    assert report["created"] == 1 and report["invalid"] == 1
+    assert captured.err == ""
+
+
+def test_cli_import_warns_about_email_filter(engine, tmp_path, monkeypatch, capsys):
+    from sqlalchemy.orm import sessionmaker
+
+    from app.cli import import_users
+
+    monkeypatch.setattr(import_users, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(settings, "AUTH_EMAIL_FILTER_ENABLED", True)
+    path = tmp_path / "users.csv"
+    path.write_text("email,hashed_password\n")
+
+    assert import_users.main([str(path)]) == 0
+    assert "AUTH_EMAIL_FILTER_ENABLED" in capsys.readouterr().err
@@ -0,0 +1,193 @@
+"""
+Tests for the shared cache backends and facade.
+
+Covers:
+- get/set/mget/delete/incr with TTL on memory, SQLite and (fake) Redis backends
+- single-flight loading in `SharedCache.get_or_set`
+- fail-open behavior when the backend is unreachable
+- `schedule()` from background threads reusing the app loop's Redis pool
+- concurrent users-list invalidations never losing a generation bump
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.cache.backends import (
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+)
+from app.cache.shared import SharedCache, bind_loop, schedule
+
+
+async def _exercise(backend) -> None:
+    assert await backend.ping() is True
+    assert await backend.get("missing") is None
+
+    await backend.set("a", b"1")
+    await backend.set("b", b"2", ttl=60)
+    assert await backend.get("a") == b"1"
+    assert await backend.mget(["a", "missing", "b"]) == [b"1", None, b"2"]
+
+    await backend.delete("a")
+    assert await backend.get("a") is None
+
+    assert await backend.incr("n", ttl=60) == 1
+    assert await backend.incr("n", ttl=60) == 2
+    assert await backend.get("n") == b"2"
+
+    await backend.set("short", b"x", ttl=0.05)
+    assert await backend.incr("short-n", ttl=0.05) == 1
+    await asyncio.sleep(0.1)
+    assert await backend.get("short") is None
+    assert await backend.incr("short-n", ttl=60) == 1
+
+    await backend.close()
+
+
+def test_memory_backend():
+    asyncio.run(_exercise(MemoryCacheBackend()))
+
+
+def test_sqlite_backend(tmp_path):
+    asyncio.run(_exercise(SQLiteCacheBackend(str(tmp_path / "cache.db"))))
+
+
+def test_redis_backend(fake_redis):
+    asyncio.run(_exercise(RedisCacheBackend(fake_redis)))
+
+
+def test_schedule_from_threads_reuses_the_app_loop_pool(fake_redis, monkeypatch):
+    opened = []
+    open_connection = asyncio.open_connection
+
+    async def counting_open_connection(*args, **kwargs):
+        opened.append(args)
+        return await open_connection(*args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "open_connection", counting_open_connection)
+    backend = RedisCacheBackend(fake_redis)
+    cache = SharedCache(backend)
+
+    def background_work() -> None:
+        for n in range(10):
+            schedule(lambda n=n: cache.set(f"k{n}", b"v"))
+        # A command on a foreign loop uses a one-off connection.
+        assert asyncio.run(backend.get("k9")) == b"v"
+
+    async def scenario() -> None:
+        bind_loop(asyncio.get_running_loop())
+        try:
+            await cache.set("k", b"v")
+            await asyncio.to_thread(background_work)
+            assert len(backend._idle) == 1
+            assert await cache.mget([f"k{n}" for n in range(10)]) == [b"v"] * 10
+        finally:
+            bind_loop(None)
+            await cache.close()
+
+    asyncio.run(scenario())
+    assert len(opened) == 2  # the pooled connection + the foreign loop's one-off
+
+
+def test_concurrent_users_list_invalidations_all_count(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.cache import shared
+    from app.cache.users import invalidate_users_list, users_list_generation
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "CACHE_USERS_LIST_TTL_SECONDS", 5.0)
+    shared.set_cache(SharedCache(SQLiteCacheBackend(str(tmp_path / "cache.db"))))
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: invalidate_users_list(), range(40)))
+        assert asyncio.run(users_list_generation()) == "40"
+    finally:
+        asyncio.run(shared.get_cache().close())
+        shared.set_cache(None)
+
+
+def test_get_or_set_is_single_flight():
+    cache = SharedCache(MemoryCacheBackend(), prefix="t:")
+    calls = 0
+
+    async def loader() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return b"value"
+
+    async def scenario():
+        results = await asyncio.gather(*(cache.get_or_set("k", loader) for _ in range(10)))
+        assert results == [b"value"] * 10
+        assert await cache.get_or_set("k", loader) == b"value"
+
+    asyncio.run(scenario())
+    assert calls == 1
+
+
+def test_shared_cache_fails_open_when_backend_is_down():
+    # Nothing listens on port 1, so every operation fails fast.
+    cache = SharedCache(RedisCacheBackend("redis://127.0.0.1:1/0", timeout=0.2))
+
+    async def scenario():
+        assert await cache.get("k") is None
+        await cache.set("k", b"v")
+        assert await cache.ping() is False
+        assert await cache.get_or_set("k", _constant) == b"loaded"
+
+    asyncio.run(scenario())
+
+
+async def _constant() -> bytes:
+    return b"loaded"
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "redis"])
+def test_secure_uses_shared_user_cache(
+    client, db_session, monkeypatch, tmp_path, fake_redis, backend
+):
+    """A user cached by another worker (L2) is served without the local L1 or the DB."""
+    import uuid
+
+    from sqlalchemy import update
+
+    from app.cache import shared
+    from app.cache.backends import create_backend
+    from app.cache.users import user_cache
+    from app.config import settings
+
+    url = fake_redis if backend == "redis" else str(tmp_path / "cache.db")
+    monkeypatch.setattr(settings, "CACHE_BACKEND", backend)
+    shared.set_cache(SharedCache(create_backend(backend, url)))
+    try:
+        email = f"l2-{uuid.uuid4().hex[:8]}@test.com"
+        r = client.post("/api/v1/register", json={"email": email, "password": "12345678"})
+        assert r.status_code == 200, r.text
+        token = client.post(
+            "/api/v1/login", data={"username": email, "password": "12345678"}
+        ).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        assert client.get("/api/v1/secure", headers=headers).status_code == 200
+        user_id = client.get("/api/v1/secure", headers=headers).json()["id"]
+        raw = asyncio.run(shared.get_cache().get(f"users:{user_id}"))
+        assert raw is not None and b"hashed_password" not in raw
+        user_cache.clear()  # simulate a different worker: L1 empty, L2 populated
+
+        # Change the row behind the cache's back: only a cache hit still sees it active.
+        from app.models.db_user import DBUser
+
+        db_session.execute(update(DBUser).where(DBUser.email == email).values(is_active=False))
+        db_session.commit()
+
+        r = client.get("/api/v1/secure", headers=headers)
+        assert r.status_code == 200, r.text
+        assert r.json()["email"] == email
+        assert len(user_cache) == 1
+    finally:
+        shared.set_cache(None)
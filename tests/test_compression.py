@@ -0,0 +1,112 @@
+"""
+Tests for response compression (`app.compression`).
+
+Covers:
+- Accept-Encoding negotiation (q-values, q=0, `*`, unavailable encodings)
+- the minimum size threshold and non-compressible media types
+- incremental (flushed per chunk) compression of streamed bodies
+- the cached, maximally compressed OpenAPI schema
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from fastapi.testclient import TestClient
+
+from app.compression import CompressionMiddleware, available_encodings, negotiate
+
+BODY = "hola mundo " * 500
+
+
+def _client(**options) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/text")
+    def text(size: int = len(BODY)):
+        return PlainTextResponse(BODY[:size])
+
+    @app.get("/png")
+    def png():
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    app.add_middleware(CompressionMiddleware, **options)
+    return TestClient(app)
+
+
+def test_negotiation_rules():
+    supported = ("br", "gzip")
+    assert negotiate("gzip, deflate", supported) == "gzip"
+    assert negotiate("gzip;q=0.5, br", supported) == "br"
+    assert negotiate("gzip, br", supported) == "br"  # tie: server order
+    assert negotiate("br;q=0, *", supported) == "gzip"
+    assert negotiate("gzip;q=0", supported) is None
+    assert negotiate("identity", supported) is None
+    assert negotiate("", supported) is None
+    assert available_encodings(["nope", "gzip", "gzip"]) == ("gzip",)
+
+
+def test_compresses_above_threshold_only():
+    client = _client(minimum_size=1024)
+
+    r = client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in r.headers["vary"].lower()
+    assert int(r.headers["content-length"]) < len(BODY)
+    assert r.text == BODY
+
+    small = client.get("/text", params={"size": 100}, headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert small.text == BODY[:100]
+
+    assert "content-encoding" not in client.get("/png", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/text", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_streamed_body_is_compressed_per_chunk():
+    async def ndjson(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/x-ndjson")]})
+        for i in range(3):
+            line = f'{{"batch": {i}, "pad": "{"x" * 2000}"}}\n'.encode()
+            await send({"type": "http.response.body", "body": line, "more_body": i < 2})
+
+    messages = []
+
+    async def record(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(ndjson, minimum_size=1024)(scope, None, record))
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+
+    # Every batch is flushed, so each chunk decodes on its own as it arrives.
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    lines = [decoder.decompress(m["body"]) for m in messages[1:]]
+    assert [line.count(b"\n") for line in lines] == [1, 1, 1]
+    assert decoder.eof
+
+
+def test_openapi_schema_is_cached_at_max_level(client):
+    middleware = client.app.middleware_stack
+    while not isinstance(middleware, CompressionMiddleware):
+        middleware = middleware.app
+
+    plain = client.get("/openapi.json", headers={"Accept-Encoding": "identity"}).content
+    first = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.content == plain
+
+    digest, cached = middleware._static[("/openapi.json", "gzip")]
+    assert gzip.decompress(cached) == plain
+    assert len(cached) <= len(gzip.compress(plain, compresslevel=6))
+
+    client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert middleware._static[("/openapi.json", "gzip")] == (digest, cached)
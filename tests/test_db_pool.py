@@ -0,0 +1,76 @@
+"""
+Tests for connection pool configuration and instrumentation.
+
+Covers:
+- per-dialect pool options
+- checkout timeouts are counted and mapped to 503
+- the diagnostics endpoint
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from app.db_pool import pool_metrics, pool_options, pool_status
+
+
+def test_pool_options_per_dialect(tmp_path):
+    memory = pool_options("sqlite:///:memory:")
+    assert issubclass(memory["poolclass"], StaticPool)
+    assert "pool_size" not in memory
+
+    sqlite_file = pool_options(f"sqlite:///{tmp_path}/app.db")
+    assert issubclass(sqlite_file["poolclass"], QueuePool)
+    assert sqlite_file["pool_pre_ping"] is False
+    assert sqlite_file["pool_recycle"] == -1
+
+    postgres = pool_options("postgresql://u:p@db/app", engine_label="async")
+    assert issubclass(postgres["poolclass"], AsyncAdaptedQueuePool)
+    assert postgres["pool_pre_ping"] is True
+    assert postgres["pool_recycle"] == 1800
+
+
+def test_pool_timeout_is_counted(tmp_path):
+    options = pool_options(f"sqlite:///{tmp_path}/pool.db", engine_label="test")
+    options.update(pool_size=1, max_overflow=0, pool_timeout=0.05)
+    engine = create_engine(f"sqlite:///{tmp_path}/pool.db", **options)
+
+    held = engine.connect()
+    try:
+        assert pool_status(engine)["checked_out"] == 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    finally:
+        held.close()
+        engine.dispose()
+
+    metrics = pool_metrics("test")
+    assert metrics["timeouts"] == 1
+    assert metrics["checkouts"] >= 1
+
+
+def test_pool_timeout_maps_to_503(client):
+    from app.main import app
+
+    @app.get("/__pool-timeout")
+    def _boom():
+        raise exc.TimeoutError("QueuePool limit reached")
+
+    try:
+        r = client.get("/__pool-timeout")
+    finally:
+        app.router.routes.pop()
+
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == "1"
+    assert r.json()["error"] == "Service Unavailable"
+
+
+def test_db_pool_diagnostics_endpoint(client):
+    r = client.get("/api/v1/diagnostics/db-pool")
+    assert r.status_code == 200
+    body = r.json()
+    assert "sync" in body
+    assert {"pool_class", "checkouts", "timeouts"} <= body["sync"].keys()
@@ -0,0 +1,148 @@
+"""
+Tests for the registered-email filter and the unknown-email login path.
+
+Covers:
+- Bloom filter: no false negatives, false-positive rate near the target
+- unknown emails skipping the database while still paying a dummy verify
+- new registrations (including during a rebuild) being known immediately
+- users inserted by other processes picked up by the incremental sync
+- false positives refuted by the database being counted
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import insert
+
+from app.cache.bloom import BloomFilter
+from app.cache.emails import EmailFilter, set_email_filter
+from app.config import settings
+from app.metrics import registry
+from app.models.db_user import DBUser
+from app.repositories.user_repository import UserRepository
+from app.service import auth_service
+
+PASSWORD = "Secret123!"
+
+
+@pytest.fixture()
+def email_filter(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_EMAIL_FILTER_ENABLED", True)
+    email_filter = EmailFilter(fp_rate=0.01, interval=0)
+    set_email_filter(email_filter)
+    yield email_filter
+    set_email_filter(None)
+
+
+def _email(prefix: str = "ef") -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:8]}@example.com"
+
+
+def _register(client, email: str) -> None:
+    r = client.post(
+        "/api/v1/register", json={"email": email, "password": PASSWORD, "full_name": "Filter"}
+    )
+    assert r.status_code == 200, r.text
+
+
+def _login(client, email: str, password: str = PASSWORD):
+    return client.post("/api/v1/login", data={"username": email, "password": password})
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_fp_rate():
+    bloom = BloomFilter(10_000, fp_rate=0.01)
+    members = [f"user-{i}@example.com" for i in range(10_000)]
+    for email in members:
+        bloom.add(email)
+
+    assert all(email in bloom for email in members)
+    false_positives = sum(f"other-{i}@example.com" in bloom for i in range(20_000))
+    assert false_positives / 20_000 < 0.02
+    assert 0.005 < bloom.estimated_fp_rate() < 0.02
+
+
+def test_unknown_email_skips_database_but_pays_dummy_verify(client, db_session, email_filter, monkeypatch):
+    email = _email()
+    _register(client, email)
+    email_filter.rebuild(db_session)
+    assert email_filter.might_exist(email)
+
+    lookups: list[str] = []
+    verifies = 0
+    original_lookup = UserRepository.get_by_email
+    original_verify = auth_service._verify
+
+    def counting_lookup(self, value):
+        lookups.append(value)
+        return original_lookup(self, value)
+
+    def counting_verify(password, hashed_password):
+        nonlocal verifies
+        verifies += 1
+        return original_verify(password, hashed_password)
+
+    monkeypatch.setattr(UserRepository, "get_by_email", counting_lookup)
+    monkeypatch.setattr(auth_service, "_verify", counting_verify)
+
+    r = _login(client, _email("unknown"))
+    assert r.status_code == 400
+    assert r.json() == _login(client, email, "wrong-pass").json()
+    assert lookups == [email]  # only the registered email reached the database
+    assert verifies == 2
+
+    assert _login(client, email).status_code == 200
+
+
+def test_registration_during_rebuild_is_kept(client, db_session, email_filter, monkeypatch):
+    late = _email("late")
+    original_build = EmailFilter._build
+
+    def build_then_register(self, db):
+        bloom = original_build(self, db)
+        self.add(late)  # inserted after the scan passed it
+        return bloom
+
+    monkeypatch.setattr(EmailFilter, "_build", build_then_register)
+    email_filter.rebuild(db_session)
+
+    assert email_filter.might_exist(late)
+
+
+def test_new_user_can_log_in_after_rebuild(client, db_session, email_filter):
+    email_filter.rebuild(db_session)
+    email = _email("new")
+    assert not email_filter.might_exist(email)
+
+    _register(client, email)
+
+    assert email_filter.might_exist(email)
+    assert _login(client, email).status_code == 200
+
+
+def test_sync_picks_up_users_inserted_elsewhere(client, db_session, email_filter):
+    email_filter.rebuild(db_session)
+    email = _email("imported")
+    hashed = auth_service.AuthService().hash_password(PASSWORD)
+    # Written by another process (CLI import, SQL): this one is not told.
+    db_session.execute(insert(DBUser), [{"email": email, "hashed_password": hashed}])
+    db_session.commit()
+    assert not email_filter.might_exist(email)
+    assert _login(client, email).status_code == 400
+
+    assert email_filter.sync(db_session) == 1
+    assert email_filter.might_exist(email)
+    assert _login(client, email).status_code == 200
+    assert email_filter.sync(db_session) == 0  # high-water mark advanced
+
+
+def test_database_miss_counts_as_false_positive(client, db_session, email_filter):
+    email_filter.rebuild(db_session)
+    ghost = _email("ghost")
+    email_filter.add(ghost)  # e.g. a user deleted since the last rebuild
+    false_positives = registry.counter("email_filter_false_positives_total", "")
+    before = false_positives.value()
+
+    assert _login(client, ghost).status_code == 400
+    assert false_positives.value() == before + 1
@@ -0,0 +1,109 @@
+"""
+Tests for HTTP caching on read endpoints (ETag / If-None-Match / Cache-Control).
+
+Covers:
+- weak ETag comparison rules
+- GET /users: 304 for an unchanged page without loading it, new ETag on changes
+- GET /secure: per-user ETag with private Cache-Control
+- HTTP_CACHE_ENABLED=false disabling the headers
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from starlette.requests import Request
+
+from app.config import settings
+from app.http_cache import etag_matches, weak_etag
+from app.pagination import encode_cursor
+from app.repositories.user_repository import UserRepository
+from app.service.user_service import UserService
+
+PASSWORD = "12345678"
+
+
+def _request(if_none_match: str | None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _register(client) -> dict:
+    email = f"etag-{uuid.uuid4().hex[:8]}@example.com"
+    r = client.post("/api/v1/register", json={"email": email, "password": PASSWORD, "full_name": "ETag"})
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_etag_matching_rules():
+    etag = weak_etag("users", 1, rows=[(1, "2026-01-01")])
+    assert etag.startswith('W/"')
+    assert etag != weak_etag("users", 1, rows=[(1, "2026-01-02")])
+
+    assert etag_matches(_request(etag), etag)
+    assert etag_matches(_request(etag.removeprefix("W/")), etag)
+    assert etag_matches(_request(f'W/"other", {etag}'), etag)
+    assert etag_matches(_request("*"), etag)
+    assert not etag_matches(_request('W/"other"'), etag)
+    assert not etag_matches(_request(None), etag)
+
+
+def test_users_page_not_modified_until_it_changes(client, db_session, monkeypatch):
+    first = _register(client)
+    params = {"after": encode_cursor(first["id"] - 1), "limit": 10}
+
+    r = client.get("/api/v1/users", params=params)
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    assert r.headers["cache-control"] == settings.HTTP_CACHE_USERS_CONTROL
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("page loaded for a 304")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(UserService, "list_user_rows_page_async", fail)
+        cached = client.get("/api/v1/users", params=params, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    _register(client)  # a new user lands on the same page
+    r = client.get("/api/v1/users", params=params, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert len(r.json()) == 2
+    etag = r.headers["etag"]
+
+    repo = UserRepository(db_session)
+    repo.set_active(repo.get_by_id(first["id"]), False)
+    r = client.get("/api/v1/users", params=params, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()[0]["is_active"] is False
+    assert r.headers["etag"] != etag
+
+
+def test_secure_etag_is_per_user(client):
+    tokens = []
+    for _ in range(2):
+        email = _register(client)["email"]
+        login = client.post("/api/v1/login", data={"username": email, "password": PASSWORD})
+        tokens.append({"Authorization": f"Bearer {login.json()['access_token']}"})
+
+    r = client.get("/api/v1/secure", headers=tokens[0])
+    assert r.status_code == 200
+    assert r.headers["cache-control"] == settings.HTTP_CACHE_SECURE_CONTROL
+    assert "Authorization" in r.headers["vary"]
+    etag = r.headers["etag"]
+
+    cached = client.get("/api/v1/secure", headers={**tokens[0], "If-None-Match": etag})
+    assert cached.status_code == 304
+    other = client.get("/api/v1/secure", headers={**tokens[1], "If-None-Match": etag})
+    assert other.status_code == 200
+    assert other.headers["etag"] != etag
+
+
+def test_http_cache_can_be_disabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "HTTP_CACHE_ENABLED", False)
+    r = client.get("/api/v1/users", params={"limit": 1})
+    assert r.status_code == 200
+    assert "etag" not in r.headers
+    assert client.get("/api/v1/users", params={"limit": 1}, headers={"If-None-Match": "*"}).status_code == 200
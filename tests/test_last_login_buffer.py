@@ -0,0 +1,119 @@
+"""
+Tests for the write-behind last-login buffer.
+
+Covers:
+- per-user coalescing and a single batched flush
+- size-triggered background flush
+- a deleted user in the batch does not block the other updates
+- login through the API records the timestamp via the buffer, without a
+  synchronous UPDATE of `users` (also when a refresh token is issued)
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.dependencies.db import Base
+from app.models.db_user import DBUser
+from app.repositories.last_login_buffer import LastLoginBuffer
+
+
+def _factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/app.db")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add_all(DBUser(email=f"u{n}@example.com", hashed_password="x") for n in range(3))
+        db.commit()
+    return factory
+
+
+def _last_logins(factory) -> dict[int, datetime | None]:
+    with factory() as db:
+        return dict(db.execute(select(DBUser.id, DBUser.last_login_at)).all())
+
+
+def test_updates_are_coalesced_and_flushed_in_one_batch(tmp_path):
+    factory = _factory(tmp_path)
+    buffer = LastLoginBuffer(factory, flush_interval=60)
+    now = datetime.now(timezone.utc)
+
+    buffer.record(1, now)
+    buffer.record(1, now - timedelta(minutes=5))  # older: ignored
+    buffer.record(2, now)
+    assert len(buffer) == 2
+    assert _last_logins(factory)[1] is None
+
+    assert buffer.flush() == 2
+    stored = _last_logins(factory)
+    assert stored[1].replace(tzinfo=timezone.utc) == now
+    assert stored[2] is not None and stored[3] is None
+    buffer.stop()
+
+
+def test_missing_user_does_not_block_the_batch(tmp_path):
+    factory = _factory(tmp_path)
+    buffer = LastLoginBuffer(factory, flush_interval=60)
+    now = datetime.now(timezone.utc)
+
+    buffer.record(1, now)
+    buffer.record(999, now)  # deleted (or never existed) since the login
+    buffer.record(2, now)
+
+    buffer.flush()
+    assert len(buffer) == 0
+    stored = _last_logins(factory)
+    assert stored[1].replace(tzinfo=timezone.utc) == now
+    assert stored[2].replace(tzinfo=timezone.utc) == now
+    assert buffer.flush() == 0
+    buffer.stop()
+
+
+def test_flushes_when_max_pending_reached(tmp_path):
+    factory = _factory(tmp_path)
+    buffer = LastLoginBuffer(factory, flush_interval=60, max_pending=2)
+
+    buffer.record(1)
+    buffer.record(2)
+    deadline = time.monotonic() + 2
+    while len(buffer) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(buffer) == 0
+    assert all(_last_logins(factory)[n] is not None for n in (1, 2))
+    buffer.stop()
+
+
+def test_login_uses_write_behind(client, db_session, monkeypatch):
+    from app.repositories import last_login_buffer
+
+    monkeypatch.setattr(settings, "LAST_LOGIN_WRITE_BEHIND", True)
+    monkeypatch.setattr(settings, "REFRESH_TOKENS_ENABLED", True)
+    buffer = LastLoginBuffer(lambda: db_session, flush_interval=60)
+    monkeypatch.setattr(last_login_buffer, "_buffer", buffer)
+
+    client.post("/api/v1/register", json={"email": "wb@example.com", "password": "secret123"})
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        r = client.post("/api/v1/login", data={"username": "wb@example.com", "password": "secret123"})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert r.status_code == 200
+    assert "refresh_token" in r.json()
+    assert not [s for s in statements if s.lstrip().upper().startswith("UPDATE USERS")]
+
+    user = db_session.execute(select(DBUser).where(DBUser.email == "wb@example.com")).scalar_one()
+    assert user.id in buffer._pending
+    buffer.stop()
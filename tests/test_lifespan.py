@@ -0,0 +1,86 @@
+"""
+Tests for the application lifespan (`app.lifespan`).
+
+Covers:
+- startup hooks in order, shutdown hooks in reverse, only for started hooks
+- a failing shutdown hook not blocking the others
+- `/readyz` reporting "warming" during the startup warm-up
+- connection pool pre-warming
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.db_pool import pool_options, prewarm
+from app.lifespan import LifespanManager
+from app.readiness import Check, ReadinessProbe
+
+
+def test_hooks_start_in_order_and_stop_in_reverse():
+    calls = []
+    lifespan = LifespanManager()
+
+    async def stop_async():
+        calls.append("stop-b")
+
+    def failing_stop():
+        calls.append("stop-c")
+        raise RuntimeError("boom")
+
+    lifespan.add("a", startup=lambda: calls.append("start-a"), shutdown=lambda: calls.append("stop-a"))
+    lifespan.add("b", shutdown=stop_async)
+    lifespan.add("c", startup=lambda: calls.append("start-c"), shutdown=failing_stop)
+
+    async def scenario():
+        async with lifespan(None):
+            calls.append("serve")
+
+    asyncio.run(scenario())
+
+    assert calls == ["start-a", "start-c", "serve", "stop-c", "stop-b", "stop-a"]
+
+
+def test_failed_startup_shuts_down_started_hooks_only():
+    calls = []
+    lifespan = LifespanManager()
+
+    def failing_start():
+        raise RuntimeError("boom")
+
+    lifespan.add("a", shutdown=lambda: calls.append("stop-a"))
+    lifespan.add("b", startup=failing_start, shutdown=lambda: calls.append("stop-b"))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(lifespan.startup())
+
+    assert calls == ["stop-a"]
+
+
+def test_readyz_is_not_ready_while_warming():
+    async def ok():
+        return None
+
+    probe = ReadinessProbe([Check("db", ok)], interval=60, timeout=1)
+    asyncio.run(probe.refresh())
+
+    probe.warming = True
+    status, body = probe.snapshot()
+    assert (status, body["status"]) == (503, "warming")
+
+    probe.warming = False
+    assert probe.snapshot()[0] == 200
+
+
+def test_prewarm_opens_idle_pool_connections(tmp_path):
+    url = f"sqlite:///{tmp_path / 'warm.db'}"
+    engine = create_engine(url, **pool_options(url, engine_label="warm-test"))
+
+    assert engine.pool.checkedin() == 0
+    assert prewarm(engine, 3) == 3
+    assert engine.pool.checkedin() == 3
+    assert prewarm(engine, 100) == engine.pool.size()
+    engine.dispose()
@@ -0,0 +1,93 @@
+"""
+Tests for the logging pipeline.
+
+Covers:
+- JSON line formatting with request-id correlation
+- per-logger sampling and rate limiting (WARNING+ always kept)
+- request-id propagation through `X-Request-ID`
+- bounded queue: records dropped when full, and a listener stop that neither
+  raises nor hangs with a full queue and a blocked destination
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+
+from app.logger import JsonFormatter, RequestIdFilter, SamplingFilter, request_id_var
+
+
+def _record(name: str = "app.hot", level: int = logging.INFO, msg: str = "hello %s") -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, ("world",), None)
+
+
+def test_json_formatter_includes_request_id():
+    record = _record()
+    token = request_id_var.set("req-123")
+    try:
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+
+    line = json.loads(JsonFormatter().format(record))
+    assert line["message"] == "hello world"
+    assert line["level"] == "INFO"
+    assert line["logger"] == "app.hot"
+    assert line["request_id"] == "req-123"
+
+
+def test_sampling_applies_to_child_loggers_below_warning():
+    sampler = SamplingFilter({"app": 0.0}, {})
+    assert sampler.filter(_record("app.hot")) is False
+    assert sampler.filter(_record("app.hot", level=logging.WARNING)) is True
+    assert sampler.filter(_record("other")) is True
+
+
+def test_rate_limit_per_logger():
+    limiter = SamplingFilter({}, {"app.hot": 2})
+    results = [limiter.filter(_record()) for _ in range(5)]
+    assert results[:2] == [True, True]
+    assert results[2:] == [False, False, False]
+
+
+def test_request_id_header(client):
+    r = client.get("/api/v1/health")
+    assert len(r.headers["X-Request-ID"]) == 32
+
+    r = client.get("/api/v1/health", headers={"X-Request-ID": "upstream-42"})
+    assert r.headers["X-Request-ID"] == "upstream-42"
+
+
+def test_full_queue_drops_instead_of_blocking():
+    import queue
+
+    from app.logger import _DeferredQueueHandler
+
+    handler = _DeferredQueueHandler(queue.Queue(maxsize=1))
+    handler.emit(_record())
+    handler.emit(_record())  # queue full: dropped, no exception
+    assert handler.queue.qsize() == 1
+
+
+def test_listener_stop_with_full_queue_and_blocked_handler():
+    import queue
+    import threading
+
+    from app.logger import _BoundedQueueListener
+
+    release = threading.Event()
+
+    class BlockedHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            release.wait(5)
+
+    log_queue = queue.Queue(maxsize=2)
+    listener = _BoundedQueueListener(log_queue, BlockedHandler(), stop_timeout=0.2)
+    listener.start()
+    for _ in range(3):  # one taken by the blocked handler, two fill the queue
+        log_queue.put(_record(), timeout=1)
+
+    listener.stop()  # no queue.Full, returns after stop_timeout
+
+    assert listener._thread is None
+    release.set()
@@ -0,0 +1,61 @@
+"""
+Tests for request instrumentation and the Prometheus endpoint.
+
+Covers:
+- Prometheus text rendering (labels, cumulative histogram buckets)
+- per-route request metrics and the `Server-Timing` header
+- query counting attributed to the current request
+"""
+
+from __future__ import annotations
+
+import re
+import uuid
+
+from app.metrics import MetricsRegistry, render_prometheus
+
+
+def test_render_prometheus_format():
+    reg = MetricsRegistry()
+    reg.counter("jobs_total", "Jobs.", labelnames=("kind",)).inc(2, kind='a"b')
+    hist = reg.histogram("job_seconds", "Job time.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 3.0):
+        hist.observe(value)
+
+    text = render_prometheus(reg)
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="a\\"b"} 2' in text
+    assert 'job_seconds_bucket{le="0.1"} 1' in text
+    assert 'job_seconds_bucket{le="1"} 2' in text
+    assert 'job_seconds_bucket{le="+Inf"} 3' in text
+    assert "job_seconds_count 3" in text
+    assert "job_seconds_sum 3.55" in text
+
+
+def test_request_metrics_by_route_template(client):
+    r = client.get("/api/v1/users?limit=1")
+    assert r.status_code == 200
+    assert r.headers["Server-Timing"].startswith("app;dur=")
+    client.get("/does-not-exist")
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/api/v1/users",status="200"}' in r.text
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in r.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/users"}' in r.text
+
+
+def test_db_queries_attributed_to_request(client, engine):
+    from app.instrumentation import instrument_engine
+
+    instrument_engine(engine, "test")
+    email = f"metrics-{uuid.uuid4().hex[:8]}@test.com"
+    r = client.post("/api/v1/register", json={"email": email, "password": "secret123"})
+    assert r.status_code == 200
+
+    match = re.search(r'db;dur=([\d.]+);desc="(\d+) queries"', r.headers["Server-Timing"])
+    assert match is not None
+    assert int(match.group(2)) >= 2  # duplicate-email check + INSERT
+    assert 'db_query_duration_seconds_count{engine="test"}' in client.get("/metrics").text
@@ -0,0 +1,101 @@
+"""
+Tests for the bcrypt cost policy.
+
+Covers:
+- `AUTH_BCRYPT_ROUNDS` applied to new hashes and `needs_rehash` on others
+- transparent background rehash after a successful login
+- compare-and-swap: a hash changed meanwhile is not overwritten
+- cost calibration
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.repositories.user_repository import UserRepository
+from app.service import auth_service
+from app.service.auth_service import AuthService, calibrate_bcrypt_rounds
+from app.service.password_rehash import PasswordRehasher, set_password_rehasher
+
+PASSWORD = "Secret123!"
+
+
+def _use_rounds(monkeypatch, rounds: int) -> None:
+    monkeypatch.setattr(settings, "AUTH_BCRYPT_ROUNDS", rounds)
+    monkeypatch.setattr(auth_service, "_pwd_context", None)
+    monkeypatch.setattr(auth_service, "_dummy_hashed_password", None)
+
+
+@pytest.fixture()
+def rehasher(engine):
+    rehasher = PasswordRehasher(sessionmaker(bind=engine))
+    set_password_rehasher(rehasher)
+    yield rehasher
+    rehasher.stop()
+    set_password_rehasher(None)
+
+
+def _cost(hashed_password: str) -> int:
+    return int(hashed_password.split("$")[2])
+
+
+def test_configured_rounds_drive_new_hashes_and_needs_rehash(monkeypatch):
+    _use_rounds(monkeypatch, 4)
+    auth = AuthService()
+    hashed = auth.hash_password(PASSWORD)
+
+    assert _cost(hashed) == 4
+    assert auth.needs_rehash(hashed) is False
+
+    _use_rounds(monkeypatch, 5)
+    assert auth.needs_rehash(hashed) is True
+    assert auth.verify_password(PASSWORD, hashed) is True
+
+
+def test_login_rehashes_outdated_cost_in_background(client, db_session, rehasher, monkeypatch):
+    _use_rounds(monkeypatch, 4)
+    email = f"rehash-{uuid.uuid4().hex[:8]}@example.com"
+    assert client.post("/api/v1/register", json={"email": email, "password": PASSWORD}).status_code == 200
+
+    _use_rounds(monkeypatch, 5)
+    assert client.post("/api/v1/login", data={"username": email, "password": PASSWORD}).status_code == 200
+    rehasher.stop()
+
+    db_session.expire_all()
+    stored = UserRepository(db_session).get_by_email(email).hashed_password
+    assert _cost(stored) == 5
+    assert AuthService().verify_password(PASSWORD, stored) is True
+
+    # Up to date now: the next login queues nothing.
+    assert client.post("/api/v1/login", data={"username": email, "password": PASSWORD}).status_code == 200
+    assert len(rehasher) == 0
+
+
+def test_rehash_does_not_overwrite_a_changed_hash(engine, db_session, monkeypatch):
+    _use_rounds(monkeypatch, 4)
+    auth = AuthService()
+    repo = UserRepository(db_session)
+    user = repo.create_user(f"cas-{uuid.uuid4().hex[:8]}@example.com", auth.hash_password(PASSWORD))
+    old_hash = user.hashed_password
+
+    changed = auth.hash_password("Another123!")
+    assert repo.replace_password_hash(user.id, old_hash, changed) is True
+
+    rehasher = PasswordRehasher(sessionmaker(bind=engine))
+    assert rehasher.schedule(user.id, PASSWORD, old_hash) is True
+    rehasher.stop()
+
+    db_session.expire_all()
+    assert repo.get_by_id(user.id).hashed_password == changed
+
+
+def test_calibration_picks_highest_cost_within_target():
+    rounds, elapsed = calibrate_bcrypt_rounds(0.0, min_rounds=4, max_rounds=6, samples=1)
+    assert rounds == 4 and elapsed > 0
+
+    rounds, _ = calibrate_bcrypt_rounds(10.0, min_rounds=4, max_rounds=6, samples=1)
+    assert rounds == 6
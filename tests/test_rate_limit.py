@@ -0,0 +1,152 @@
+"""
+Tests for login rate limiting.
+
+Covers:
+- sliding-window math and Retry-After hints (injected clock)
+- 429 on `/api/v1/login` before any password verification
+- per-IP limits across accounts and the per-account reset on success
+- bounded memory for the in-process backend
+- counters shared across limiter instances through Redis
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+from app.cache.backends import MemoryCacheBackend, RedisCacheBackend
+from app.cache.shared import SharedCache
+from app.rate_limit import LoginRateLimiter, SlidingWindowLimiter, set_login_rate_limiter
+from app.service import auth_service
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _memory_cache(maxsize: int = 1024) -> SharedCache:
+    return SharedCache(MemoryCacheBackend(maxsize=maxsize, name="rate-limit-test"))
+
+
+def _register(client, password: str = "Secret123!") -> str:
+    email = f"rl-{uuid.uuid4().hex[:8]}@example.com"
+    r = client.post(
+        "/api/v1/register",
+        json={"email": email, "password": password, "full_name": "Rate Limit"},
+    )
+    assert r.status_code == 200, r.text
+    return email
+
+
+def test_sliding_window_limits_and_retry_after():
+    async def scenario() -> None:
+        clock = _Clock()
+        limiter = SlidingWindowLimiter(_memory_cache(), "test", limit=3, window=10, clock=clock)
+
+        assert [await limiter.hit("k") for _ in range(3)] == [0.0, 0.0, 0.0]
+        retry_after = await limiter.hit("k")
+        assert retry_after > 0
+
+        # Waiting exactly the hinted time lets the next event through.
+        clock.now += retry_after + 1e-6
+        assert await limiter.hit("k") == 0.0
+
+        # Other keys are independent.
+        assert await limiter.hit("other") == 0.0
+
+    asyncio.run(scenario())
+
+
+def test_previous_window_slides_out():
+    async def scenario() -> None:
+        clock = _Clock(now=1000.0)  # start of a window
+        limiter = SlidingWindowLimiter(_memory_cache(), "test", limit=4, window=10, clock=clock)
+        for _ in range(4):
+            assert await limiter.hit("k") == 0.0
+
+        clock.now = 1012.0  # 20% into the next window: 4 * 0.8 = 3.2 still counted
+        retry_after = await limiter.hit("k")
+        assert retry_after > 0
+
+        clock.now += retry_after + 1e-6
+        assert await limiter.hit("k") == 0.0
+
+    asyncio.run(scenario())
+
+
+def test_login_rejected_before_password_verification(client, monkeypatch):
+    email = _register(client)
+    set_login_rate_limiter(LoginRateLimiter(_memory_cache(), per_ip=100, per_account=2, window=60))
+
+    verified = 0
+    original = auth_service._verify
+
+    def counting_verify(password: str, hashed_password: str) -> bool:
+        nonlocal verified
+        verified += 1
+        return original(password, hashed_password)
+
+    monkeypatch.setattr(auth_service, "_verify", counting_verify)
+
+    for _ in range(2):
+        r = client.post("/api/v1/login", data={"username": email, "password": "wrong-pass"})
+        assert r.status_code == 400
+
+    r = client.post("/api/v1/login", data={"username": email.upper(), "password": "Secret123!"})
+    assert r.status_code == 429
+    assert int(r.headers["retry-after"]) >= 1
+    assert verified == 2
+
+
+def test_per_ip_limit_spans_accounts(client):
+    set_login_rate_limiter(LoginRateLimiter(_memory_cache(), per_ip=2, per_account=100, window=60))
+
+    statuses = [
+        client.post(
+            "/api/v1/login", data={"username": f"nobody-{i}@example.com", "password": "x"}
+        ).status_code
+        for i in range(3)
+    ]
+    assert statuses == [400, 400, 429]
+
+
+def test_successful_login_resets_account_counter(client):
+    email = _register(client)
+    set_login_rate_limiter(LoginRateLimiter(_memory_cache(), per_ip=100, per_account=2, window=60))
+
+    wrong = {"username": email, "password": "wrong-pass"}
+    assert client.post("/api/v1/login", data=wrong).status_code == 400
+    ok = client.post("/api/v1/login", data={"username": email, "password": "Secret123!"})
+    assert ok.status_code == 200
+    assert client.post("/api/v1/login", data=wrong).status_code == 400
+    assert client.post("/api/v1/login", data=wrong).status_code == 400
+    assert client.post("/api/v1/login", data=wrong).status_code == 429
+
+
+def test_memory_backend_is_bounded():
+    async def scenario() -> int:
+        backend = MemoryCacheBackend(maxsize=100, name="rate-limit-test")
+        limiter = SlidingWindowLimiter(SharedCache(backend), "test", limit=5, window=60)
+        for i in range(5000):
+            await limiter.hit(f"ip-{i}")
+        return len(backend._cache)
+
+    assert asyncio.run(scenario()) <= 100
+
+
+def test_redis_counters_are_shared_between_workers(fake_redis):
+    async def scenario() -> list[float]:
+        clock = _Clock()
+        workers = [
+            SlidingWindowLimiter(SharedCache(RedisCacheBackend(fake_redis)), "test", 3, 60, clock)
+            for _ in range(2)
+        ]
+        return [await workers[i % 2].hit("k") for i in range(4)]
+
+    results = asyncio.run(scenario())
+    assert results[:3] == [0.0, 0.0, 0.0]
+    assert results[3] > 0
@@ -0,0 +1,117 @@
+"""
+Tests for the readiness probe (`/api/v1/readyz`).
+
+Covers:
+- the endpoint serving the background-computed snapshot
+- status aggregation (critical vs non-critical failures, timeouts)
+- failure details kept generic (the exception is only logged)
+- probes never triggering checks themselves
+- "starting" / "stale" snapshots reported as not ready
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from app.readiness import Check, ReadinessProbe
+
+
+def _probe(*checks: Check, interval: float = 5.0, timeout: float = 1.0) -> ReadinessProbe:
+    return ReadinessProbe(list(checks), interval=interval, timeout=timeout)
+
+
+async def _ok() -> None:
+    return None
+
+
+async def _boom() -> None:
+    raise ConnectionError("unreachable")
+
+
+def test_readyz_endpoint_reports_dependencies(client):
+    # The lifespan (started by the client fixture) runs the first refresh immediately.
+    deadline = time.monotonic() + 5
+    while True:
+        r = client.get("/api/v1/readyz")
+        if r.status_code == 200 or time.monotonic() > deadline:
+            break
+        time.sleep(0.05)
+
+    assert r.status_code == 200
+    assert r.headers["cache-control"] == "no-store"
+    body = r.json()
+    assert body["status"] in ("ok", "degraded")
+    assert body["checks"]["database"]["ok"] is True
+    assert body["checks"]["hashing"]["ok"] is True
+    assert "cache" in body["checks"]
+
+
+def test_status_aggregation(caplog):
+    probe = _probe(Check("db", _ok), Check("cache", _boom, critical=False))
+    asyncio.run(probe.refresh())
+    status_code, body = probe.snapshot()
+    assert status_code == 200
+    assert body["status"] == "degraded"
+    assert body["checks"]["cache"]["detail"] == "error"
+    assert "unreachable" not in str(body)
+    assert "unreachable" in caplog.text
+
+    probe = _probe(Check("db", _boom), Check("cache", _ok, critical=False))
+    asyncio.run(probe.refresh())
+    status_code, body = probe.snapshot()
+    assert status_code == 503
+    assert body["status"] == "fail"
+
+
+def test_check_timeout_fails():
+    async def hang() -> None:
+        await asyncio.sleep(10)
+
+    probe = _probe(Check("db", hang), timeout=0.05)
+    asyncio.run(probe.refresh())
+    status_code, body = probe.snapshot()
+    assert status_code == 503
+    assert body["checks"]["db"]["detail"] == "timeout"
+
+
+def test_snapshot_does_not_run_checks():
+    calls = 0
+
+    async def counted() -> None:
+        nonlocal calls
+        calls += 1
+
+    probe = _probe(Check("db", counted))
+    assert probe.snapshot() == (503, {"status": "starting", "checks": {}})
+
+    asyncio.run(probe.refresh())
+    for _ in range(1000):
+        assert probe.snapshot()[0] == 200
+    assert calls == 1
+
+
+def test_stale_snapshot_is_not_ready():
+    probe = _probe(Check("db", _ok), interval=0.01)
+    asyncio.run(probe.refresh())
+    time.sleep(0.05)
+    status_code, body = probe.snapshot()
+    assert status_code == 503
+    assert body["status"] == "stale"
+
+
+def test_background_task_refreshes():
+    async def scenario() -> int:
+        calls = 0
+
+        async def counted() -> None:
+            nonlocal calls
+            calls += 1
+
+        probe = _probe(Check("db", counted), interval=0.01)
+        probe.start()
+        await asyncio.sleep(0.1)
+        await probe.stop()
+        return calls
+
+    assert asyncio.run(scenario()) >= 3
@@ -0,0 +1,130 @@
+"""
+Tests for the refresh-token flow.
+
+Covers:
+- login issuing a refresh token; `/token/refresh` rotating it without bcrypt
+- reuse of a rotated token revoking the whole family
+- forged/malformed tokens, logout, inactive users
+- the in-memory revocation index short-circuiting revoked families
+- compaction of expired families and reload of revocations
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.cache.revocations import RevocationCompactor, revoked_families
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+from app.repositories.user_repository import UserRepository
+from app.service import auth_service
+
+PASSWORD = "Secret123!"
+
+
+def _login(client) -> dict:
+    email = f"refresh-{uuid.uuid4().hex[:8]}@example.com"
+    r = client.post("/api/v1/register", json={"email": email, "password": PASSWORD})
+    assert r.status_code == 200, r.text
+    r = client.post("/api/v1/login", data={"username": email, "password": PASSWORD})
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def _refresh(client, token: str):
+    return client.post("/api/v1/token/refresh", json={"refresh_token": token})
+
+
+def test_refresh_rotates_without_bcrypt(client, monkeypatch):
+    tokens = _login(client)
+    assert tokens["refresh_token"]
+
+    def no_bcrypt(*args):
+        raise AssertionError("bcrypt used during refresh")
+
+    monkeypatch.setattr(auth_service, "_verify", no_bcrypt)
+
+    r = _refresh(client, tokens["refresh_token"])
+    assert r.status_code == 200, r.text
+    renewed = r.json()
+    assert renewed["refresh_token"] != tokens["refresh_token"]
+
+    secure = client.get("/api/v1/secure", headers={"Authorization": f"Bearer {renewed['access_token']}"})
+    assert secure.status_code == 200
+
+    assert _refresh(client, renewed["refresh_token"]).status_code == 200
+
+
+def test_reusing_a_rotated_token_revokes_the_family(client):
+    tokens = _login(client)
+    rotated = _refresh(client, tokens["refresh_token"]).json()["refresh_token"]
+
+    reused = _refresh(client, tokens["refresh_token"])
+    assert reused.status_code == 401
+    assert reused.headers["www-authenticate"] == "Bearer"
+
+    # The legitimate holder's token died with the family.
+    assert _refresh(client, rotated).status_code == 401
+    assert rotated.split(".")[0] in revoked_families
+
+
+def test_forged_and_malformed_tokens_are_rejected(client):
+    tokens = _login(client)
+    family_id, generation, mac = tokens["refresh_token"].split(".")
+
+    forged = (
+        "garbage",
+        "ñ.1.x",
+        f"{family_id}.{int(generation) + 1}.{mac}",
+        f"{family_id}.{generation}.{'0' * 64}",
+        "abc.1.é",
+        f"{family_id}.{generation}.{mac[:-1]}é",
+        f"{family_id}.².{mac}",
+    )
+    for token in forged:
+        assert _refresh(client, token).status_code == 401, token
+        assert client.post("/api/v1/logout", json={"refresh_token": token}).status_code == 401, token
+
+
+def test_logout_revokes_without_database_on_next_refresh(client, monkeypatch):
+    tokens = _login(client)
+    assert client.post("/api/v1/logout", json={"refresh_token": tokens["refresh_token"]}).status_code == 204
+
+    def no_database(*args):
+        raise AssertionError("revoked family reached the database")
+
+    monkeypatch.setattr(RefreshTokenRepository, "rotate", no_database)
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+
+
+def test_inactive_user_cannot_refresh(client, db_session):
+    tokens = _login(client)
+    family_id = tokens["refresh_token"].split(".")[0]
+    family = RefreshTokenRepository(db_session).get(family_id)
+    users = UserRepository(db_session)
+    users.set_active(users.get_by_id(family.user_id), False)
+
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+
+
+def test_compaction_deletes_expired_and_reloads_revocations(client, db_session):
+    tokens = _login(client)
+    user_id = RefreshTokenRepository(db_session).get(tokens["refresh_token"].split(".")[0]).user_id
+    repo = RefreshTokenRepository(db_session)
+    now = datetime.now(timezone.utc)
+
+    expired_id, revoked_id = uuid.uuid4().hex, uuid.uuid4().hex
+    repo.create(expired_id, user_id, now - timedelta(seconds=1))
+    repo.create(revoked_id, user_id, now + timedelta(days=1))
+    repo.revoke(revoked_id, now)  # e.g. by another worker: not in this process' index yet
+    assert revoked_id not in revoked_families
+
+    deleted = RevocationCompactor(interval=0).run_once(db_session)
+
+    assert deleted >= 1
+    assert repo.get(expired_id) is None
+    assert revoked_id in revoked_families
+
+    revoked_families.add(expired_id, now - timedelta(seconds=1))
+    assert revoked_families.compact() >= 1
+    assert expired_id not in revoked_families
@@ -0,0 +1,99 @@
+"""
+Concurrent registration stress tests.
+
+Registration relies on the unique index on `users.email` instead of a
+pre-check SELECT. Many simultaneous registrations of one email must yield
+exactly one success and 400s for the rest, never a 500 from an unhandled
+`IntegrityError`, on both the sync and the async database stacks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import httpx
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.dependencies.db import Base, get_db
+from app.exceptions import BadRequestException
+from app.models.db_user import DBUser
+from app.repositories.user_repository import UserRepository
+from app.service import auth_service
+from app.service.async_user_service import AsyncUserService
+
+CONCURRENCY = 20
+
+
+def _fast_hash(monkeypatch) -> None:
+    # bcrypt would serialize the requests; the race is in the INSERT.
+    monkeypatch.setattr(auth_service, "_hash", lambda password: f"fake${password}")
+
+
+def test_concurrent_http_registrations_yield_one_success(tmp_path, monkeypatch):
+    from app.main import app
+
+    _fast_hash(monkeypatch)
+    pre_checks: list[str] = []
+    monkeypatch.setattr(UserRepository, "get_by_email", lambda self, email: pre_checks.append(email))
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'register.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    sessions = sessionmaker(bind=engine, autoflush=False)
+
+    def _override_get_db():
+        with sessions() as db:
+            yield db
+
+    email = f"race-{uuid.uuid4().hex[:8]}@example.com"
+    payload = {"email": email, "password": "Secret123!", "full_name": "Race"}
+
+    async def scenario() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(client.post("/api/v1/register", json=payload) for _ in range(CONCURRENCY))
+            )
+
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        responses = asyncio.run(scenario())
+    finally:
+        app.dependency_overrides.clear()
+
+    statuses = sorted(r.status_code for r in responses)
+    assert statuses == [200] + [400] * (CONCURRENCY - 1), [r.text for r in responses if r.status_code >= 500]
+    assert {r.json()["message"] for r in responses if r.status_code == 400} == {"El email ya está registrado"}
+    assert pre_checks == []
+    with sessions() as db:
+        assert db.scalar(select(func.count()).select_from(DBUser).where(DBUser.email == email)) == 1
+    engine.dispose()
+
+
+def test_concurrent_async_registrations_yield_one_success(tmp_path, monkeypatch):
+    _fast_hash(monkeypatch)
+    email = f"race-async-{uuid.uuid4().hex[:8]}@example.com"
+
+    async def scenario() -> list[object]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'register-async.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        async def register() -> object:
+            async with sessions() as db:
+                return await AsyncUserService(db).register_user_async(email, "Secret123!")
+
+        try:
+            return await asyncio.gather(*(register() for _ in range(CONCURRENCY)), return_exceptions=True)
+        finally:
+            await engine.dispose()
+
+    results = asyncio.run(scenario())
+
+    created = [r for r in results if isinstance(r, DBUser)]
+    rejected = [r for r in results if isinstance(r, BadRequestException)]
+    assert len(created) == 1
+    assert len(rejected) == CONCURRENCY - 1, [r for r in results if not isinstance(r, (DBUser, BadRequestException))]
@@ -0,0 +1,119 @@
+"""
+Tests for the production server launcher (`python -m app.server`).
+
+Covers:
+- worker sizing
+- the per-process email filter turned off with several workers
+- end to end (real processes): worker recycling without failed requests, and
+  graceful drain of an in-flight request on SIGTERM
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.server import available_cpus, check_per_process_settings, worker_count
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_worker_count_defaults_to_available_cpus():
+    assert worker_count(0) == available_cpus() >= 1
+    assert worker_count(3) == 3
+
+
+def test_email_filter_is_disabled_with_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_EMAIL_FILTER_ENABLED", True)
+    assert check_per_process_settings(1) == []
+    assert settings.AUTH_EMAIL_FILTER_ENABLED is True
+
+    assert check_per_process_settings(2) == ["AUTH_EMAIL_FILTER_ENABLED"]
+    assert settings.AUTH_EMAIL_FILTER_ENABLED is False
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="prefork server needs fork()")
+def test_server_recycles_workers_and_drains_on_sigterm(tmp_path):
+    env = dict(
+        os.environ,
+        JWT_SECRET_KEY="test",
+        DATABASE_URL=f"sqlite:///{tmp_path / 'server.db'}",
+        DEBUG="false",
+        LOG_LEVEL="warning",
+        RATE_LIMIT_ENABLED="false",
+        AUTH_BCRYPT_ROUNDS="12",  # ~0.4 s per login: still in flight at SIGTERM
+    )
+    create_tables = (
+        "from app.dependencies.db import Base, engine; "
+        "import app.models.db_user, app.models.db_refresh_token; "
+        "Base.metadata.create_all(engine)"
+    )
+    subprocess.run([sys.executable, "-c", create_tables], cwd=ROOT, env=env, check=True)
+
+    port = _free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "app.server",
+            "--host", "127.0.0.1", "--port", str(port), "--workers", "2", "--max-requests", "2",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    base = f"http://127.0.0.1:{port}/api/v1"
+    try:
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                if httpx.get(f"{base}/healthz").status_code == 200:
+                    break
+            except httpx.TransportError:
+                time.sleep(0.1)
+
+        def get_healthz() -> int:
+            # A worker that just hit --max-requests may close a connection it
+            # accepted but had not read yet; retry once, as a proxy would.
+            try:
+                return httpx.get(f"{base}/healthz").status_code
+            except httpx.RemoteProtocolError:
+                return httpx.get(f"{base}/healthz").status_code
+
+        # Every worker is replaced several times over; every request is answered.
+        assert [get_healthz() for _ in range(10)] == [200] * 10
+
+        credentials = {"email": "server@example.com", "password": "Secret123!"}
+        assert httpx.post(f"{base}/register", json=credentials).status_code == 200
+
+        result = {}
+
+        def login() -> None:
+            form = {"username": credentials["email"], "password": credentials["password"]}
+            result["status"] = httpx.post(f"{base}/login", data=form, timeout=30).status_code
+
+        in_flight = threading.Thread(target=login)
+        in_flight.start()
+        time.sleep(0.15)
+        process.send_signal(signal.SIGTERM)
+        in_flight.join()
+
+        assert result["status"] == 200
+        assert process.wait(timeout=30) == 0
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
@@ -0,0 +1,85 @@
+"""
+Tests for the SQLite production profile.
+
+Covers:
+- pragmas applied on connect
+- read/write routing between the reader pool and the single writer
+- concurrent writers queue instead of failing with `database is locked`
+"""
+
+from __future__ import annotations
+
+import threading
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db_pool import pool_metrics, pool_options
+from app.dependencies.db import Base
+from app.models.db_user import DBUser
+from app.sqlite_profile import configure_sqlite_engine, routing_session_class, writer_pool_options
+
+
+def _tuned_factory(url: str) -> tuple[sessionmaker, object, object]:
+    reader = create_engine(url, connect_args={"check_same_thread": False}, **pool_options(url, "t-read"))
+    writer = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        **writer_pool_options(pool_options(url, "t-write")),
+    )
+    configure_sqlite_engine(reader)
+    configure_sqlite_engine(writer, writer=True)
+    Base.metadata.create_all(writer)
+    factory = sessionmaker(class_=routing_session_class(reader, writer), autoflush=False)
+    return factory, reader, writer
+
+
+def test_pragmas_applied(tmp_path):
+    factory, reader, writer = _tuned_factory(f"sqlite:///{tmp_path}/app.db")
+    with reader.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+    assert writer.pool.size() == 1
+
+
+def test_writes_routed_to_writer(tmp_path):
+    factory, reader, writer = _tuned_factory(f"sqlite:///{tmp_path}/app.db")
+    writes_before = pool_metrics("t-write")["checkouts"]
+
+    with factory() as db:
+        db.add(DBUser(email="route@example.com", hashed_password="x"))
+        db.flush()
+        # After a flush the session reads its own writes through the writer.
+        assert db.get_bind() is writer
+        assert db.execute(select(DBUser.email)).scalar_one() == "route@example.com"
+        db.commit()
+        assert db.get_bind() is reader
+
+    assert pool_metrics("t-write")["checkouts"] == writes_before + 1
+    with factory() as db:
+        assert db.execute(select(DBUser.email)).scalar_one() == "route@example.com"
+
+
+def test_concurrent_writers_do_not_lock(tmp_path):
+    factory, _, _ = _tuned_factory(f"sqlite:///{tmp_path}/app.db")
+    errors: list[Exception] = []
+
+    def register(n: int) -> None:
+        try:
+            for i in range(20):
+                with factory() as db:
+                    db.add(DBUser(email=f"u{n}-{i}@example.com", hashed_password="x"))
+                    db.commit()
+        except Exception as exc:  # pragma: no cover - failure path
+            errors.append(exc)
+
+    threads = [threading.Thread(target=register, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with factory() as db:
+        assert len(db.execute(select(DBUser.id)).all()) == 160
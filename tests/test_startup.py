@@ -0,0 +1,61 @@
+"""
+Tests for application cold-start cost.
+
+Covers:
+- parsing of `python -X importtime` output
+- heavy libraries (passlib/bcrypt, JWT) staying out of application import
+- an import-time budget for `app.main` (`STARTUP_IMPORT_BUDGET_MS`, default
+  3000 ms; CI can tighten it for its runners)
+- the post-startup warm-up building the deferred state
+"""
+
+from __future__ import annotations
+
+import os
+
+from benchmarks.importtime import parse_importtime, profile_import, report, total_ms
+
+DEFERRED_MODULES = ("passlib", "jose", "jwt", "bcrypt")
+
+
+def test_parse_importtime():
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     _io",
+            "import time:      2000 |       5000 |   fastapi",
+            "import time:      3000 |      10000 | app.main",
+        ]
+    )
+
+    records = parse_importtime(output)
+
+    assert [r.module for r in records] == ["_io", "fastapi", "app.main"]
+    assert [r.depth for r in records] == [2, 1, 0]
+    assert total_ms(records, "app.main") == 10.0
+    assert "app.main" in report(records, top=1)
+
+
+def test_app_import_defers_heavy_modules_and_fits_budget():
+    records = profile_import("app.main")
+    imported = {r.module for r in records}
+    budget = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "3000"))
+    elapsed = total_ms(records, "app.main")
+
+    print(report(records, top=15))
+    print(f"app.main import: {elapsed:.1f} ms (budget {budget:.0f} ms)")
+
+    assert not imported & set(DEFERRED_MODULES), "deferred modules imported at startup"
+    assert elapsed < budget, report(records, top=15)
+
+
+def test_warm_up_builds_deferred_state():
+    from app.main import app
+    from app.service import auth_service
+    from app.startup import warm_up
+
+    app.openapi_schema = None
+    warm_up(app)
+
+    assert app.openapi_schema is not None
+    assert auth_service._pwd_context is not None
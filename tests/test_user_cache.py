@@ -0,0 +1,88 @@
+"""
+Tests for the in-process user cache.
+
+Covers:
+- LRU eviction and TTL expiry of `TTLCache`
+- `/secure` served from the cache on repeated requests
+- invalidation when the repository deactivates a user
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from app.cache.lru import MISSING, TTLCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache("test-lru", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" becomes most recently used
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] >= 1
+
+
+def test_ttl_cache_expires_entries():
+    clock = _FakeClock()
+    cache = TTLCache("test-ttl", maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+
+    clock.now = 5.0
+    assert cache.get("a") is MISSING
+    assert cache.stats()["expirations"] >= 1
+
+
+def _login(client) -> tuple[str, str]:
+    email = f"cache-{uuid.uuid4().hex[:8]}@test.com"
+    client.post(
+        "/api/v1/register",
+        json={"email": email, "password": "12345678", "full_name": "Cache User"},
+    )
+    r = client.post("/api/v1/login", data={"username": email, "password": "12345678"})
+    assert r.status_code == 200, r.text
+    return email, r.json()["access_token"]
+
+
+def test_secure_uses_user_cache(client):
+    from app.cache.users import user_cache
+
+    _, token = _login(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/v1/secure", headers=headers).status_code == 200
+    hits = user_cache.stats()["hits"]
+
+    r = client.get("/api/v1/secure", headers=headers)
+    assert r.status_code == 200, r.text
+    assert r.json()["is_active"] is True
+    assert user_cache.stats()["hits"] == hits + 1
+
+
+def test_deactivation_invalidates_cached_user(client, db_session):
+    from app.repositories.user_repository import UserRepository
+
+    email, token = _login(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/api/v1/secure", headers=headers).status_code == 200
+
+    repo = UserRepository(db_session)
+    repo.set_active(repo.get_by_email(email), False)
+
+    assert client.get("/api/v1/secure", headers=headers).status_code == 401
@@ -21,3 +21,72 @@ def test_get_users_returns_list(client):
 
     # Contrato actual: id + email (y opcionalmente full_name/is_active)
     assert all("id" in user and "email" in user for user in data)
+
+
+def _register(client, prefix: str) -> str:
+    import uuid
+
+    email = f"{prefix}-{uuid.uuid4().hex[:8]}@test.com"
+    r = client.post(
+        "/api/v1/register",
+        json={"email": email, "password": "12345678", "full_name": "Paginado"},
+    )
+    assert r.status_code == 200, r.text
+    return email
+
+
+def test_get_users_keyset_pagination(client):
+    """
+    Recorre dos páginas con `limit=1` usando el cursor de `X-Next-Cursor`.
+    """
+    _register(client, "page-a")
+    _register(client, "page-b")
+
+    first = client.get("/api/v1/users", params={"limit": 1})
+    assert first.status_code == 200, first.text
+    assert len(first.json()) == 1
+    cursor = first.headers["X-Next-Cursor"]
+    assert 'rel="next"' in first.headers["Link"]
+
+    second = client.get("/api/v1/users", params={"limit": 1, "after": cursor})
+    assert second.status_code == 200, second.text
+    assert second.json()[0]["id"] > first.json()[0]["id"]
+
+
+def test_get_users_rejects_invalid_cursor(client):
+    response = client.get("/api/v1/users", params={"after": "not-a-cursor"})
+    assert response.status_code == 400, response.text
+
+
+def test_get_users_rejects_out_of_range_cursor(client):
+    """
+    Un id fuera del rango INTEGER de la DB responde 400 (no 500), en JSON y NDJSON.
+    """
+    from app.pagination import MAX_CURSOR_ID, encode_cursor
+
+    for fmt in ("json", "ndjson"):
+        response = client.get("/api/v1/users", params={"after": encode_cursor(2**70), "format": fmt})
+        assert response.status_code == 400, response.text
+        assert response.json()["message"] == "Cursor de paginación inválido"
+
+    response = client.get("/api/v1/users", params={"after": encode_cursor(MAX_CURSOR_ID)})
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+
+def test_get_users_ndjson_stream(client):
+    """
+    `format=ndjson` transmite todos los usuarios, uno por línea.
+    """
+    import json
+
+    email = _register(client, "ndjson")
+
+    response = client.get("/api/v1/users", params={"format": "ndjson"})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in response.text.splitlines() if line]
+    ids = [row["id"] for row in rows]
+    assert ids == sorted(ids)
+    assert email in {row["email"] for row in rows}